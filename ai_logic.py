@@ -1,31 +1,185 @@
 import random
-from cache_manager import TranspositionTable
+import time
+from bitboard import Bitboard, MACAN, MANUSIA, iter_bits, popcount
+from board_topology import get_topology
+from cache_manager import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from evaluation_tables import game_phase, get_evaluation_tables
+from move_ordering import MoveOrderer
+from opening_book import book_key, get_opening_book, in_opening
+from symmetry import get_board_symmetry
+from tablebase import get_tablebases
+
+class SearchTimeout(Exception):
+    """Dilempar di dalam pencarian saat batas waktu per gerakan habis."""
+
+
+class SearchCancelled(Exception):
+    """Dilempar saat pencarian dibatalkan dari luar (misalnya restart permainan)."""
+
 
 class MacananAI:
-    def __init__(self, game_logic):
+    MAX_SEARCH_DEPTH = 32  # Batas kedalaman iterative deepening jika memakai batas waktu
+    TIME_CHECK_INTERVAL = 512  # Cek jam setiap sekian node
+    WIN_SCORE = 1000000  # Skor menang di pencarian; dikurangi ply agar menang cepat lebih disukai
+    WIN_THRESHOLD = WIN_SCORE - 1000  # Skor di atas ini berarti hasil menang/kalah pasti
+    ASPIRATION_WINDOW = 50  # Lebar jendela di sekitar skor iterasi sebelumnya
+    NULL_WINDOW = 0.01  # Lebih kecil dari selisih skor evaluasi terkecil (0.4)
+
+    def __init__(self, game_logic, time_limit_ms=None, workers=1):
         self.game_logic = game_logic
+        # Batas waktu per gerakan; None berarti kedalaman tetap MAX_DEPTH
+        self.time_limit_ms = time_limit_ms
+        # Jumlah proses untuk membagi gerakan akar (lihat parallel_search)
+        self.workers = workers
+        self._parallel = None
+        if workers > 1:
+            # Pool dibuat di sini (thread pemanggil, biasanya thread utama), bukan di thread AI
+            self._get_parallel().start()
+        self.topology = get_topology(game_logic.positions)
+        self.board = Bitboard.from_state(game_logic)  # State pencarian dalam bentuk bitboard
+        self.symmetry = get_board_symmetry(self.topology)
+        # Suku evaluasi yang bergantung pada letak node mungkin tidak simetris (EVAL_CENTER)
+        tables = get_evaluation_tables(self.topology)
+        self._symmetric_center = self.symmetry.is_invariant(tables.center)
+        self._symmetric_strategic = self.symmetry.preserves_pairs(tables.strategic)
+        self.mirror_evaluation = {True: False, False: False}  # Per sudut pandang (is_macan)
         self.MAX_DEPTH = 3
         self.transposition_table = TranspositionTable()
+        self.move_orderer = MoveOrderer()  # Killer move & history heuristic
+        self.opening_book = get_opening_book()  # None jika file buku tidak ada
+        self.tablebases = get_tablebases(self.topology)  # Kosong jika belum ada file tablebase
         self.game_phase = "early"  # early, mid, late
         self.move_history = []
+        self.nodes = 0  # Jumlah node yang dikunjungi pada pencarian terakhir
+        self.completed_depth = 0  # Kedalaman iterasi terakhir yang selesai
+        self._deadline = None
+        self.stop_event = None  # threading.Event opsional untuk membatalkan pencarian
+
+    def reset(self):
+        """Mulai sesi baru: kosongkan tabel pencarian dan riwayat (dipanggil saat restart)."""
+        self.transposition_table.clear()
+        self.move_orderer.clear()
+        self.move_history = []
+        self.MAX_DEPTH = 3
+        self.game_phase = "early"
+        if self._parallel is not None:
+            self._parallel.table_counters = dict.fromkeys(self._parallel.table_counters, 0)
+
+    def table_stats(self):
+        """Statistik transposition table; dengan workers > 1 termasuk tabel semua worker."""
+        stats = self.transposition_table.stats()
+        if self._parallel is not None:
+            for name, count in self._parallel.table_counters.items():
+                stats[name] += count
+            probes = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = stats["hits"] / probes if probes else 0.0
+        return stats
+
+    def close(self):
+        """Akhiri sesi: hentikan pool proses pencarian paralel jika ada."""
+        if self._parallel is not None:
+            self._parallel.shutdown()
+            self._parallel = None
+
+    def new_search(self):
+        """Persiapan sebelum mencari gerakan baru; tabel dari giliran sebelumnya dipertahankan."""
+        self.update_game_phase()
+        self._update_mirror_evaluation()
+        self.transposition_table.new_generation()
+        self.move_orderer.new_search()
+
+    def choose_move(self, is_macan, state=None, stop_event=None):
+        """Pilih gerakan AI untuk giliran saat ini dan catat ke move_history.
+
+        state adalah posisi yang dianalisis (default game_logic); worker thread
+        memberikan salinan BoardState agar GUI tetap bebas mengubah state aslinya.
+        Jika stop_event di-set selama pencarian, SearchCancelled dilempar.
+        """
+        if state is not None:
+            self.game_logic = state
+        self.stop_event = stop_event
+        self.new_search()
+
+        # Di fase pembukaan, jawab langsung dari buku jika posisinya ada
+        best_move = self.get_book_move(is_macan)
+        if best_move is None:
+            # Jika manusia sudah pernah mencapai 8, harus bergerak
+            if not is_macan and self.game_logic._reached_max_manusia:
+                best_move = self.get_movement_move(False)
+            else:
+                best_move = self.get_best_move(is_macan)
 
-    def get_position_hash(self):
-        """Generate hash unik untuk posisi saat ini."""
-        macan_pos = str(sorted(self.game_logic.macan_piece))  # Sort untuk konsistensi
-        manusia_pos = str(sorted(self.game_logic.manusia_pieces))
-        return hash(macan_pos + manusia_pos)
+        if best_move:
+            self.move_history.append((best_move, self.game_phase))
+            self.analyze_last_moves()
+        return best_move
+
+    def get_book_move(self, is_macan, state=None):
+        """Gerakan dari buku pembukaan untuk posisi game_logic (tuple piksel), atau None."""
+        if self.opening_book is None:
+            return None
+        if state is not None:
+            self.game_logic = state
+        board = self.load_board()
+        side = MACAN if is_macan else MANUSIA
+        if board.side != side or not in_opening(board):
+            return None
+        key, symmetry = book_key(board)
+        entry = self.opening_book.probe(key)
+        if entry is None:
+            return None
+        move = self.symmetry.transform_move(entry[0], self.symmetry.inverse[symmetry])
+        if move not in board.legal_moves(side):
+            return None
+        return self._to_pixel_move(move)
+
+    def load_board(self):
+        """Salin posisi game_logic ke bitboard pencarian."""
+        self.board = Bitboard.from_state(self.game_logic)
+        return self.board
+
+    def _to_pixel_move(self, move):
+        """Ubah gerakan indeks (from, to) menjadi tuple piksel untuk GUI."""
+        from_index, to_index = move
+        positions = self.topology.positions
+        return (positions[from_index] if from_index is not None else None, positions[to_index])
+
+    def _macan_positions(self):
+        positions = self.topology.positions
+        return [positions[i] for i in iter_bits(self.board.macan)]
+
+    def get_table_key(self, is_macan=True):
+        """(kunci transposition table, indeks simetri) untuk posisi saat ini.
+
+        Jika evaluasi fase dan sudut pandang ini simetris, posisi dan cerminnya berbagi
+        kunci kanonik; gerakan di entri tabel disimpan dalam bingkai kanonik tersebut.
+        """
+        if self.mirror_evaluation[is_macan]:
+            h, symmetry = self.board.canonical_key()
+        else:
+            h, symmetry = self.board.hash, 0
+        keys = self.board.keys
+        h ^= keys.phase[self.game_phase]
+        if not is_macan:
+            h ^= keys.perspective
+        return h, symmetry
+
+    def get_position_hash(self, is_macan=True):
+        """Hash Zobrist posisi saat ini, ditambah sudut pandang evaluasi dan fase permainan."""
+        return self.get_table_key(is_macan)[0]
+
+    def _update_mirror_evaluation(self):
+        """Tentukan per sudut pandang apakah evaluasi fase ini sama untuk posisi dan cerminnya."""
+        if self.symmetry.count < 2:
+            return
+        self.mirror_evaluation = {
+            True: self.game_phase != "early" or self._symmetric_center,  # Kontrol pusat macan
+            False: self.game_phase != "mid" or self._symmetric_strategic,  # Pengepungan strategis
+        }
 
     def update_game_phase(self):
         """Update fase permainan berdasarkan kondisi saat ini."""
-        turn_count = self.game_logic.turn_count
-        pieces_left = len(self.game_logic.manusia_pieces)
-        
-        if turn_count < 10:
-            self.game_phase = "early"
-        elif turn_count < 20 and pieces_left > 5:
-            self.game_phase = "mid"
-        else:
-            self.game_phase = "late"
+        self.game_phase = game_phase(self.game_logic.turn_count, len(self.game_logic.manusia_pieces))
 
     def get_best_move(self, is_macan):
         """Mendapatkan gerakan terbaik."""
@@ -40,31 +194,165 @@ class MacananAI:
             return None
 
         # Fase pergerakan
+        self.load_board()
         possible_moves = self.get_all_possible_moves(is_macan)
         if not possible_moves:
             return None
 
         # Jika manusia masih dalam fase penempatan
         if not is_macan and len(self.game_logic.manusia_pieces) < 8:
-            best_pos = self._get_strategic_placement([move[1] for move in possible_moves], is_macan)
+            positions = self.topology.positions
+            best_pos = self._get_strategic_placement([positions[move[1]] for move in possible_moves], is_macan)
             return (None, best_pos)
 
         # Gunakan minimax untuk fase pergerakan
-        best_score = float('-inf')
+        return self._search_root(possible_moves, is_macan)
+
+    def _search_root(self, possible_moves, is_macan):
+        """Pilih gerakan akar terbaik; kembalikan dalam tuple piksel."""
+        # Endgame yang sudah terpecahkan: ambil gerakan sempurna dari tablebase
+        best_move = self.get_tablebase_move(possible_moves, is_macan)
+        if best_move is not None:
+            return self._to_pixel_move(best_move)
+        if self.workers > 1:
+            best_move = self._get_parallel().search(self, possible_moves, is_macan)
+        else:
+            iterations = self.search_root_moves(possible_moves, is_macan)
+            best_move = iterations[-1][1]
+        return self._to_pixel_move(best_move)
+
+    def _get_parallel(self):
+        if self._parallel is None:
+            from parallel_search import RootParallelSearch
+            self._parallel = RootParallelSearch(self.workers)
+        return self._parallel
+
+    def probe_tablebase(self, ply=0):
+        """Skor pasti posisi bitboard dari tablebase (sudut pandang pihak yang jalan), atau None."""
+        if not self.tablebases:
+            return None
+        result = self.tablebases.probe(self.board)
+        if result is None:
+            return None
+        is_win, distance = result
+        value = self.WIN_SCORE - ply - distance
+        return value if is_win else -value
+
+    def get_tablebase_move(self, root_moves, is_macan):
+        """Gerakan terbaik (indeks) menurut tablebase jika posisi akar sudah pasti, atau None.
+
+        Posisi menang memilih jalan tercepat ke kemenangan, posisi kalah menunda kekalahan.
+        """
+        if self.probe_tablebase() is None:
+            return None
         best_move = None
-        
-        for move in possible_moves:
-            old_state = self.save_game_state()
-            self.make_move(move, is_macan)
-            score = self.minimax(self.MAX_DEPTH - 1, False, is_macan, float('-inf'), float('inf'))
-            self.restore_game_state(old_state)
-            
+        best_score = float('-inf')
+        for move in root_moves:
+            undo = self.make_move(move, is_macan)
+            winner = self.board.winner()
+            if winner is not None:
+                score = self.WIN_SCORE - 1
+                if (winner == "Macan") != is_macan:
+                    score = -score
+            else:
+                score = self.probe_tablebase(1)
+                score = float('-inf') if score is None else -score
+            self.unmake_move(undo)
             if score > best_score:
                 best_score = score
                 best_move = move
-
         return best_move
 
+    def search_root_moves(self, root_moves, is_macan):
+        """Iterative deepening di akar atas root_moves (dalam indeks).
+
+        Dengan time_limit_ms, pencarian diperdalam sampai waktu habis. Tanpa batas
+        waktu, pencarian berhenti di MAX_DEPTH. Mengembalikan list
+        (depth, gerakan terbaik, skor terbaik) untuk setiap iterasi yang selesai.
+        """
+        if self.time_limit_ms is None:
+            max_depth = self.MAX_DEPTH
+            deadline = None
+        else:
+            max_depth = self.MAX_SEARCH_DEPTH
+            deadline = time.perf_counter() + self.time_limit_ms / 1000.0
+
+        self.nodes = 0
+        self.completed_depth = 0
+        self._deadline = None  # Iterasi pertama selalu diselesaikan
+        root_moves = list(root_moves)
+        iterations = []
+
+        for depth in range(1, max_depth + 1):
+            try:
+                scores = self._aspiration_search(root_moves, is_macan, depth, iterations)
+            except SearchTimeout:
+                self.load_board()  # Pencarian terputus di tengah; pulihkan posisi akar
+                break
+            self.completed_depth = depth
+            self._deadline = deadline
+
+            # Urutkan gerakan akar dari hasil iterasi ini; gerakan PV dicoba pertama
+            root_moves.sort(key=lambda move: scores.get(move, float('-inf')), reverse=True)
+            best_move = root_moves[0]
+            best_score = scores[best_move]
+            iterations.append((depth, best_move, best_score))
+
+            if abs(best_score) >= self.WIN_THRESHOLD:
+                break  # Hasil sudah pasti, tidak perlu lebih dalam
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        self._deadline = None
+        return iterations
+
+    def _aspiration_search(self, root_moves, is_macan, depth, iterations):
+        """Cari satu kedalaman dengan jendela sempit di sekitar skor iterasi sebelumnya.
+
+        Jika skor jatuh di luar jendela, sisi yang gagal dibuka penuh lalu dicari ulang.
+        """
+        alpha, beta = float('-inf'), float('inf')
+        if iterations and abs(iterations[-1][2]) < self.WIN_THRESHOLD:
+            previous = iterations[-1][2]
+            alpha, beta = previous - self.ASPIRATION_WINDOW, previous + self.ASPIRATION_WINDOW
+
+        while True:
+            scores = self._search_depth(root_moves, is_macan, depth, alpha, beta)
+            best_score = max(scores.values())
+            if best_score <= alpha and alpha != float('-inf'):
+                alpha = float('-inf')
+            elif best_score >= beta and beta != float('inf'):
+                beta = float('inf')
+            else:
+                return scores
+
+    def _search_depth(self, root_moves, is_macan, depth, alpha=float('-inf'), beta=float('inf')):
+        """Satu iterasi PVS di akar: gerakan pertama dengan jendela penuh, sisanya null window.
+
+        Skor gerakan selain yang terbaik hanya batas atas; cukup untuk mengurutkan akar.
+        """
+        scores = {}
+        best_score = float('-inf')
+        
+        for i, move in enumerate(root_moves):
+            undo = self.make_move(move, is_macan)
+            if i == 0:
+                score = -self.negamax(depth - 1, -beta, -alpha, not is_macan, is_macan)
+            else:
+                score = -self.negamax(depth - 1, -alpha - self.NULL_WINDOW, -alpha, not is_macan, is_macan)
+                if alpha < score < beta:
+                    score = -self.negamax(depth - 1, -beta, -alpha, not is_macan, is_macan)
+            self.unmake_move(undo)
+            scores[move] = score
+            if score > best_score:
+                best_score = score
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+            
+        return scores
+
     def _get_strategic_placement(self, available_positions, is_macan):
         """Pilih posisi strategis untuk penempatan pion."""
         # Filter posisi yang hanya dalam kotak 5x5
@@ -111,18 +399,19 @@ class MacananAI:
         score = 0
         
         # Kondisi menang/kalah
-        if len(self.game_logic.manusia_pieces) <= 3:
+        winner = self.board.winner()
+        if winner == "Macan":
             return float('inf')  # Macan menang
-        if self.game_logic.is_macan_trapped():
+        if winner == "Manusia":
             return float('-inf')  # Macan kalah
+        manusia_count = popcount(self.board.manusia)
         
         # Evaluasi berdasarkan fase permainan
         if self.game_phase == "early":
-            # Fokus pada kontrol pusat dan mobilitas
-            for macan in self.game_logic.macan_piece:
-                center_control = self._evaluate_center_control(macan)
-                mobility = len(self.game_logic.get_valid_moveable_positions(macan))
-                score += (center_control * 40) + (mobility * 15)
+            # Fokus pada kontrol pusat (akumulator bitboard, x100) dan mobilitas
+            score += self.board.center * 40 / 100
+            for macan in iter_bits(self.board.macan):
+                score += len(self.board.piece_moves(macan)) * 15
                 
         elif self.game_phase == "mid":
             # Fokus pada memakan pion manusia
@@ -131,11 +420,11 @@ class MacananAI:
             
         else:  # late game
             # Fokus pada menang
-            if len(self.game_logic.manusia_pieces) <= 4:
+            if manusia_count <= 4:
                 score += 500
         
         # Tambahan evaluasi umum
-        score += 100 - (len(self.game_logic.manusia_pieces) * 10)  # Semakin sedikit manusia semakin bagus
+        score += 100 - (manusia_count * 10)  # Semakin sedikit manusia semakin bagus
         
         return score
 
@@ -144,10 +433,12 @@ class MacananAI:
         score = 0
         
         # Kondisi menang/kalah
-        if self.game_logic.is_macan_trapped():
+        winner = self.board.winner()
+        if winner == "Manusia":
             return float('inf')  # Manusia menang
-        if len(self.game_logic.manusia_pieces) <= 3:
+        if winner == "Macan":
             return float('-inf')  # Manusia kalah
+        manusia_count = popcount(self.board.manusia)
         
         # Evaluasi berdasarkan fase permainan
         if self.game_phase == "early":
@@ -162,75 +453,32 @@ class MacananAI:
             
         else:  # late game
             # Fokus pada bertahan
-            if len(self.game_logic.manusia_pieces) >= 6:
+            if manusia_count >= 6:
                 score += 300
         
         # Tambahan evaluasi umum
-        score += len(self.game_logic.manusia_pieces) * 50  # Semakin banyak manusia semakin bagus
+        score += manusia_count * 50  # Semakin banyak manusia semakin bagus
         
-        # Evaluasi jarak aman dari semua macan
-        safe_distance_score = 0
-        for piece in self.game_logic.manusia_pieces:
-            for macan in self.game_logic.macan_piece:
-                dist = self._manhattan_distance(piece, macan)
-                if dist < 2:  # Terlalu dekat dengan macan
-                    safe_distance_score -= 30
-                elif 2 <= dist <= 3:  # Jarak ideal untuk pengepungan
-                    safe_distance_score += 20
-                else:  # Terlalu jauh untuk pengepungan efektif
-                    safe_distance_score -= 10
-        score += safe_distance_score
+        # Evaluasi jarak aman dari semua macan: terlalu dekat -30, ideal +20,
+        # terlalu jauh -10 per pasangan (akumulator bitboard)
+        score += self.board.band
         
         return score
 
-    def _evaluate_center_control(self, pos):
-        """Evaluasi kontrol pusat papan."""
-        center_x, center_y = 250, 250  # Sesuaikan dengan ukuran papan
-        distance_to_center = self._manhattan_distance(pos, (center_x, center_y))
-        return max(0, 100 - distance_to_center) / 100
-
     def _evaluate_manusia_formation(self):
         """Evaluasi kekuatan formasi pion manusia."""
-        formation_score = 0
-        manusia_pieces = self.game_logic.manusia_pieces
-        
-        # Hitung jarak antar pion manusia
-        for i, piece1 in enumerate(manusia_pieces):
-            connected_pieces = 0
-            for j, piece2 in enumerate(manusia_pieces):
-                if i != j:
-                    dist = self._manhattan_distance(piece1, piece2)
-                    if dist <= 50:  # Pion terhubung
-                        connected_pieces += 1
-            formation_score += connected_pieces
-        
-        return formation_score
+        # Jumlah pion terhubung (jarak <= 50) untuk setiap pion, dijaga bitboard
+        return self.board.links
 
     def _evaluate_surrounding_macan(self):
         """Evaluasi seberapa baik pion manusia mengepung macan."""
-        surrounding_score = 0
-        
-        for macan_pos in self.game_logic.macan_piece:
-            # Cek pion manusia di sekitar macan
-            for piece in self.game_logic.manusia_pieces:
-                dist = self._manhattan_distance(piece, macan_pos)
-                if dist <= 50:  # Dalam jarak pengepungan
-                    surrounding_score += 1
-                    
-                # Bonus untuk posisi strategis
-                if self._is_strategic_position(piece, macan_pos):
-                    surrounding_score += 2
-                    
-        return surrounding_score
+        # Pion dalam jarak pengepungan +1, posisi strategis (EvaluationTables.strategic) +2
+        return self.board.surround + 2 * self.board.strategic
 
     def _count_potential_victims(self):
         """Hitung jumlah pion manusia yang berpotensi dimakan."""
-        count = 0
-        for macan in self.game_logic.macan_piece:
-            for piece in self.game_logic.manusia_pieces:
-                if self._can_eat_piece(macan, piece):
-                    count += 1
-        return count
+        # Setiap pasangan (macan, manusia) dihitung sekali; diambil dari peta ancaman bitboard
+        return len({(from_index, over) for from_index, _, over in self.board.capture_moves()})
 
     def analyze_last_moves(self, num_moves=5):
         """Analisis gerakan terakhir untuk pembelajaran."""
@@ -250,355 +498,217 @@ class MacananAI:
         else:
             self.MAX_DEPTH = 3 
 
-    def get_sorted_moves(self, is_macan):
-        """Dapatkan dan urutkan gerakan berdasarkan potensi."""
+    def get_sorted_moves(self, is_macan, ply=0, hash_move=None):
+        """Dapatkan semua gerakan, diurutkan: makan, hash move, killer move, lalu history."""
+        side = MACAN if is_macan else MANUSIA
         moves = self.get_all_possible_moves(is_macan)
-        
-        # Evaluasi cepat untuk setiap gerakan
-        move_scores = []
-        for move in moves:
-            score = self._quick_evaluate_move(move, is_macan)
-            move_scores.append((score, move))
-        
-        # Urutkan gerakan berdasarkan skor
-        move_scores.sort(reverse=True)
-        return [move for score, move in move_scores]
+        return self.move_orderer.order(self.board, moves, side, ply, hash_move)
 
     def _quick_evaluate_move(self, move, is_macan):
         """Evaluasi cepat untuk satu gerakan."""
-        from_pos, to_pos = move
+        from_index, to_index = move
+        to_pos = self.topology.positions[to_index]
         score = 0
         
         if is_macan:
             # Prioritaskan gerakan makan
-            for piece in self.game_logic.manusia_pieces:
-                if self._can_eat_piece(from_pos, piece):
-                    score += 1000
+            if from_index is not None:
+                score += len(self.board.captures_from(from_index)) * 1000
             # Prioritaskan gerakan ke pusat
             score -= self._manhattan_distance(to_pos, (250, 250)) * 0.1
         else:
             # Untuk manusia, prioritaskan gerakan yang menjauh dari semua macan
-            for macan in self.game_logic.macan_piece:  # Iterasi semua macan
+            for macan in self._macan_positions():  # Iterasi semua macan
                 dist = self._manhattan_distance(to_pos, macan)
                 score += dist * 0.5 if dist > 2 else -dist
         
         return score
 
-    def minimax(self, depth, is_maximizing, is_macan, alpha, beta):
-        """Implementasi algoritma minimax dengan alpha-beta pruning."""
-        if depth == 0 or self.game_logic.game_over:
-            return self.evaluate_position(is_macan)
-
-        if is_maximizing:
-            max_eval = float('-inf')
-            for move in self.get_sorted_moves(is_macan)[:5]:
-                old_state = self.save_game_state()
-                self.make_move(move, is_macan)
-                eval = self.minimax(depth - 1, False, is_macan, alpha, beta)
-                self.restore_game_state(old_state)
-                max_eval = max(max_eval, eval)
-                alpha = max(alpha, eval)
-                if beta <= alpha:
-                    break
-            return max_eval
+    def _check_limits(self):
+        """Hentikan pencarian jika dibatalkan atau batas waktu habis."""
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise SearchCancelled()
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchTimeout()
+
+    def _score_to_table(self, value, ply):
+        """Skor menang/kalah disimpan relatif terhadap node, bukan terhadap akar."""
+        if value >= self.WIN_THRESHOLD:
+            return value + ply
+        if value <= -self.WIN_THRESHOLD:
+            return value - ply
+        return value
+
+    def _score_from_table(self, value, ply):
+        if value >= self.WIN_THRESHOLD:
+            return value - ply
+        if value <= -self.WIN_THRESHOLD:
+            return value + ply
+        return value
+
+    def negamax(self, depth, alpha, beta, side_is_macan, is_macan, ply=1):
+        """Negamax dengan principal variation search, alpha-beta dan transposition table.
+
+        Skor dilihat dari pihak yang sedang jalan (side_is_macan); evaluasi tetap memakai
+        sudut pandang AI (is_macan) dan dibalik tandanya di giliran lawan.
+        ply adalah jarak dari akar, dipakai untuk killer move dan jarak menang.
+        """
+        self.nodes += 1
+        if self.nodes % self.TIME_CHECK_INTERVAL == 0:
+            self._check_limits()
+
+        alpha_orig = alpha
+        position_hash, symmetry = self.get_table_key(is_macan)
+
+        # Cek transposition table: pakai nilai jika dicari cukup dalam
+        hash_move = None
+        entry = self.transposition_table.lookup(position_hash)
+        if entry is not None:
+            entry_depth, value, hash_move, flag, _ = entry
+            if symmetry and hash_move is not None:
+                hash_move = self.symmetry.transform_move(hash_move, self.symmetry.inverse[symmetry])
+            if entry_depth >= depth:
+                value = self._score_from_table(value, ply)
+                if flag == EXACT:
+                    return value
+                if flag == LOWER_BOUND:
+                    alpha = max(alpha, value)
+                elif flag == UPPER_BOUND:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        winner = self.board.winner()
+        if winner is not None:
+            value = self.WIN_SCORE - ply
+            if (winner == "Macan") != side_is_macan:
+                value = -value
+            self.transposition_table.store(position_hash, depth, self._score_to_table(value, ply), None, EXACT)
+            return value
+        value = self.probe_tablebase(ply)
+        if value is not None:
+            # Hasil tablebase pasti di kedalaman berapa pun
+            self.transposition_table.store(position_hash, self.MAX_SEARCH_DEPTH,
+                                           self._score_to_table(value, ply), None, EXACT)
+            return value
+        if depth == 0:
+            # Jangan berhenti di tengah rangkaian makan: lanjutkan dengan quiescence
+            value = self.quiescence(alpha, beta, side_is_macan, is_macan, ply)
+            if value <= alpha_orig:
+                flag = UPPER_BOUND
+            elif value >= beta:
+                flag = LOWER_BOUND
+            else:
+                flag = EXACT
+            self.transposition_table.store(position_hash, depth, self._score_to_table(value, ply), None, flag)
+            return value
+
+        side = MACAN if side_is_macan else MANUSIA
+        moves = self.get_sorted_moves(side_is_macan, ply, hash_move)
+        if not moves:  # Tidak ada gerakan legal: pihak yang jalan kalah
+            value = -(self.WIN_SCORE - ply)
+            self.transposition_table.store(position_hash, depth, self._score_to_table(value, ply), None, EXACT)
+            return value
+
+        best_eval = float('-inf')
+        best_move = None
+        for i, move in enumerate(moves):
+            undo = self.make_move(move, side_is_macan)
+            if i == 0:
+                eval = -self.negamax(depth - 1, -beta, -alpha, not side_is_macan, is_macan, ply + 1)
+            else:
+                # Null window: cukup buktikan gerakan ini tidak lebih baik dari alpha
+                eval = -self.negamax(depth - 1, -alpha - self.NULL_WINDOW, -alpha,
+                                     not side_is_macan, is_macan, ply + 1)
+                if alpha < eval < beta:
+                    eval = -self.negamax(depth - 1, -beta, -alpha, not side_is_macan, is_macan, ply + 1)
+            self.unmake_move(undo)
+            if eval > best_eval:
+                best_eval = eval
+                best_move = move
+            if eval > alpha:
+                alpha = eval
+            if alpha >= beta:
+                self.move_orderer.record_cutoff(self.board, move, side, ply, depth)
+                break
+
+        if best_eval <= alpha_orig:
+            flag = UPPER_BOUND
+        elif best_eval >= beta:
+            flag = LOWER_BOUND
         else:
-            min_eval = float('inf')
-            for move in self.get_sorted_moves(not is_macan)[:5]:
-                old_state = self.save_game_state()
-                self.make_move(move, not is_macan)
-                eval = self.minimax(depth - 1, True, is_macan, alpha, beta)
-                self.restore_game_state(old_state)
-                min_eval = min(min_eval, eval)
-                beta = min(beta, eval)
-                if beta <= alpha:
-                    break
-            return min_eval
+            flag = EXACT
+        if symmetry:
+            best_move = self.symmetry.transform_move(best_move, symmetry)
+        self.transposition_table.store(position_hash, depth, self._score_to_table(best_eval, ply),
+                                       best_move, flag)
+        return best_eval
+
+    def quiescence(self, alpha, beta, side_is_macan, is_macan, ply):
+        """Perpanjangan di bawah horizon yang hanya mencoba lompatan makan macan.
+
+        Pihak yang jalan boleh "diam" (stand pat) dengan skor evaluasi statis; giliran
+        manusia dan fase penempatan tidak punya gerakan makan sehingga langsung stand pat.
+        """
+        self.nodes += 1
+        if self.nodes % self.TIME_CHECK_INTERVAL == 0:
+            self._check_limits()
+
+        winner = self.board.winner()
+        if winner is not None:
+            value = self.WIN_SCORE - ply
+            return value if (winner == "Macan") == side_is_macan else -value
+
+        stand_pat = self.evaluate_position(is_macan)
+        if side_is_macan != is_macan:
+            stand_pat = -stand_pat
+        if not side_is_macan or self.board.is_placement_turn(MACAN):
+            return stand_pat
+        if stand_pat >= beta:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+
+        best_eval = stand_pat
+        for from_index, landing, _ in self.board.capture_moves():
+            undo = self.make_move((from_index, landing), True)
+            eval = -self.quiescence(-beta, -alpha, False, is_macan, ply + 1)
+            self.unmake_move(undo)
+            if eval > best_eval:
+                best_eval = eval
+            if eval > alpha:
+                alpha = eval
+            if alpha >= beta:
+                break
+        return best_eval
 
     def get_all_possible_moves(self, is_macan):
-        """Dapatkan semua gerakan yang mungkin."""
-        moves = []
-        
-        # Fase penempatan (turn <= 3)
-        if self.game_logic.turn_count <= 3:
-            # Hanya gunakan posisi dalam kotak 5x5 (indeks 0-24)
-            available_positions = [pos for pos in self.game_logic.positions[:25]
-                                 if pos not in self.game_logic.manusia_pieces 
-                                 and pos not in self.game_logic.macan_piece]
-            return [(None, pos) for pos in available_positions]
-        
-        # Fase pergerakan
-        if is_macan:
-            for piece in self.game_logic.macan_piece:
-                valid_moves = self.game_logic.get_valid_moveable_positions(piece)
-                moves.extend([(piece, move[0]) for move in valid_moves])
-        else:
-            if len(self.game_logic.manusia_pieces) < 8:
-                # Manusia masih dalam fase penempatan, hanya dalam kotak 5x5
-                for pos in self.game_logic.positions[:25]:  # Hanya posisi 0-24
-                    if (pos not in self.game_logic.manusia_pieces and 
-                        pos not in self.game_logic.macan_piece):
-                        moves.append((None, pos))
-            else:
-                # Manusia sudah bisa bergerak
-                for piece in self.game_logic.manusia_pieces:
-                    valid_moves = self.game_logic.get_valid_moveable_positions(piece)
-                    moves.extend([(piece, move[0]) for move in valid_moves])
-        
-        return moves
+        """Dapatkan semua gerakan yang mungkin sebagai (from_index, to_index)."""
+        return self.board.legal_moves(MACAN if is_macan else MANUSIA)
 
     def _manhattan_distance(self, pos1, pos2):
         """Hitung jarak Manhattan antara dua posisi."""
         return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
 
-    def _can_eat_piece(self, macan_pos, manusia_pos):
-        """Cek apakah macan bisa memakan pion manusia."""
-        valid_moves = self.game_logic.get_valid_moveable_positions(macan_pos)
-        for move in valid_moves:
-            if move[1] == manusia_pos:  # move[1] adalah pion yang dimakan
-                return True
-        return False
-
-    def save_game_state(self):
-        """Simpan state game saat ini."""
-        return {
-            'manusia_pieces': self.game_logic.manusia_pieces.copy(),
-            'macan_piece': self.game_logic.macan_piece.copy(),  # Gunakan copy() untuk list
-            'game_over': self.game_logic.game_over,
-            'winner': self.game_logic.winner
-        }
-
-    def restore_game_state(self, state):
-        """Kembalikan state game ke kondisi sebelumnya."""
-        self.game_logic.manusia_pieces = state['manusia_pieces'].copy()
-        self.game_logic.macan_piece = state['macan_piece'].copy()  # Gunakan copy() untuk list
-        self.game_logic.game_over = state['game_over']
-        self.game_logic.winner = state['winner']
-
     def make_move(self, move, is_macan):
-        """Buat gerakan untuk simulasi."""
-        from_pos, to_pos = move
-        
-        # Fase penempatan (from_pos adalah None)
-        if from_pos is None:
-            if is_macan:
-                self.game_logic.macan_piece.append(to_pos)
-            else:
-                self.game_logic.manusia_pieces.append(to_pos)
-            return
+        """Buat gerakan untuk simulasi; mengembalikan catatan undo untuk unmake_move.
 
-        # Fase pergerakan
-        if is_macan:
-            # Update posisi macan yang dipindahkan
-            macan_index = self.game_logic.macan_piece.index(from_pos)
-            self.game_logic.macan_piece[macan_index] = to_pos
-            
-            # Cek apakah ada manusia yang dimakan
-            dx = (to_pos[0] - from_pos[0]) // 2
-            dy = (to_pos[1] - from_pos[1]) // 2
-            eaten_pos = (from_pos[0] + dx, from_pos[1] + dy)
-            
-            if eaten_pos in self.game_logic.manusia_pieces:
-                self.game_logic.manusia_pieces.remove(eaten_pos)
-        else:
-            if from_pos in self.game_logic.manusia_pieces:  # Pastikan pion ada sebelum dihapus
-                self.game_logic.manusia_pieces.remove(from_pos)
-                self.game_logic.manusia_pieces.append(to_pos)
-
-    def _is_strategic_position(self, manusia_pos, macan_pos):
-        """Cek apakah posisi pion manusia strategis untuk pengepungan."""
-        # Hitung jarak dan arah relatif ke macan
-        dx = abs(manusia_pos[0] - macan_pos[0])
-        dy = abs(manusia_pos[1] - macan_pos[1])
-        
-        # Posisi strategis adalah:
-        # 1. Berada dalam jarak pengepungan ideal (2 langkah)
-        # 2. Membentuk formasi pengepungan dengan pion lain
-        # 3. Mengontrol jalur pelarian macan
-        
-        # Cek jarak pengepungan ideal
-        if dx == 2 or dy == 2:
-            # Cek apakah ada pion lain yang mendukung pengepungan
-            for piece in self.game_logic.manusia_pieces:
-                if piece != manusia_pos:
-                    other_dx = abs(piece[0] - macan_pos[0])
-                    other_dy = abs(piece[1] - macan_pos[1])
-                    
-                    # Pion lain juga dalam posisi pengepungan
-                    if (other_dx == 2 or other_dy == 2):
-                        # Pion berada di sisi berlawanan
-                        if (dx * other_dx == 0 and dy * other_dy == 0):
-                            return True
-                        # Pion membentuk sudut pengepungan
-                        if (dx != other_dx or dy != other_dy):
-                            return True
-        
-        # Cek posisi blocking jalur pelarian
-        elif dx == 1 or dy == 1:
-            # Hitung jumlah pion yang menghalangi jalur pelarian
-            blocking_pieces = 0
-            for piece in self.game_logic.manusia_pieces:
-                if piece != manusia_pos:
-                    if abs(piece[0] - macan_pos[0]) <= 2 and abs(piece[1] - macan_pos[1]) <= 2:
-                        blocking_pieces += 1
-            
-            # Posisi strategis jika ada cukup pion pendukung
-            if blocking_pieces >= 2:
-                return True
-        
-        # Cek kontrol area penting
-        center_x, center_y = 250, 250  # Pusat papan
-        if self._manhattan_distance(manusia_pos, (center_x, center_y)) <= 100:
-            nearby_pieces = 0
-            for piece in self.game_logic.manusia_pieces:
-                if piece != manusia_pos:
-                    if self._manhattan_distance(piece, manusia_pos) <= 50:
-                        nearby_pieces += 1
-            
-            # Posisi strategis jika mengontrol area penting dengan dukungan
-            if nearby_pieces >= 2:
-                return True
-        
-        return False 
+        Catatan undo berisi pion yang dipindah (asal & tujuan) dan pion yang dimakan,
+        sehingga tidak perlu menyalin seluruh state di setiap node pencarian.
+        Gerakan penempatan (from_pos None) juga didukung.
+        """
+        return self.board.make_move(move, MACAN if is_macan else MANUSIA)
 
+    def unmake_move(self, undo):
+        """Batalkan gerakan simulasi dalam O(1)."""
+        self.board.unmake_move(undo)
+        
     def get_movement_move(self, is_macan):
         """Mendapatkan gerakan untuk fase pergerakan saja."""
-        possible_moves = []
-        if is_macan:
-            for piece in self.game_logic.macan_piece:
-                valid_moves = self.game_logic.get_valid_moveable_positions(piece)
-                possible_moves.extend([(piece, move[0]) for move in valid_moves])
-        else:
-            for piece in self.game_logic.manusia_pieces:
-                valid_moves = self.game_logic.get_valid_moveable_positions(piece)
-                possible_moves.extend([(piece, move[0]) for move in valid_moves])
-
+        self.load_board()
+        possible_moves = self.board.movement_moves(MACAN if is_macan else MANUSIA)
         if not possible_moves:
             return None
 
         # Pilih gerakan terbaik menggunakan minimax
-        best_score = float('-inf')
-        best_move = None
-        for move in possible_moves:
-            old_state = self.save_game_state()
-            self.make_move(move, is_macan)
-            score = self.minimax(self.MAX_DEPTH - 1, False, is_macan, float('-inf'), float('inf'))
-            self.restore_game_state(old_state)
-            
-            if score > best_score:
-                best_score = score
-                best_move = move
-
-        return best_move 
-
-    def get_valid_moveable_positions(self, node):
-        """Mendapatkan semua posisi valid yang bisa dituju."""
-        if not node or node not in self.positions:
-            return []
-        
-        valid_moves = []
-        connected_nodes = []
-        node_index = self.positions.index(node)
-        
-        # Jika node berada di grid 5x5 (indeks 0-24)
-        if node_index < 25:
-            row = node_index // 5
-            col = node_index % 5
-            
-            # Cek orthogonal di grid
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                new_row, new_col = row + dx, col + dy
-                if 0 <= new_row < 5 and 0 <= new_col < 5:
-                    new_index = new_row * 5 + new_col
-                    connected_nodes.append(self.positions[new_index])
-            
-            # Cek diagonal jika ada
-            if self._has_diagonal_lines(row, col):
-                for dx, dy in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
-                    new_row, new_col = row + dx, col + dy
-                    if 0 <= new_row < 5 and 0 <= new_col < 5:
-                        new_index = new_row * 5 + new_col
-                        connected_nodes.append(self.positions[new_index])
-            
-            # Tambahkan koneksi ke segitiga hanya dari titik tengah
-            if col == 0 and row == 2:  # Titik tengah kolom kiri (index 10)
-                # Koneksi ke segitiga kiri
-                for triangle_node in self.positions[25:31]:
-                    dx = triangle_node[0] - node[0]
-                    dy = triangle_node[1] - node[1]
-                    distance = (dx ** 2 + dy ** 2) ** 0.5
-                    if distance <= 100:  # Threshold jarak koneksi
-                        connected_nodes.append(triangle_node)
-            
-            elif col == 4 and row == 2:  # Titik tengah kolom kanan (index 14)
-                # Koneksi ke segitiga kanan
-                for triangle_node in self.positions[31:]:
-                    dx = triangle_node[0] - node[0]
-                    dy = triangle_node[1] - node[1]
-                    distance = (dx ** 2 + dy ** 2) ** 0.5
-                    if distance <= 100:  # Threshold jarak koneksi
-                        connected_nodes.append(triangle_node)
-        
-        # Jika node berada di area segitiga (indeks 25+)
-        else:
-            # Koneksi dalam segitiga yang sama
-            if node_index < 31:  # Segitiga kiri
-                # Koneksi ke node segitiga lain di kiri
-                for triangle_node in self.positions[25:31]:
-                    if triangle_node != node:
-                        dx = triangle_node[0] - node[0]
-                        dy = triangle_node[1] - node[1]
-                        distance = (dx ** 2 + dy ** 2) ** 0.5
-                        if distance <= 100:
-                            connected_nodes.append(triangle_node)
-                
-                # Koneksi hanya ke titik tengah grid (index 10)
-                grid_node = self.positions[10]  # Titik tengah kolom kiri
-                dx = grid_node[0] - node[0]
-                dy = grid_node[1] - node[1]
-                distance = (dx ** 2 + dy ** 2) ** 0.5
-                if distance <= 100:
-                    connected_nodes.append(grid_node)
-            
-            else:  # Segitiga kanan
-                # Koneksi ke node segitiga lain di kanan
-                for triangle_node in self.positions[31:]:
-                    if triangle_node != node:
-                        dx = triangle_node[0] - node[0]
-                        dy = triangle_node[1] - node[1]
-                        distance = (dx ** 2 + dy ** 2) ** 0.5
-                        if distance <= 100:
-                            connected_nodes.append(triangle_node)
-                
-                # Koneksi hanya ke titik tengah grid (index 14)
-                grid_node = self.positions[14]  # Titik tengah kolom kanan
-                dx = grid_node[0] - node[0]
-                dy = grid_node[1] - node[1]
-                distance = (dx ** 2 + dy ** 2) ** 0.5
-                if distance <= 100:
-                    connected_nodes.append(grid_node)
-        
-        # Filter gerakan valid berdasarkan aturan permainan
-        for target_node in connected_nodes:
-            if target_node not in self.macan_piece:  # Tidak bisa ke posisi macan lain
-                if node in self.macan_piece:  # Logika untuk Macan
-                    if target_node not in self.manusia_pieces:
-                        valid_moves.append((target_node, None))
-                    else:  # Cek lompatan untuk makan
-                        dx = target_node[0] - node[0]
-                        dy = target_node[1] - node[1]
-                        jump_x = target_node[0] + dx
-                        jump_y = target_node[1] + dy
-                        
-                        # Cari node untuk lompatan
-                        for jump_node in self.positions:
-                            if (abs(jump_node[0] - jump_x) < 20 and 
-                                abs(jump_node[1] - jump_y) < 20 and
-                                jump_node not in self.manusia_pieces and
-                                jump_node not in self.macan_piece):
-                                valid_moves.append((jump_node, target_node))
-                
-                else:  # Logika untuk Manusia
-                    if target_node not in self.manusia_pieces:
-                        valid_moves.append((target_node, None))
-        
-        return valid_moves 
\ No newline at end of file
+        return self._search_root(possible_moves, is_macan)
+            
\ No newline at end of file
@@ -0,0 +1,75 @@
+import queue
+import threading
+import traceback
+
+from ai_logic import SearchCancelled
+
+
+class AIWorker:
+    """Menjalankan MacananAI.choose_move di thread terpisah agar loop Tkinter tidak macet.
+
+    Hasil dikirim lewat queue dan diambil GUI dengan poll() (misalnya dari canvas.after).
+    Setiap permintaan diberi token; hasil dari permintaan yang sudah dibatalkan dibuang.
+    """
+
+    JOIN_TIMEOUT = 1.0  # Detik menunggu thread lama berhenti setelah dibatalkan
+
+    def __init__(self, ai):
+        self.ai = ai
+        self.results = queue.Queue()
+        self._thread = None
+        self._stop_event = None
+        self._token = 0
+
+    def start(self, state, is_macan):
+        """Mulai mencari gerakan untuk salinan state; batalkan pencarian sebelumnya."""
+        self.cancel()
+        self._token += 1
+        token = self._token
+        stop_event = threading.Event()
+        snapshot = state.copy()  # GUI tetap boleh mengubah state asli
+
+        def run():
+            try:
+                move = self.ai.choose_move(is_macan, snapshot, stop_event)
+            except SearchCancelled:
+                return
+            except Exception:
+                traceback.print_exc()
+                move = None
+            if not stop_event.is_set():
+                self.results.put((token, move))
+
+        self._stop_event = stop_event
+        self._thread = threading.Thread(target=run, name="macanan-ai", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Batalkan pencarian yang sedang berjalan dan buang hasil yang belum diambil."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(self.JOIN_TIMEOUT)
+        self._thread = None
+        self._stop_event = None
+        self._token += 1
+        self._drain()
+
+    def poll(self):
+        """Kembalikan (True, gerakan) jika hasil sudah ada, atau (False, None) jika belum."""
+        while True:
+            try:
+                token, move = self.results.get_nowait()
+            except queue.Empty:
+                return False, None
+            if token == self._token:
+                self._thread = None
+                self._stop_event = None
+                return True, move
+
+    def _drain(self):
+        while True:
+            try:
+                self.results.get_nowait()
+            except queue.Empty:
+                return
@@ -0,0 +1,293 @@
+"""Evaluasi banyak posisi sekaligus, hasilnya sama dengan MacananAI.evaluate_position.
+
+Posisi dikodekan per baris sebagai (mask macan, mask manusia, max_manusia, turn_count).
+Dengan NumPy, bitmask diurai menjadi matriks 0/1 (posisi x node) dan setiap suku
+evaluasi menjadi perkalian dengan tabel antar node yang dihitung sekali dari matriks
+jarak dan ketetanggaan: kontrol pusat (vektor), formasi, pengepungan dan pita jarak
+(matriks node x node), serta mobilitas dan lompatan makan (indeks lompatan). Tanpa
+NumPy dipakai evaluasi bitmask murni Python dengan rumus yang sama.
+
+Dipakai untuk menilai seluruh posisi di file rekaman self-play (lihat game_record):
+    python selfplay.py --games 100 --depth 2 --record selfplay.rec
+    python batch_eval.py selfplay.rec
+"""
+import argparse
+import math
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional; evaluasi kembali ke bitmask murni Python
+    np = None
+
+from bitboard import iter_bits, popcount
+from board_state import BoardState
+from evaluation_tables import LINK_DISTANCE, game_phase, get_evaluation_tables
+from game_record import read_games, replay_boards
+
+INF = float('inf')
+PHASES = ("early", "mid", "late")
+
+
+def encode_positions(boards):
+    """Baris (macan, manusia, max_manusia, turn_count) untuk setiap Bitboard.
+
+    Array int64 (N, 4) jika NumPy tersedia, selain itu list tuple.
+    """
+    rows = [(board.macan, board.manusia, board.max_manusia, board.turn_count) for board in boards]
+    if np is None:
+        return rows
+    return np.array(rows, dtype=np.int64).reshape(-1, 4)
+
+
+def position_phases(positions):
+    """Fase evaluasi setiap baris positions, sama dengan MacananAI.update_game_phase."""
+    rows = positions.tolist() if np is not None and isinstance(positions, np.ndarray) else positions
+    return [game_phase(turn_count, popcount(manusia)) for _, manusia, _, turn_count in rows]
+
+
+class BatchEvaluator:
+    """Evaluasi posisi secara batch untuk satu topologi papan.
+
+    evaluate menerima satu fase untuk semua baris (seperti pencarian, yang memakai fase
+    posisi akar) atau satu fase per baris (seperti position_phases untuk rekaman).
+    """
+
+    def __init__(self, topology):
+        tables = get_evaluation_tables(topology)
+        size = topology.size
+        self.topology = topology
+        self.tables = tables
+        self.size = size
+
+        # Lompatan yang menambah target gerakan macan: pendaratan yang juga tetangga
+        # langsung sudah terhitung sebagai langkah (lihat Bitboard.piece_moves)
+        self.jumps = [(start, over, landing) for start in range(size)
+                      for over, landing in topology.jump_list[start]
+                      if landing not in topology.neighbors[start]]
+        # Lompatan makan sah, satu per pasangan (macan, dimakan) seperti Bitboard.capture_moves
+        self.captures = [(start, over, landing) for (start, landing), over in topology.jump_over.items()]
+        self.strategic = [(p, m, clauses) for (p, m), clauses in tables.strategic.items()]
+
+        if np is not None:
+            self._build_matrices()
+
+    def _build_matrices(self):
+        topology = self.topology
+        size = self.size
+        self.shifts = np.arange(size, dtype=np.int64)
+
+        # Matriks jarak Manhattan antar node; pasangan node yang sama tidak dihitung
+        points = np.array(topology.positions, dtype=np.int64)
+        distance = np.abs(points[:, None, :] - points[None, :, :]).sum(axis=2)
+        other = ~np.eye(size, dtype=bool)
+        self.center = np.array(self.tables.center, dtype=np.int64)
+        self.link = ((distance <= LINK_DISTANCE) & other).astype(np.int64)
+        # Pita jarak manusia-macan, sama dengan EvaluationTables.band_score
+        self.band = np.where(distance < 2, -30, np.where(distance <= 3, 20, -10)) * other
+
+        self.adjacency = np.zeros((size, size), dtype=np.int64)
+        for i in range(size):
+            self.adjacency[i, list(topology.neighbors[i])] = 1
+        self.jump_index = np.array(self.jumps, dtype=np.int64).reshape(-1, 3).T
+        self.capture_index = np.array(self.captures, dtype=np.int64).reshape(-1, 3).T
+
+        # Strategis: klausa (mask, ambang) sebagai baris matriks, dipetakan ke pasangan (p, m)
+        clauses = [(pair, mask, need)
+                   for pair, (_, _, entries) in enumerate(self.strategic)
+                   for mask, need in entries]
+        self.clause_masks = np.array([[(mask >> i) & 1 for i in range(size)] for _, mask, _ in clauses],
+                                     dtype=np.int64).reshape(-1, size)
+        self.clause_need = np.array([need for _, _, need in clauses], dtype=np.int64)
+        self.clause_pairs = np.zeros((len(clauses), len(self.strategic)), dtype=np.int64)
+        for row, (pair, _, _) in enumerate(clauses):
+            self.clause_pairs[row, pair] = 1
+        self.strategic_index = np.array([(p, m) for p, m, _ in self.strategic], dtype=np.int64).reshape(-1, 2).T
+
+    def evaluate(self, positions, phase, is_macan):
+        """List skor setiap baris positions (encode_positions) dari sudut pandang pihak AI."""
+        if isinstance(phase, str):
+            phases = [phase] * len(positions)
+        else:
+            phases = list(phase)
+        if np is None:
+            return [self._evaluate_row(row, row_phase, is_macan) for row, row_phase in zip(positions, phases)]
+        return self._evaluate_matrix(np.asarray(positions, dtype=np.int64).reshape(-1, 4), phases, is_macan)
+
+    def _bits(self, masks):
+        return (masks[:, None] >> self.shifts) & 1
+
+    def _evaluate_matrix(self, positions, phases, is_macan):
+        macan = self._bits(positions[:, 0])
+        manusia = self._bits(positions[:, 1])
+        empty = 1 - macan - manusia
+        manusia_count = manusia.sum(axis=1)
+        phases = np.array(phases)
+        early = phases == "early"
+        mid = phases == "mid"
+        late = ~(early | mid)
+
+        # Target gerakan semua macan: tetangga kosong ditambah lompatan ke node kosong
+        start, over, landing = self.jump_index
+        mobility = ((empty @ self.adjacency) * macan).sum(axis=1)
+        mobility += (macan[:, start] * manusia[:, over] * empty[:, landing]).sum(axis=1)
+        reached = positions[:, 2] >= 8
+        macan_wins = reached & (manusia_count <= 3)
+        manusia_wins = reached & ~macan_wins & (macan.any(axis=1)) & (mobility == 0)
+
+        score = np.zeros(len(positions), dtype=np.float64)
+        if is_macan:
+            if early.any():
+                center = macan @ self.center
+                score[early] = (center * 40 / 100 + mobility * 15)[early]
+            if mid.any():
+                start, over, landing = self.capture_index
+                victims = (macan[:, start] * manusia[:, over] * empty[:, landing]).sum(axis=1)
+                score[mid] = victims[mid] * 60
+            score[late & (manusia_count <= 4)] = 500
+            score += 100 - manusia_count * 10
+            win, loss = macan_wins, manusia_wins
+        else:
+            if early.any():
+                links = ((manusia @ self.link) * manusia).sum(axis=1)
+                score[early] = links[early] * 30
+            if mid.any():
+                surround = ((macan @ self.link) * manusia).sum(axis=1)
+                p, m = self.strategic_index
+                satisfied = (manusia @ self.clause_masks.T >= self.clause_need) @ self.clause_pairs > 0
+                strategic = (manusia[:, p] * macan[:, m] * satisfied).sum(axis=1)
+                score[mid] = (surround + 2 * strategic)[mid] * 50
+            score[late & (manusia_count >= 6)] = 300
+            score += manusia_count * 50 + ((macan @ self.band) * manusia).sum(axis=1)
+            win, loss = manusia_wins, macan_wins
+
+        score[win] = INF
+        score[loss] = -INF
+        return score.tolist()
+
+    def _evaluate_row(self, row, phase, is_macan):
+        macan, manusia, max_manusia, _ = row
+        topology = self.topology
+        tables = self.tables
+        empty = topology.full_mask & ~(macan | manusia)
+        manusia_count = popcount(manusia)
+
+        mobility = 0
+        for i in iter_bits(macan):
+            mobility += popcount(topology.neighbor_masks[i] & empty)
+        for start, over, landing in self.jumps:
+            if (macan >> start) & (manusia >> over) & (empty >> landing) & 1:
+                mobility += 1
+        winner = None
+        if max_manusia >= 8:
+            if manusia_count <= 3:
+                winner = "Macan"
+            elif macan and not mobility:
+                winner = "Manusia"
+
+        score = 0
+        if is_macan:
+            if winner is not None:
+                return INF if winner == "Macan" else -INF
+            if phase == "early":
+                score += sum(tables.center[i] for i in iter_bits(macan)) * 40 / 100
+                score += mobility * 15
+            elif phase == "mid":
+                victims = sum((macan >> start) & (manusia >> over) & (empty >> landing) & 1
+                              for start, over, landing in self.captures)
+                score += victims * 60
+            elif manusia_count <= 4:
+                score += 500
+            score += 100 - (manusia_count * 10)
+        else:
+            if winner is not None:
+                return INF if winner == "Manusia" else -INF
+            if phase == "early":
+                links = sum(popcount(tables.link_masks[i] & manusia) for i in iter_bits(manusia))
+                score += links * 30
+            elif phase == "mid":
+                surround = sum(popcount(tables.link_masks[i] & manusia) for i in iter_bits(macan))
+                score += (surround + 2 * tables.strategic_count(self.strategic, macan, manusia)) * 50
+            elif manusia_count >= 6:
+                score += 300
+            score += manusia_count * 50
+            score += sum(tables.band_score(i, macan) for i in iter_bits(manusia))
+        return score
+
+
+_evaluator_cache = {}
+
+
+def get_batch_evaluator(topology):
+    """BatchEvaluator untuk topologi ini (dibuat sekali per papan)."""
+    evaluator = _evaluator_cache.get(topology)
+    if evaluator is None:
+        evaluator = BatchEvaluator(topology)
+        _evaluator_cache[topology] = evaluator
+    return evaluator
+
+
+def record_positions(path, topology):
+    """Baris posisi (encode_positions) setelah setiap gerakan semua permainan di file rekaman."""
+    rows = []
+    for _, data in read_games(path):
+        rows.extend((board.macan, board.manusia, board.max_manusia, board.turn_count)
+                    for board in replay_boards(data, topology))
+    if np is None:
+        return rows
+    return np.array(rows, dtype=np.int64).reshape(-1, 4)
+
+
+def analyze_record(path, positions=None):
+    """Nilai setiap posisi di file rekaman dari kedua sisi; ringkasan per fase evaluasi."""
+    topology = BoardState(positions).topology
+    rows = record_positions(path, topology)
+    phases = position_phases(rows)
+    evaluator = get_batch_evaluator(topology)
+
+    start = time.perf_counter()
+    macan_scores = evaluator.evaluate(rows, phases, True)
+    manusia_scores = evaluator.evaluate(rows, phases, False)
+    elapsed = time.perf_counter() - start
+
+    summary = {
+        "positions": len(phases),
+        "backend": "numpy" if np is not None else "python",
+        "eval_ms": elapsed * 1000,
+        "phases": {},
+    }
+    for phase in PHASES:
+        selected = [i for i, row_phase in enumerate(phases) if row_phase == phase]
+        decided = [i for i in selected if math.isinf(macan_scores[i])]
+        open_positions = [i for i in selected if not math.isinf(macan_scores[i])]
+        summary["phases"][phase] = {
+            "positions": len(selected),
+            "decided": len(decided),
+            "macan_mean": _mean(macan_scores[i] for i in open_positions),
+            "manusia_mean": _mean(manusia_scores[i] for i in open_positions),
+        }
+    return summary
+
+
+def _mean(values):
+    values = list(values)
+    return sum(values) / len(values) if values else 0.0
+
+
+def print_analysis(summary):
+    print(f"Posisi         : {summary['positions']} "
+          f"({summary['eval_ms']:.1f} ms evaluasi batch, {summary['backend']})")
+    for phase, stats in summary["phases"].items():
+        print(f"Fase {phase:<10}: {stats['positions']} posisi, {stats['decided']} selesai, "
+              f"rata-rata Macan {stats['macan_mean']:.1f}, Manusia {stats['manusia_mean']:.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluasi batch semua posisi di file rekaman permainan.")
+    parser.add_argument("record", help="file rekaman (selfplay.py --record)")
+    args = parser.parse_args(argv)
+    print_analysis(analyze_record(args.record))
+
+
+if __name__ == "__main__":
+    main()
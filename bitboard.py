@@ -0,0 +1,421 @@
+from evaluation_tables import get_evaluation_tables
+from symmetry import MASK64, get_mirror_keys
+from zobrist import get_zobrist_keys
+
+MACAN = 0
+MANUSIA = 1
+
+
+def popcount(mask):
+    """Jumlah bit yang menyala pada mask."""
+    return bin(mask).count("1")
+
+
+if hasattr(int, "bit_count"):  # Python 3.10+: jauh lebih cepat dari bin().count
+    popcount = int.bit_count
+
+
+def iter_bits(mask):
+    """Indeks node untuk setiap bit yang menyala, dari indeks terkecil."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class Bitboard:
+    """State papan ringkas: dua bitmask 37-bit plus giliran dan penghitung penempatan.
+
+    Bit ke-i menyala jika node indeks i (urutan output draw_board) ditempati.
+    Gerakan ditulis sebagai (from_index, to_index); from_index None berarti penempatan.
+    Atribut hash adalah kunci Zobrist 64-bit yang diperbarui inkremental oleh make_move.
+    mirror_hash menyimpan hash posisi cermin (MirrorKeys, satu lajur 64-bit per simetri)
+    dengan cara yang sama, sehingga canonical_key tidak perlu mencerminkan papan.
+
+    Suku evaluasi MacananAI juga disimpan sebagai akumulator yang diperbarui per gerakan:
+    links (pasangan manusia terhubung, dihitung dua arah), surround (pasangan
+    manusia-macan berdekatan), band (skor jarak aman manusia-macan), center (kontrol
+    pusat macan, x100) dan strategic (pasangan pengepungan strategis).
+
+    Peta ancaman (lompatan makan per macan) di-cache di threats dan hanya entri macan
+    yang terkena perubahan yang dibuang oleh make_move.
+    """
+
+    __slots__ = ("topology", "keys", "mirror_keys", "tables", "macan", "manusia", "side", "turn_count",
+                 "max_manusia", "hash", "mirror_hash", "links", "surround", "band", "center", "strategic",
+                 "threats")
+
+    def __init__(self, topology, macan=0, manusia=0, side=MACAN, turn_count=0, max_manusia=0):
+        self.topology = topology
+        self.keys = get_zobrist_keys(topology.size)
+        self.mirror_keys = get_mirror_keys(self.keys, topology)
+        self.tables = get_evaluation_tables(topology)
+        self.macan = 0
+        self.manusia = 0
+        self.side = side  # Pihak yang sedang jalan
+        self.turn_count = turn_count
+        self.max_manusia = max_manusia  # Jumlah maksimal pion manusia yang pernah ada
+        self.hash = self.keys.hash_position(iter_bits(macan), iter_bits(manusia), side, max_manusia)
+        self.mirror_hash = self.mirror_keys.hash_position(iter_bits(macan), iter_bits(manusia), side, max_manusia)
+        self.links = self.surround = self.band = self.center = self.strategic = 0
+        self.threats = {}  # indeks macan -> tuple (landing, over) lompatan makan
+        for index in iter_bits(macan):
+            self._add_macan(index)
+        for index in iter_bits(manusia):
+            self._add_manusia(index)
+
+    @classmethod
+    def from_lists(cls, topology, macan_pieces, manusia_pieces, side=MACAN, turn_count=0, max_manusia=0):
+        """Bangun bitboard dari list tuple piksel seperti yang dipakai GameLogic."""
+        index_of = topology.index_of
+        macan = 0
+        for pos in macan_pieces:
+            macan |= 1 << index_of[pos]
+        manusia = 0
+        for pos in manusia_pieces:
+            manusia |= 1 << index_of[pos]
+        max_manusia = max(max_manusia, len(manusia_pieces))
+        return cls(topology, macan, manusia, side, turn_count, max_manusia)
+
+    @classmethod
+    def from_state(cls, state):
+        """Bangun bitboard dari BoardState (atau GameLogic yang meneruskan atributnya)."""
+        side = MACAN if state.current_player == "Macan" else MANUSIA
+        return cls.from_lists(
+            state.topology, state.macan_piece, state.manusia_pieces,
+            side, state.turn_count, state._max_manusia_count,
+        )
+
+    def to_lists(self):
+        """Kembalikan (macan_piece, manusia_pieces) sebagai list tuple piksel."""
+        positions = self.topology.positions
+        return ([positions[i] for i in iter_bits(self.macan)],
+                [positions[i] for i in iter_bits(self.manusia)])
+
+    def copy(self):
+        clone = Bitboard.__new__(Bitboard)
+        clone.topology = self.topology
+        clone.keys = self.keys
+        clone.mirror_keys = self.mirror_keys
+        clone.tables = self.tables
+        clone.restore(self.snapshot())
+        return clone
+
+    def snapshot(self):
+        """Tuple kecil berisi seluruh state, untuk disimpan lalu dipulihkan."""
+        return (self.macan, self.manusia, self.side, self.turn_count, self.max_manusia, self.hash,
+                self.mirror_hash, self.features())
+
+    def restore(self, snapshot):
+        (self.macan, self.manusia, self.side, self.turn_count, self.max_manusia, self.hash, self.mirror_hash,
+         features) = snapshot
+        self.links, self.surround, self.band, self.center, self.strategic = features
+        self.threats = {}
+
+    def features(self):
+        """Nilai akumulator evaluasi saat ini sebagai tuple."""
+        return (self.links, self.surround, self.band, self.center, self.strategic)
+
+    def _add_manusia(self, index):
+        tables = self.tables
+        macan = self.macan
+        manusia = self.manusia
+        self.links += 2 * popcount(tables.link_masks[index] & manusia)
+        self.surround += popcount(tables.link_masks[index] & macan)
+        self.band += tables.band_score(index, macan)
+        entries = tables.strategic_by_manusia[index]
+        if entries:
+            before = tables.strategic_count(entries, macan, manusia)
+            self.strategic += tables.strategic_count(entries, macan, manusia | (1 << index)) - before
+        self.manusia = manusia | (1 << index)
+
+    def _remove_manusia(self, index):
+        tables = self.tables
+        macan = self.macan
+        manusia = self.manusia ^ (1 << index)
+        self.links -= 2 * popcount(tables.link_masks[index] & manusia)
+        self.surround -= popcount(tables.link_masks[index] & macan)
+        self.band -= tables.band_score(index, macan)
+        entries = tables.strategic_by_manusia[index]
+        if entries:
+            before = tables.strategic_count(entries, macan, self.manusia)
+            self.strategic += tables.strategic_count(entries, macan, manusia) - before
+        self.manusia = manusia
+
+    def _add_macan(self, index):
+        tables = self.tables
+        manusia = self.manusia
+        self.surround += popcount(tables.link_masks[index] & manusia)
+        self.band += tables.band_score(index, manusia)
+        self.center += tables.center[index]
+        entries = tables.strategic_by_macan[index]
+        if entries:
+            self.strategic += tables.strategic_count(entries, 1 << index, manusia)
+        self.macan |= 1 << index
+
+    def _remove_macan(self, index):
+        tables = self.tables
+        manusia = self.manusia
+        self.surround -= popcount(tables.link_masks[index] & manusia)
+        self.band -= tables.band_score(index, manusia)
+        self.center -= tables.center[index]
+        entries = tables.strategic_by_macan[index]
+        if entries:
+            self.strategic -= tables.strategic_count(entries, 1 << index, manusia)
+        self.macan ^= 1 << index
+
+    def set_side(self, side):
+        """Paksa pihak yang jalan (hash ikut diperbarui)."""
+        if side != self.side:
+            self.side = side
+            self.hash ^= self.keys.side
+            self.mirror_hash ^= self.mirror_keys.side
+
+    def canonical_key(self):
+        """(hash terkecil di antara posisi ini dan cerminnya, indeks simetri yang menghasilkannya).
+
+        Gerakan posisi ini dipetakan ke bingkai kanonik dengan BoardSymmetry.transform_move
+        memakai indeks simetri tersebut.
+        """
+        key = self.hash
+        symmetry = 0
+        mirror = self.mirror_hash
+        for lane in range(self.mirror_keys.lanes):
+            h = (mirror >> (64 * lane)) & MASK64
+            if h < key:
+                key = h
+                symmetry = lane + 1
+        return key, symmetry
+
+    @property
+    def reached_max_manusia(self):
+        return self.max_manusia >= 8
+
+    def is_placement_turn(self, side=None):
+        """Apakah gerakan pihak side berupa penempatan pion."""
+        if side is None:
+            side = self.side
+        if self.turn_count <= 3:
+            return True
+        return side == MANUSIA and not self.reached_max_manusia
+
+    def placement_moves(self, side=None):
+        """Semua penempatan yang valid (hanya di kotak 5x5)."""
+        if side is None:
+            side = self.side
+        topology = self.topology
+        free = topology.grid_mask & ~(self.macan | self.manusia)
+        if side == MACAN:
+            if popcount(self.macan) >= 2:
+                return []
+            if self.macan:
+                first = self.macan.bit_length() - 1
+                free &= topology.far_placement_masks[first]
+        elif popcount(self.manusia) >= 8:
+            return []
+        return [(None, i) for i in iter_bits(free)]
+
+    def piece_moves(self, index):
+        """Gerakan dari node index sebagai list (target, dimakan) dalam indeks."""
+        topology = self.topology
+        macan = self.macan
+        manusia = self.manusia
+        empty = topology.full_mask & ~(macan | manusia)
+        moves = []
+        seen = 0
+
+        if macan & topology.bits[index]:
+            # Urutan sama dengan get_valid_moves: langkah dan lompatan per tetangga
+            jumps = {over: (landing, landing_bit)
+                     for over, landing, _, landing_bit in topology.jump_bits[index]}
+            for target in topology.neighbors[index]:
+                bit = 1 << target
+                if empty & bit:
+                    if not seen & bit:
+                        moves.append((target, None))
+                        seen |= bit
+                elif manusia & bit and target in jumps:
+                    landing, landing_bit = jumps[target]
+                    if empty & landing_bit and not seen & landing_bit:
+                        moves.append((landing, target))
+                        seen |= landing_bit
+        else:
+            for target in iter_bits(topology.neighbor_masks[index] & empty):
+                moves.append((target, None))
+        return moves
+
+    def movement_moves(self, side=None):
+        """Semua gerakan pergerakan untuk pihak side."""
+        if side is None:
+            side = self.side
+        pieces = self.macan if side == MACAN else self.manusia
+        moves = []
+        for index in iter_bits(pieces):
+            moves.extend((index, target) for target, _ in self.piece_moves(index))
+        return moves
+
+    def legal_moves(self, side=None):
+        """Semua gerakan legal untuk pihak side sesuai fase permainan."""
+        if side is None:
+            side = self.side
+        if self.is_placement_turn(side):
+            return self.placement_moves(side)
+        return self.movement_moves(side)
+
+    def captures_from(self, index):
+        """Lompatan makan macan di node index sebagai tuple (landing, over), dari cache."""
+        captures = self.threats.get(index)
+        if captures is None:
+            manusia = self.manusia
+            empty = self.topology.full_mask & ~(self.macan | manusia)
+            jump_over = self.topology.jump_over
+            captures = tuple(
+                (landing, over)
+                for over, landing, over_bit, landing_bit in self.topology.jump_bits[index]
+                if manusia & over_bit and empty & landing_bit and jump_over.get((index, landing)) == over
+            )
+            self.threats[index] = captures
+        return captures
+
+    def capture_moves(self):
+        """Lompatan makan yang tersedia bagi macan sebagai list (from, landing, over)."""
+        return [(index, landing, over)
+                for index in iter_bits(self.macan)
+                for landing, over in self.captures_from(index)]
+
+    def threatened_mask(self):
+        """Bitmask pion manusia yang bisa dimakan pada giliran macan berikutnya."""
+        mask = 0
+        for index in iter_bits(self.macan):
+            for _, over in self.captures_from(index):
+                mask |= 1 << over
+        return mask
+
+    def is_macan_trapped(self):
+        """Semua macan tidak punya langkah maupun lompatan."""
+        macan = self.macan
+        if not macan:
+            return False
+        manusia = self.manusia
+        topology = self.topology
+        empty = topology.full_mask & ~(macan | manusia)
+        for index in iter_bits(macan):
+            if topology.neighbor_masks[index] & empty:
+                return False
+            for _, _, over_bit, landing_bit in topology.jump_bits[index]:
+                if manusia & over_bit and empty & landing_bit:
+                    return False
+        return True
+
+    def winner(self):
+        """'Macan', 'Manusia', atau None jika permainan belum selesai (sama dengan check_win_condition)."""
+        if not self.reached_max_manusia:
+            return None
+        if popcount(self.manusia) <= 3:
+            return "Macan"
+        if self.is_macan_trapped():
+            return "Manusia"
+        return None
+
+    def captured_by(self, move):
+        """Indeks pion manusia yang dimakan oleh gerakan macan ini, atau None."""
+        from_index, to_index = move
+        if from_index is None:
+            return None
+        over = self.topology.jump_over.get((from_index, to_index))
+        if over is not None and self.manusia & (1 << over) and self.macan & (1 << from_index):
+            return over
+        return None
+
+    def make_move(self, move, side=None):
+        """Terapkan gerakan untuk pihak yang sedang jalan (atau side), lalu ganti giliran.
+
+        Mengembalikan catatan undo kecil untuk unmake_move:
+        (side, from_index, to_index, dimakan, max_manusia sebelumnya, hash dan hash cermin
+        sebelumnya, akumulator evaluasi sebelumnya, peta ancaman sebelumnya).
+        """
+        undo_side = self.side
+        undo_hash = self.hash
+        undo_mirror = self.mirror_hash
+        undo_max = self.max_manusia
+        undo_features = (self.links, self.surround, self.band, self.center, self.strategic)
+        undo_threats = self.threats
+        if side is not None and side != self.side:
+            self.set_side(side)
+
+        from_index, to_index = move
+        keys = self.keys
+        mirror_keys = self.mirror_keys
+        h = self.hash
+        m = self.mirror_hash
+        over = None
+
+        if self.side == MACAN:
+            if from_index is not None:
+                over = self.captured_by(move)
+                if over is not None:
+                    self._remove_manusia(over)
+                    h ^= keys.manusia[over]
+                    m ^= mirror_keys.manusia[over]
+                self._remove_macan(from_index)
+                h ^= keys.macan[from_index]
+                m ^= mirror_keys.macan[from_index]
+            self._add_macan(to_index)
+            h ^= keys.macan[to_index]
+            m ^= mirror_keys.macan[to_index]
+        else:
+            if from_index is not None:
+                self._remove_manusia(from_index)
+                h ^= keys.manusia[from_index]
+                m ^= mirror_keys.manusia[from_index]
+            self._add_manusia(to_index)
+            h ^= keys.manusia[to_index]
+            m ^= mirror_keys.manusia[to_index]
+            if from_index is None:
+                count = popcount(self.manusia)
+                if count > self.max_manusia:
+                    h ^= keys.placement_key(self.max_manusia) ^ keys.placement_key(count)
+                    m ^= mirror_keys.placement_key(self.max_manusia) ^ mirror_keys.placement_key(count)
+                    self.max_manusia = count
+
+        if undo_threats:
+            changed = 1 << to_index
+            if from_index is not None:
+                changed |= 1 << from_index
+            if over is not None:
+                changed |= 1 << over
+            threat_masks = self.topology.threat_masks
+            self.threats = {index: captures for index, captures in undo_threats.items()
+                            if not changed & threat_masks[index]}
+        else:
+            self.threats = {}  # Dict lama tetap milik posisi sebelumnya (untuk unmake)
+
+        moved_side = self.side
+        self.side ^= 1
+        self.turn_count += 1
+        self.hash = h ^ keys.side
+        self.mirror_hash = m ^ mirror_keys.side
+        return (undo_side, moved_side, from_index, to_index, over, undo_max, undo_hash, undo_mirror,
+                undo_features, undo_threats)
+
+    def unmake_move(self, undo):
+        """Batalkan gerakan dari catatan undo make_move dalam O(1)."""
+        side, moved_side, from_index, to_index, over, max_manusia, h, mirror, features, threats = undo
+        to_bit = 1 << to_index
+        if moved_side == MACAN:
+            self.macan ^= to_bit
+            if from_index is not None:
+                self.macan |= 1 << from_index
+            if over is not None:
+                self.manusia |= 1 << over
+        else:
+            self.manusia ^= to_bit
+            if from_index is not None:
+                self.manusia |= 1 << from_index
+        self.side = side
+        self.turn_count -= 1
+        self.max_manusia = max_manusia
+        self.hash = h
+        self.mirror_hash = mirror
+        self.links, self.surround, self.band, self.center, self.strategic = features
+        self.threats = threats
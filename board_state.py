@@ -0,0 +1,212 @@
+from board_topology import get_topology
+from draw_board import compute_positions
+
+BOARD_SIZE = 400
+BOARD_PADDING = 200
+
+
+class BoardState:
+    """Model papan dan aturan permainan macanan tanpa ketergantungan ke Tkinter.
+
+    Posisi pion disimpan sebagai tuple piksel yang sama dengan output draw_board,
+    sehingga GameLogic (tampilan) dan MacananAI bisa memakai state ini langsung.
+    """
+
+    def __init__(self, positions=None, size=BOARD_SIZE, padding=BOARD_PADDING):
+        if positions is None:
+            positions = compute_positions(size, padding)
+        self.positions = positions
+        self.topology = get_topology(positions)
+        self.reset()
+
+    def reset(self):
+        """Kembalikan state ke awal permainan."""
+        self.manusia_pieces = []
+        self.macan_piece = []
+        self.current_phase = "placement"
+        self.current_player = "Macan"  # Selalu mulai dengan Macan
+        self.turn_count = 0
+        self.game_over = False
+        self.winner = None
+        self._reached_max_manusia = False
+        self._max_manusia_count = 0
+        self.last_error = None  # Pesan alasan gerakan terakhir ditolak
+        self.last_capture = None  # Pion manusia yang dimakan pada gerakan terakhir
+        self.history = []  # Gerakan yang sudah dimainkan sebagai (from_index, to_index)
+
+    def copy(self):
+        """Salinan state untuk simulasi (topologi dipakai bersama)."""
+        clone = BoardState.__new__(BoardState)
+        clone.__dict__.update(self.__dict__)
+        clone.manusia_pieces = self.manusia_pieces.copy()
+        clone.macan_piece = self.macan_piece.copy()
+        clone.history = self.history.copy()
+        return clone
+
+    def _is_valid_placement_position(self, node):
+        """Cek apakah posisi valid untuk penempatan pion (hanya dalam kotak 5x5)."""
+        node_index = self.topology.index_of.get(node)
+        # Hanya posisi 0-24 yang merupakan kotak 5x5
+        return node_index is not None and node_index < self.topology.GRID_SIZE
+
+    def _reject(self, message):
+        self.last_error = message
+        return False
+
+    def place_macan(self, node):
+        """Menempatkan pion macan jika valid."""
+        if len(self.macan_piece) >= 2:
+            return self._reject("Sudah mencapai batas maksimal pion macan!")
+
+        if not self._is_valid_placement_position(node):
+            return self._reject("Pion hanya boleh ditempatkan di dalam kotak 5x5!")
+
+        if node in self.manusia_pieces or node in self.macan_piece:
+            return self._reject("Posisi sudah ditempati!")
+
+        # Cek jarak dengan macan lain jika sudah ada macan pertama
+        if len(self.macan_piece) == 1:
+            macan1_pos = self.macan_piece[0]
+            dist = abs(macan1_pos[0] - node[0]) + abs(macan1_pos[1] - node[1])
+            if dist <= 160:
+                return self._reject("Macan kedua harus ditempatkan jauh dari macan pertama!")
+
+        self.macan_piece.append(node)
+        self.history.append((None, self.topology.index_of[node]))
+        self.last_error = None
+        return True
+
+    def place_manusia(self, node):
+        """Menempatkan satu pion manusia pada posisi yang valid."""
+        if len(self.manusia_pieces) >= 8:
+            return self._reject("Sudah mencapai batas maksimal pion manusia!")
+
+        if not self._is_valid_placement_position(node):
+            return self._reject("Pion hanya boleh ditempatkan di dalam kotak 5x5!")
+
+        if node in self.manusia_pieces or node in self.macan_piece:
+            return self._reject("Posisi sudah ditempati!")
+
+        self.manusia_pieces.append(node)
+        self.update_manusia_tracking()  # Pion ke-8 langsung dihitung, meski dimakan sebelum dicek
+        self.history.append((None, self.topology.index_of[node]))
+        self.last_error = None
+        return True
+
+    def get_valid_moveable_positions(self, node):
+        """Mendapatkan semua posisi valid yang bisa dituju sebagai list (target, dimakan)."""
+        node_index = self.topology.index_of.get(node) if node else None
+        if node_index is None:
+            return []
+
+        # Lookup tabel tetangga dan lompatan berbasis indeks
+        index_of = self.topology.index_of
+        macan_nodes = {index_of[pos] for pos in self.macan_piece}
+        manusia_nodes = {index_of[pos] for pos in self.manusia_pieces}
+        positions = self.topology.positions
+
+        return [
+            (positions[target], positions[eaten] if eaten is not None else None)
+            for target, eaten in self.topology.get_valid_moves(node_index, macan_nodes, manusia_nodes)
+        ]
+
+    def move_piece(self, selected_piece, target_node):
+        """Pindahkan pion; pion yang dimakan (jika ada) disimpan di last_capture."""
+        self.last_capture = None
+        eaten_piece = None
+        for target, eaten in self.get_valid_moveable_positions(selected_piece):
+            if target == target_node:
+                eaten_piece = eaten
+                break
+        else:
+            return self._reject("Gerakan tidak valid!")
+
+        # Hapus pion yang dimakan (jika ada)
+        if eaten_piece:
+            self.manusia_pieces.remove(eaten_piece)
+            self.last_capture = eaten_piece
+
+        # Update posisi pion
+        if selected_piece in self.manusia_pieces:
+            self.manusia_pieces.remove(selected_piece)
+            self.manusia_pieces.append(target_node)
+        else:  # Macan
+            macan_index = self.macan_piece.index(selected_piece)
+            self.macan_piece[macan_index] = target_node
+
+        index_of = self.topology.index_of
+        self.history.append((index_of[selected_piece], index_of[target_node]))
+        self.last_error = None
+        self.check_win_condition()
+        return True
+
+    def update_manusia_tracking(self):
+        """Catat jumlah maksimal pion manusia; setelah pernah 8, manusia hanya bergerak."""
+        if len(self.manusia_pieces) > self._max_manusia_count:
+            self._max_manusia_count = len(self.manusia_pieces)
+        if self._max_manusia_count >= 8:
+            self._reached_max_manusia = True
+
+    def check_win_condition(self):
+        """Cek kondisi menang untuk kedua pemain. Mengembalikan True jika permainan selesai."""
+        self.update_manusia_tracking()
+        if self._reached_max_manusia:
+            # Setelah mencapai 8, pion hanya bisa bergerak
+            self.current_phase = "movement"
+
+            # Hanya cek setelah pernah mencapai 8 pion
+            if len(self.manusia_pieces) <= 3:  # Manusia kalah jika tersisa 3 atau kurang
+                self.game_over = True
+                self.winner = "Macan"
+            elif self.is_macan_trapped():  # Macan kalah jika terkepung
+                self.game_over = True
+                self.winner = "Manusia"
+        return self.game_over
+
+    def is_macan_trapped(self):
+        """Cek apakah semua macan terkepung dan tidak bisa bergerak."""
+        if not self.macan_piece:  # Jika tidak ada macan
+            return False
+
+        for macan in self.macan_piece:
+            if self.get_valid_moveable_positions(macan):
+                return False
+        return True
+
+    def is_placement_turn(self):
+        """Apakah giliran saat ini berupa penempatan pion (bukan pergerakan)."""
+        if self.turn_count <= 3:
+            return True
+        return (self.current_player == "Manusia" and self.current_phase == "placement"
+                and len(self.manusia_pieces) < 8)
+
+    def end_turn(self):
+        """Ganti giliran pemain dan naikkan nomor turn."""
+        self.current_player = "Manusia" if self.current_player == "Macan" else "Macan"
+        self.turn_count += 1
+
+    def apply_move(self, move):
+        """Terapkan gerakan (from_pos, to_pos) untuk pemain saat ini lalu ganti giliran.
+
+        from_pos None berarti penempatan pion baru.
+        """
+        if self.game_over:
+            return self._reject("Permainan sudah selesai!")
+
+        from_pos, to_pos = move
+        if from_pos is None:
+            if not self.is_placement_turn():
+                return self._reject("Bukan giliran penempatan pion!")
+            if self.current_player == "Macan":
+                success = self.place_macan(to_pos)
+            else:
+                success = self.place_manusia(to_pos)
+        else:
+            pieces = self.macan_piece if self.current_player == "Macan" else self.manusia_pieces
+            if from_pos not in pieces:
+                return self._reject("Bukan pion milik pemain yang sedang jalan!")
+            success = self.move_piece(from_pos, to_pos)
+
+        if success:
+            self.end_turn()
+        return success
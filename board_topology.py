@@ -0,0 +1,211 @@
+class BoardTopology:
+    """Topologi papan macanan berbasis indeks node, dibangun sekali dari output draw_board."""
+
+    GRID_SIZE = 25  # Indeks 0-24 adalah kotak 5x5
+    LEFT_TRIANGLE = range(25, 31)
+    RIGHT_TRIANGLE = range(31, 37)
+    CONNECT_DISTANCE = 100  # Threshold jarak koneksi ke/di dalam segitiga
+    JUMP_TOLERANCE = 20  # Toleransi piksel untuk mencari node pendaratan
+    HIT_BUCKET = 20  # Ukuran sel grid (piksel) untuk mencari node dari koordinat klik
+
+    # Posisi dalam grid 5x5 yang memiliki garis diagonal
+    DIAGONAL_CELLS = frozenset([
+        (0, 0), (0, 2), (0, 4),
+        (1, 1), (1, 3),
+        (2, 0), (2, 2), (2, 4),
+        (3, 1), (3, 3),
+        (4, 0), (4, 2), (4, 4),
+    ])
+
+    def __init__(self, positions):
+        self.positions = list(positions)
+        self.size = len(self.positions)
+        self.index_of = {pos: i for i, pos in enumerate(self.positions)}
+
+        # hit_buckets[(bx, by)] -> indeks node yang koordinatnya jatuh di sel grid itu
+        hit_buckets = {}
+        for i, (x, y) in enumerate(self.positions):
+            hit_buckets.setdefault((int(x // self.HIT_BUCKET), int(y // self.HIT_BUCKET)), []).append(i)
+        self.hit_buckets = {cell: tuple(indices) for cell, indices in hit_buckets.items()}
+
+        # neighbors[i] -> tuple indeks node yang terhubung dengan node i
+        self.neighbors = [self._build_neighbors(i) for i in range(self.size)]
+
+        # jumps[(from, over)] -> indeks node pendaratan saat macan melompati "over"
+        self.jumps = {}
+        # jump_list[i] -> tuple (over, landing) untuk semua lompatan dari node i
+        self.jump_list = []
+        for i in range(self.size):
+            entries = []
+            for over in self.neighbors[i]:
+                landing = self._find_landing(i, over)
+                if landing is not None:
+                    self.jumps[(i, over)] = landing
+                    entries.append((over, landing))
+            self.jump_list.append(tuple(entries))
+
+        # Tabel bitmask untuk representasi bitboard (bit ke-i = node indeks i)
+        self.bits = [1 << i for i in range(self.size)]
+        self.full_mask = (1 << self.size) - 1
+        self.grid_mask = (1 << min(self.GRID_SIZE, self.size)) - 1
+        self.neighbor_masks = [self._mask_of(self.neighbors[i]) for i in range(self.size)]
+        # jump_bits[i] -> tuple (over, landing, bit over, bit landing)
+        self.jump_bits = [
+            tuple((over, landing, 1 << over, 1 << landing) for over, landing in entries)
+            for entries in self.jump_list
+        ]
+
+        # jump_over[(from, landing)] -> node yang dilompati. Jika landing juga tetangga
+        # langsung dan muncul lebih dulu di urutan tetangga, gerakan itu dihitung
+        # sebagai langkah biasa (sama seperti urutan pada get_valid_moves).
+        self.jump_over = {}
+        for (start, over), landing in self.jumps.items():
+            order = self.neighbors[start]
+            if landing in order and order.index(landing) < order.index(over):
+                continue
+            self.jump_over[(start, landing)] = over
+
+        # threat_masks[i] -> node i beserta semua node yang dilompati/didarati dari i;
+        # daftar makan macan di i hanya berubah jika isi salah satu node ini berubah
+        self.threat_masks = [
+            self.bits[i] | self._mask_of(over for over, _ in self.jump_list[i])
+            | self._mask_of(landing for _, landing in self.jump_list[i])
+            for i in range(self.size)
+        ]
+
+        # Macan kedua harus ditempatkan jauh (jarak Manhattan > 160) dari macan pertama
+        self.far_placement_masks = [
+            self._mask_of(
+                j for j in range(min(self.GRID_SIZE, self.size))
+                if self._manhattan(i, j) > 160
+            )
+            for i in range(self.size)
+        ]
+
+    def _mask_of(self, indices):
+        mask = 0
+        for i in indices:
+            mask |= 1 << i
+        return mask
+
+    def _manhattan(self, a, b):
+        ax, ay = self.positions[a]
+        bx, by = self.positions[b]
+        return abs(ax - bx) + abs(ay - by)
+
+    def _distance(self, a, b):
+        """Jarak Euclidean antara dua node (berdasarkan indeks)."""
+        ax, ay = self.positions[a]
+        bx, by = self.positions[b]
+        return ((bx - ax) ** 2 + (by - ay) ** 2) ** 0.5
+
+    def _build_neighbors(self, index):
+        """Hitung node yang terhubung, mengikuti aturan garis pada papan."""
+        connected = []
+
+        # Node di grid 5x5
+        if index < self.GRID_SIZE:
+            row, col = divmod(index, 5)
+
+            # Orthogonal
+            for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+                new_row, new_col = row + dr, col + dc
+                if 0 <= new_row < 5 and 0 <= new_col < 5:
+                    connected.append(new_row * 5 + new_col)
+
+            # Diagonal jika ada garisnya
+            if (row, col) in self.DIAGONAL_CELLS:
+                for dr, dc in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
+                    new_row, new_col = row + dr, col + dc
+                    if 0 <= new_row < 5 and 0 <= new_col < 5:
+                        connected.append(new_row * 5 + new_col)
+
+            # Koneksi ke segitiga hanya dari titik tengah kolom kiri/kanan
+            if index == 10:
+                triangle = self.LEFT_TRIANGLE
+            elif index == 14:
+                triangle = self.RIGHT_TRIANGLE
+            else:
+                triangle = ()
+            for other in triangle:
+                if other < self.size and self._distance(index, other) <= self.CONNECT_DISTANCE:
+                    connected.append(other)
+
+        # Node di segitiga: koneksi sesama segitiga dan ke titik tengah grid
+        else:
+            if index in self.LEFT_TRIANGLE:
+                triangle, grid_node = self.LEFT_TRIANGLE, 10
+            else:
+                triangle, grid_node = self.RIGHT_TRIANGLE, 14
+
+            for other in triangle:
+                if (other != index and other < self.size and
+                        self._distance(index, other) <= self.CONNECT_DISTANCE):
+                    connected.append(other)
+
+            if self._distance(index, grid_node) <= self.CONNECT_DISTANCE:
+                connected.append(grid_node)
+
+        return tuple(connected)
+
+    def _find_landing(self, start, over):
+        """Cari node pendaratan untuk lompatan dari start melewati over."""
+        sx, sy = self.positions[start]
+        ox, oy = self.positions[over]
+        jump_x = ox + (ox - sx)
+        jump_y = oy + (oy - sy)
+
+        for i, (x, y) in enumerate(self.positions):
+            if abs(x - jump_x) < self.JUMP_TOLERANCE and abs(y - jump_y) < self.JUMP_TOLERANCE:
+                return i
+        return None
+
+    def node_at(self, x, y, threshold=10):
+        """Indeks node dalam kotak threshold piksel dari (x, y), atau None.
+
+        Hanya sel grid hit_buckets yang bersinggungan dengan kotak itu yang diperiksa,
+        jadi biayanya tetap meski jumlah node bertambah.
+        """
+        bucket = self.HIT_BUCKET
+        for bx in range(int((x - threshold) // bucket), int((x + threshold) // bucket) + 1):
+            for by in range(int((y - threshold) // bucket), int((y + threshold) // bucket) + 1):
+                for i in self.hit_buckets.get((bx, by), ()):
+                    node_x, node_y = self.positions[i]
+                    if abs(node_x - x) <= threshold and abs(node_y - y) <= threshold:
+                        return i
+        return None
+
+    def get_valid_moves(self, index, macan_nodes, manusia_nodes):
+        """Gerakan valid dari node index sebagai list (target, dimakan) dalam indeks.
+
+        macan_nodes dan manusia_nodes adalah set indeks node yang ditempati.
+        """
+        valid_moves = []
+        is_macan = index in macan_nodes
+
+        for target in self.neighbors[index]:
+            if target in macan_nodes:  # Tidak bisa ke posisi macan lain
+                continue
+            if target not in manusia_nodes:
+                valid_moves.append((target, None))
+            elif is_macan:  # Lompatan untuk makan
+                landing = self.jumps.get((index, target))
+                if (landing is not None and
+                        landing not in manusia_nodes and
+                        landing not in macan_nodes):
+                    valid_moves.append((landing, target))
+
+        return valid_moves
+
+
+_topology_cache = {}
+
+
+def get_topology(positions):
+    """Ambil BoardTopology untuk daftar posisi, dibangun hanya sekali per papan."""
+    key = tuple(positions)
+    topology = _topology_cache.get(key)
+    if topology is None:
+        topology = BoardTopology(key)
+        _topology_cache[key] = topology
+    return topology
@@ -1,19 +1,145 @@
+from array import array
+
+# Jenis nilai yang disimpan (hasil alpha-beta)
+EXACT = 0
+LOWER_BOUND = 1  # Nilai sebenarnya >= value (terjadi cutoff beta)
+UPPER_BOUND = 2  # Nilai sebenarnya <= value (tidak ada gerakan melewati alpha)
+
+# Tata letak satu entri dalam array data (int 64-bit tanpa tanda):
+# bit 0-11 gerakan (from 6 bit, to 6 bit), bit 12-13 jenis nilai, bit 14-21 generasi
+# (mod 256), bit 22-29 kedalaman, bit 30 penanda slot terisi.
+MOVE_BITS = 6
+NO_SOURCE = (1 << MOVE_BITS) - 1  # from untuk gerakan penempatan
+NO_MOVE = (1 << (2 * MOVE_BITS)) - 1
+MOVE_MASK = NO_MOVE
+FLAG_SHIFT = 12
+GENERATION_SHIFT = 14
+GENERATION_MASK = 0xFF
+DEPTH_SHIFT = 22
+DEPTH_MASK = 0xFF
+USED = 1 << 30
+AGE_WEIGHT = 4  # Satu generasi umur setara 4 ply kedalaman saat memilih entri yang dibuang
+
+
+def _encode_move(move):
+    if move is None:
+        return NO_MOVE
+    from_index, to_index = move
+    return ((NO_SOURCE if from_index is None else from_index) << MOVE_BITS) | to_index
+
+
+def _decode_move(code):
+    if code == NO_MOVE:
+        return None
+    from_index = code >> MOVE_BITS
+    return (None if from_index == NO_SOURCE else from_index, code & NO_SOURCE)
+
+
 class TranspositionTable:
-    def __init__(self, max_size=1000000):
-        self.table = {}
-        self.max_size = max_size
-
-    def store(self, position_hash, depth, value, move):
-        if len(self.table) >= self.max_size:
-            # Hapus 10% entri terlama jika table penuh
-            old_entries = int(self.max_size * 0.1)
-            for _ in range(old_entries):
-                self.table.popitem()
-        
-        self.table[position_hash] = (depth, value, move)
+    """Cache hasil pencarian berkapasitas tetap, dipertahankan antar giliran.
 
-    def lookup(self, position_hash):
-        return self.table.get(position_hash)
+    Entri disimpan dalam tiga array datar (kunci 64-bit, data terkemas, skor) yang
+    dibagi menjadi bucket berisi `ways` slot; bucket dipilih dari bit rendah kunci dan
+    kunci penuh disimpan untuk memastikan entri memang milik posisi yang dicari.
+
+    Saat bucket penuh, slot dengan nilai kedalaman dikurangi umur (generasi pencarian)
+    terkecil yang ditimpa, sehingga entri dangkal dan entri dari pencarian lama dibuang
+    lebih dulu. Entri posisi yang sama dari pencarian yang sama hanya ditimpa oleh hasil
+    yang minimal sama dalam.
+    """
+
+    def __init__(self, max_size=1 << 20, ways=4):
+        buckets = 1
+        while buckets * ways < max_size:
+            buckets <<= 1
+        self.ways = ways
+        self.capacity = buckets * ways
+        self._bucket_mask = buckets - 1
+        self.generation = 0
+        self.clear()
 
     def clear(self):
-        self.table.clear() 
\ No newline at end of file
+        self._keys = array('Q', bytes(8 * self.capacity))
+        self._data = array('Q', bytes(8 * self.capacity))
+        self._scores = array('d', bytes(8 * self.capacity))
+        self.generation = 0
+        self.used = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0  # Entri posisi lain yang ditimpa karena bucket penuh
+
+    def new_generation(self):
+        """Tandai awal pencarian baru (dipanggil sekali per giliran AI)."""
+        self.generation += 1
+
+    def __len__(self):
+        return self.used
+
+    def store(self, position_hash, depth, value, move, flag=EXACT):
+        keys = self._keys
+        data = self._data
+        generation = self.generation & GENERATION_MASK
+        base = (position_hash & self._bucket_mask) * self.ways
+        victim = -1
+        victim_worth = None
+        for slot in range(base, base + self.ways):
+            word = data[slot]
+            if not word:  # Slot kosong selalu di belakang slot terisi dalam satu bucket
+                victim = slot
+                self.used += 1
+                break
+            if keys[slot] == position_hash:
+                # Pertahankan entri yang lebih dalam dari pencarian yang sama
+                if ((word >> GENERATION_SHIFT) & GENERATION_MASK == generation
+                        and (word >> DEPTH_SHIFT) & DEPTH_MASK > depth):
+                    return
+                victim = slot
+                break
+            age = (generation - (word >> GENERATION_SHIFT)) & GENERATION_MASK
+            worth = ((word >> DEPTH_SHIFT) & DEPTH_MASK) - AGE_WEIGHT * age
+            if victim_worth is None or worth < victim_worth:
+                victim = slot
+                victim_worth = worth
+        else:
+            self.overwrites += 1
+
+        self.stores += 1
+        keys[victim] = position_hash
+        data[victim] = (USED | (min(depth, DEPTH_MASK) << DEPTH_SHIFT) | (generation << GENERATION_SHIFT)
+                        | (flag << FLAG_SHIFT) | _encode_move(move))
+        self._scores[victim] = value
+
+    def lookup(self, position_hash):
+        """Entri (depth, value, move, flag, generation) untuk posisi ini, atau None."""
+        keys = self._keys
+        data = self._data
+        base = (position_hash & self._bucket_mask) * self.ways
+        for slot in range(base, base + self.ways):
+            word = data[slot]
+            if not word:
+                break
+            if keys[slot] == position_hash:
+                self.hits += 1
+                age = (self.generation - (word >> GENERATION_SHIFT)) & GENERATION_MASK
+                return ((word >> DEPTH_SHIFT) & DEPTH_MASK, self._scores[slot], _decode_move(word & MOVE_MASK),
+                        (word >> FLAG_SHIFT) & 3, self.generation - age)
+        self.misses += 1
+        return None
+
+    def stats(self):
+        """Statistik pemakaian tabel sejak clear/reset_stats."""
+        probes = self.hits + self.misses
+        return {
+            "capacity": self.capacity,
+            "used": self.used,
+            "fill": self.used / self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / probes if probes else 0.0,
+            "stores": self.stores,
+            "overwrites": self.overwrites,
+        }
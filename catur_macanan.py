@@ -19,9 +19,17 @@ def update_turn_label(turn_label, current_player):
     else:
         turn_label.config(text="AI's Turn", fg="red")
 
-def start_game(root, player_choice, mode, pvp_roles=None):
-    """Mulai permainan berdasarkan pilihan."""
-    game_window = tk.Toplevel()
+# root -> (jendela permainan, canvas, posisi node); papan digambar sekali per root
+_game_windows = {}
+
+
+def get_game_window(root):
+    """Jendela papan untuk root ini, dibuat dan digambar sekali lalu dipakai ulang."""
+    cached = _game_windows.get(root)
+    if cached is not None and cached[0].winfo_exists():
+        return cached
+
+    game_window = tk.Toplevel(root)
     game_window.title("Papan Macanan")
     canvas_width = 820
     canvas_height = 600
@@ -31,13 +39,37 @@ def start_game(root, player_choice, mode, pvp_roles=None):
 
     center_window(game_window, canvas_width, canvas_height)
     positions = draw_board(canvas, 400, 200)
-    
+    cached = (game_window, canvas, positions)
+    _game_windows[root] = cached
+    return cached
+
+def start_game(root, player_choice, mode, pvp_roles=None):
+    """Mulai permainan berdasarkan pilihan.
+
+    Jendela papan dipakai ulang antar permainan: menutupnya (atau "Kembali ke Menu")
+    hanya menyembunyikan jendela dan menghapus pion, sehingga permainan berikutnya
+    langsung tampil tanpa menggambar ulang papan.
+    """
+    game_window, canvas, positions = get_game_window(root)
+
     # Inisialisasi logika permainan
     game_logic = GameLogic(canvas, positions, player_choice, mode, pvp_roles)
-
+    closed = tk.BooleanVar(game_window, value=False)
+
+    def close_game():
+        game_logic.clear()
+        game_window.grab_release()
+        game_window.withdraw()
+        closed.set(True)
+
+    game_logic.on_menu = close_game
+    game_window.protocol("WM_DELETE_WINDOW", close_game)
+    # Jika aplikasi ditutup saat permainan berjalan, hentikan juga penantian di bawah
+    game_window.bind("<Destroy>", lambda event: closed.set(True) if event.widget is game_window else None)
+    game_window.deiconify()
     game_window.transient(root)
     game_window.grab_set()
-    root.wait_window(game_window)
+    game_window.wait_variable(closed)
 
 def roll_dice():
     """Return angka random 1-6."""
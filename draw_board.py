@@ -1,11 +1,48 @@
-import tkinter as tk
+def compute_positions(size, padding):
+    """Hitung koordinat semua titik papan tanpa menggambar (tidak butuh Tkinter)."""
+    gap = size // 5  # Ukuran jarak antar titik
+
+    # Titik kotak tengah (5x5 grid), baris demi baris
+    nodes_pos = [(col * gap + padding, row * gap + padding)
+                 for row in range(5) for col in range(5)]
+
+    # Titik segitiga kiri
+    left_center_x = padding
+    left_center_y = padding + 2 * gap
+    triangle_width = 2 * gap
+    nodes_pos.extend([
+        (left_center_x - triangle_width, left_center_y - gap),
+        (left_center_x - triangle_width, left_center_y),
+        (left_center_x - triangle_width, left_center_y + gap),
+        (left_center_x - gap, left_center_y - gap/2),
+        (left_center_x - gap, left_center_y),
+        (left_center_x - gap, left_center_y + gap/2),
+    ])
+
+    # Titik segitiga kanan
+    right_center_x = padding + 4 * gap
+    right_center_y = padding + 2 * gap
+    nodes_pos.extend([
+        (right_center_x + triangle_width, right_center_y - gap),
+        (right_center_x + triangle_width, right_center_y),
+        (right_center_x + triangle_width, right_center_y + gap),
+        (right_center_x + gap, right_center_y - gap/2),
+        (right_center_x + gap, right_center_y),
+        (right_center_x + gap, right_center_y + gap/2),
+    ])
+
+    return nodes_pos
 
 def draw_board(canvas, size, padding):
-    """Menggambar papan macanan dengan garis diagonal bergantian dan segitiga di kiri & kanan."""
+    """Menggambar papan macanan dengan garis diagonal bergantian dan segitiga di kiri & kanan.
+
+    Semua item diberi tag "board" agar papan statis cukup digambar sekali: restart dan
+    permainan baru hanya menghapus tag pion/overlay, bukan seluruh canvas.
+    """
     gap = size // 5  # Ukuran jarak antar titik
     node_radius = 8  # Radius untuk titik-titik
 
-    nodes_pos = []
+    nodes_pos = compute_positions(size, padding)
     # Menggambar kotak tengah (5x5 grid) dengan garis diagonal bergantian
     for row in range(5):
         for col in range(5):
@@ -16,22 +53,21 @@ def draw_board(canvas, size, padding):
             canvas.create_oval(
                 x - node_radius, y - node_radius,
                 x + node_radius, y + node_radius,
-                fill="black"
+                fill="black", tags="board"
             )
 
-            nodes_pos.append((x, y))
             # Garis horizontal dan vertikal
             if col < 4:  # Horizontal
-                canvas.create_line(x, y, x + gap, y, fill="black")
+                canvas.create_line(x, y, x + gap, y, fill="black", tags="board")
             if row < 4:  # Vertikal
-                canvas.create_line(x, y, x, y + gap, fill="black")
+                canvas.create_line(x, y, x, y + gap, fill="black", tags="board")
 
             # Garis diagonal bergantian
             if col < 4 and row < 4:
                 if (row + col) % 2 == 0:
-                    canvas.create_line(x, y, x + gap, y + gap, fill="black")  # Diagonal \
+                    canvas.create_line(x, y, x + gap, y + gap, fill="black", tags="board")  # Diagonal \
                 else:
-                    canvas.create_line(x + gap, y, x, y + gap, fill="black")  # Diagonal /
+                    canvas.create_line(x + gap, y, x, y + gap, fill="black", tags="board")  # Diagonal /
 
     # Segitiga kiri
     left_center_x = padding
@@ -39,65 +75,47 @@ def draw_board(canvas, size, padding):
     triangle_width = 2 * gap
 
     # Garis segitiga
-    canvas.create_line(left_center_x, left_center_y, left_center_x - triangle_width, left_center_y - gap, fill="black")
-    canvas.create_line(left_center_x, left_center_y, left_center_x - triangle_width, left_center_y + gap, fill="black")
-    canvas.create_line(left_center_x - triangle_width, left_center_y - gap, left_center_x - triangle_width, left_center_y + gap, fill="black")
+    canvas.create_line(left_center_x, left_center_y, left_center_x - triangle_width, left_center_y - gap, fill="black", tags="board")
+    canvas.create_line(left_center_x, left_center_y, left_center_x - triangle_width, left_center_y + gap, fill="black", tags="board")
+    canvas.create_line(left_center_x - triangle_width, left_center_y - gap, left_center_x - triangle_width, left_center_y + gap, fill="black", tags="board")
 
     # Garis silang di segitiga kiri
-    canvas.create_line(left_center_x - gap, left_center_y - gap/2, left_center_x - gap, left_center_y + gap/2, fill="black")
-    canvas.create_line(left_center_x - triangle_width, left_center_y, left_center_x, left_center_y, fill="black")
+    canvas.create_line(left_center_x - gap, left_center_y - gap/2, left_center_x - gap, left_center_y + gap/2, fill="black", tags="board")
+    canvas.create_line(left_center_x - triangle_width, left_center_y, left_center_x, left_center_y, fill="black", tags="board")
 
     # Titik segitiga kiri
-    left_nodes = [
-        (left_center_x - triangle_width, left_center_y - gap),
-        (left_center_x - triangle_width, left_center_y),
-        (left_center_x - triangle_width, left_center_y + gap),
-        (left_center_x - gap, left_center_y - gap/2),
-        (left_center_x - gap, left_center_y),
-        (left_center_x - gap, left_center_y + gap/2),
-    ]
+    left_nodes = nodes_pos[25:31]
 
     for x, y in left_nodes:
         canvas.create_oval(
             x - node_radius, y - node_radius,
             x + node_radius, y + node_radius,
-            fill="black"
+            fill="black", tags="board"
         )
 
-    nodes_pos.extend(left_nodes)
-
     # Segitiga kanan
     right_center_x = padding + 4 * gap
     right_center_y = padding + 2 * gap
 
     # Garis segitiga
-    canvas.create_line(right_center_x, right_center_y, right_center_x + triangle_width, right_center_y - gap, fill="black")
-    canvas.create_line(right_center_x, right_center_y, right_center_x + triangle_width, right_center_y + gap, fill="black")
-    canvas.create_line(right_center_x + triangle_width, right_center_y - gap, right_center_x + triangle_width, right_center_y + gap, fill="black")
+    canvas.create_line(right_center_x, right_center_y, right_center_x + triangle_width, right_center_y - gap, fill="black", tags="board")
+    canvas.create_line(right_center_x, right_center_y, right_center_x + triangle_width, right_center_y + gap, fill="black", tags="board")
+    canvas.create_line(right_center_x + triangle_width, right_center_y - gap, right_center_x + triangle_width, right_center_y + gap, fill="black", tags="board")
 
     # Garis silang di segitiga kanan
-    canvas.create_line(right_center_x + gap, right_center_y - gap/2, right_center_x + gap, right_center_y + gap/2, fill="black")
-    canvas.create_line(right_center_x, right_center_y, right_center_x + triangle_width, right_center_y, fill="black")
+    canvas.create_line(right_center_x + gap, right_center_y - gap/2, right_center_x + gap, right_center_y + gap/2, fill="black", tags="board")
+    canvas.create_line(right_center_x, right_center_y, right_center_x + triangle_width, right_center_y, fill="black", tags="board")
 
     # Titik segitiga kanan
-    right_nodes = [
-        (right_center_x + triangle_width, right_center_y - gap),
-        (right_center_x + triangle_width, right_center_y),
-        (right_center_x + triangle_width, right_center_y + gap),
-        (right_center_x + gap, right_center_y - gap/2),
-        (right_center_x + gap, right_center_y),
-        (right_center_x + gap, right_center_y + gap/2),
-    ]
+    right_nodes = nodes_pos[31:]
 
     for x, y in right_nodes:
         canvas.create_oval(
             x - node_radius, y - node_radius,
             x + node_radius, y + node_radius,
-            fill="black"
+            fill="black", tags="board"
         )
 
-    nodes_pos.extend(right_nodes)
-
     return nodes_pos  # Mengembalikan posisi semua titik
 
 
@@ -0,0 +1,168 @@
+EVAL_CENTER = (250, 250)  # Titik pusat yang dipakai fungsi evaluasi MacananAI
+LINK_DISTANCE = 50  # Jarak Manhattan pion manusia yang dianggap terhubung / mengepung
+STRATEGIC_CENTER_DISTANCE = 100
+
+
+def game_phase(turn_count, manusia_count):
+    """Fase evaluasi ("early", "mid", "late") untuk nomor turn dan jumlah pion manusia."""
+    if turn_count < 10:
+        return "early"
+    if turn_count < 20 and manusia_count > 5:
+        return "mid"
+    return "late"
+
+
+def _manhattan(pos1, pos2):
+    return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+
+
+def _popcount(mask):
+    return bin(mask).count("1")
+
+
+if hasattr(int, "bit_count"):  # Python 3.10+
+    _popcount = int.bit_count
+
+
+class EvaluationTables:
+    """Tabel statis per node/pasangan node untuk evaluasi MacananAI secara inkremental.
+
+    Semua suku evaluasi yang hanya bergantung pada jarak antar node dihitung sekali
+    di sini sebagai bitmask, sehingga Bitboard cukup memperbarui akumulatornya
+    dengan popcount saat satu pion ditambah atau diangkat.
+    """
+
+    def __init__(self, topology):
+        positions = topology.positions
+        size = topology.size
+        self.size = size
+
+        # center[i] -> skor kontrol pusat node i: max(0, 100 - jarak Manhattan ke EVAL_CENTER)
+        self.center = [max(0, 100 - int(_manhattan(pos, EVAL_CENTER))) for pos in positions]
+
+        # link_masks[i] -> node dalam LINK_DISTANCE dari node i (formasi dan pengepungan)
+        self.link_masks = []
+        # Pita jarak manusia-macan: (< 2, 2..3, lainnya) -> skor (-30, +20, -10)
+        self.close_masks = []
+        self.ideal_masks = []
+        for i in range(size):
+            link = close = ideal = 0
+            for j in range(size):
+                if i == j:
+                    continue
+                bit = 1 << j
+                dist = _manhattan(positions[i], positions[j])
+                if dist <= LINK_DISTANCE:
+                    link |= bit
+                if dist < 2:
+                    close |= bit
+                elif dist <= 3:
+                    ideal |= bit
+            self.link_masks.append(link)
+            self.close_masks.append(close)
+            self.ideal_masks.append(ideal)
+
+        # strategic[(manusia, macan)] -> tuple (mask pendukung, minimal pion), lihat
+        # _strategic_clauses; pasangan yang tidak mungkin strategis tidak disimpan
+        self.strategic = {}
+        for p in range(size):
+            for m in range(size):
+                if p != m:
+                    clauses = self._strategic_clauses(positions, p, m)
+                    if clauses:
+                        self.strategic[(p, m)] = clauses
+
+        # Pasangan strategis yang nilainya bisa berubah jika node i berubah isinya
+        self.strategic_by_manusia = [[] for _ in range(size)]
+        self.strategic_by_macan = [[] for _ in range(size)]
+        for (p, m), clauses in self.strategic.items():
+            entry = (p, m, clauses)
+            self.strategic_by_macan[m].append(entry)
+            touched = 1 << p
+            for mask, _ in clauses:
+                touched |= mask
+            for i in range(size):
+                if touched & (1 << i):
+                    self.strategic_by_manusia[i].append(entry)
+
+    @staticmethod
+    def _strategic_clauses(positions, p, m):
+        """Klausa (mask, ambang) yang membuat pion manusia di p strategis terhadap macan di m.
+
+        Pion strategis jika salah satu klausa terpenuhi (cukup pion manusia lain di mask):
+        1. Jarak pengepungan ideal (dx atau dy = 2) dan minimal satu pion lain juga di
+           jarak itu, di sisi berlawanan atau membentuk sudut pengepungan.
+        2. Menghalangi jalur pelarian (dx atau dy = 1) dengan minimal dua pion lain dalam
+           kotak 2 dari macan.
+        3. Dekat pusat (<= STRATEGIC_CENTER_DISTANCE dari EVAL_CENTER) dengan minimal dua
+           pion lain dalam LINK_DISTANCE. Klausa 1 dan 2 saling eksklusif.
+        """
+        manusia_pos = positions[p]
+        macan_pos = positions[m]
+        dx = abs(manusia_pos[0] - macan_pos[0])
+        dy = abs(manusia_pos[1] - macan_pos[1])
+        others = [q for q in range(len(positions)) if q not in (p, m)]
+        clauses = []
+
+        if dx == 2 or dy == 2:
+            mask = 0
+            for q in others:
+                other_dx = abs(positions[q][0] - macan_pos[0])
+                other_dy = abs(positions[q][1] - macan_pos[1])
+                if other_dx == 2 or other_dy == 2:
+                    if (dx * other_dx == 0 and dy * other_dy == 0) or (dx != other_dx or dy != other_dy):
+                        mask |= 1 << q
+            clauses.append((mask, 1))
+        elif dx == 1 or dy == 1:
+            mask = 0
+            for q in others:
+                if abs(positions[q][0] - macan_pos[0]) <= 2 and abs(positions[q][1] - macan_pos[1]) <= 2:
+                    mask |= 1 << q
+            clauses.append((mask, 2))
+
+        if _manhattan(manusia_pos, EVAL_CENTER) <= STRATEGIC_CENTER_DISTANCE:
+            mask = 0
+            for q in others:
+                if _manhattan(positions[q], manusia_pos) <= LINK_DISTANCE:
+                    mask |= 1 << q
+            clauses.append((mask, 2))
+
+        return tuple((mask, need) for mask, need in clauses if _popcount(mask) >= need)
+
+    def band_score(self, index, others):
+        """Jumlah skor jarak aman antara node index dan setiap pion di mask others."""
+        # Setiap pion bernilai -10, kecuali yang masuk pita dekat (-30) atau ideal (+20);
+        # di papan standar kedua pita itu kosong
+        score = -10 * _popcount(others)
+        close = self.close_masks[index]
+        if close:
+            score -= 20 * _popcount(close & others)
+        ideal = self.ideal_masks[index]
+        if ideal:
+            score += 30 * _popcount(ideal & others)
+        return score
+
+    def strategic_count(self, entries, macan, manusia):
+        """Jumlah pasangan (manusia, macan) strategis di antara entries."""
+        count = 0
+        for p, m, clauses in entries:
+            p_bit = 1 << p
+            if manusia & p_bit and macan & (1 << m):
+                others = manusia ^ p_bit
+                for mask, need in clauses:
+                    if _popcount(others & mask) >= need:
+                        count += 1
+                        break
+        return count
+
+
+_tables_cache = {}
+
+
+def get_evaluation_tables(topology):
+    """Tabel evaluasi untuk topologi ini (dibuat sekali per papan)."""
+    tables = _tables_cache.get(topology)
+    if tables is None:
+        tables = EvaluationTables(topology)
+        _tables_cache[topology] = tables
+    return tables
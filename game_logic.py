@@ -1,4 +1,27 @@
 import random
+from ai_logic import MacananAI
+from ai_worker import AIWorker
+from board_state import BoardState
+from mcts import MCTSAI
+
+AI_TIME_LIMIT_MS = 1000  # Waktu berpikir AI per gerakan
+AI_POLL_INTERVAL_MS = 50  # Interval cek hasil AI dari loop Tkinter
+AI_WORKERS = 1  # >1 membagi gerakan akar ke beberapa proses (parallel_search)
+# Engine AI per pihak yang dimainkan AI: "minimax" (MacananAI) atau "mcts" (MCTSAI)
+AI_ENGINES = {"Macan": "minimax", "Manusia": "minimax"}
+PIECE_RADIUS = 8  # Radius oval pion di canvas
+INITIAL_TURN_TEXT = "Turn 1: Letakkan pion Macan pertama"
+# Tag canvas milik satu permainan; papan statis (tag "board" dari draw_board) tidak ikut
+GAME_TAGS = ("piece", "highlight", "game_over", "label")
+
+
+def _state_attribute(name):
+    """Atribut GameLogic yang diteruskan ke BoardState (model tanpa GUI)."""
+    return property(
+        lambda self: getattr(self.state, name),
+        lambda self, value: setattr(self.state, name, value),
+    )
+
 
 class GameLogic:
     
@@ -15,32 +38,47 @@ class GameLogic:
     #     self.max_tile_movement= 1
     #     self.position = []
     #     self.color= 'blue'
-        
+
+    # State permainan disimpan di BoardState; GameLogic hanya tampilan & kontroler
+    positions = _state_attribute("positions")
+    topology = _state_attribute("topology")
+    manusia_pieces = _state_attribute("manusia_pieces")
+    macan_piece = _state_attribute("macan_piece")
+    current_phase = _state_attribute("current_phase")
+    current_player = _state_attribute("current_player")
+    turn_count = _state_attribute("turn_count")
+    game_over = _state_attribute("game_over")
+    winner = _state_attribute("winner")
+    _reached_max_manusia = _state_attribute("_reached_max_manusia")
+    _max_manusia_count = _state_attribute("_max_manusia_count")
+
     def __init__(self, canvas, positions, player_choice, mode="AI", pvp_roles=None):
         self.canvas = canvas
-        self.positions = positions
+        self.state = BoardState(positions)
         self.player_choice = player_choice
         self.mode = mode
         self.pvp_roles = pvp_roles  # Tambahkan roles untuk PvP
-        self.manusia_pieces = []
-        self.macan_piece = []
-        self.current_phase = "placement"
         self.selected_piece = None
+        # Satu item canvas (tag "piece") per pion, dikunci posisi pikselnya; digeser dengan
+        # canvas.coords dan dihapus saat dimakan, jadi jumlah item tidak bertambah tiap gerakan
+        self.piece_items = {}
         self.canvas.bind("<Button-1>", self.place_or_move_piece)
-        self.current_player = "Macan"  # Selalu mulai dengan Macan
-        self.turn_count = 0  # Mulai dari turn 1
-        
+        # Satu engine AI per sesi permainan; tabel pencariannya dipakai lintas giliran
+        self.ai = self._create_ai() if mode == "AI" else None
+        # Pencarian AI berjalan di thread; hasilnya diambil lewat canvas.after
+        self.ai_worker = AIWorker(self.ai) if self.ai is not None else None
+        self._ai_poll_id = None
+        self._ai_attempts = 0
+        # Dipanggil oleh back_to_menu jika jendela permainan dikelola pemanggil (catur_macanan)
+        self.on_menu = None
+
         self.turn_label = self.canvas.create_text(
-            250, 20, 
-            text="Turn 1: Letakkan pion Macan pertama", 
-            font=("Arial", 14), 
-            fill="black"
+            250, 20,
+            text=INITIAL_TURN_TEXT,
+            font=("Arial", 14),
+            fill="black", tags="label"
         )
-        self.game_over = False
-        self.winner = None
         self.game_over_label = None
-        self._reached_max_manusia = False  # Tambahkan flag ini di __init__
-        self._max_manusia_count = 0  # Tambahkan counter untuk tracking jumlah maksimal
         
         # Jika player memilih manusia, buat AI langsung bergerak di turn pertama
         if mode == "AI" and player_choice == "Manusia":
@@ -57,7 +95,7 @@ class GameLogic:
                 600, 20,
                 text=f"{pvp_roles[0]} | {pvp_roles[1]}",
                 font=("Arial", 12),
-                fill="black"
+                fill="black", tags="label"
             )
 
     def update_turn_label(self):
@@ -86,10 +124,6 @@ class GameLogic:
         if self.game_over:
             return
 
-        nearest_node = self.get_nearest_node(event.x, event.y)
-        if not nearest_node:
-            return
-
         # Dalam mode PVP, semua giliran valid
         if self.mode == "PVP":
             is_player_turn = True
@@ -97,10 +131,15 @@ class GameLogic:
             # Dalam mode AI, cek giliran player
             is_player_turn = ((self.player_choice == "Macan" and self.current_player == "Macan") or
                              (self.player_choice == "Manusia" and self.current_player == "Manusia"))
-        
+
+        # Klik saat giliran AI langsung diabaikan, sebelum mencari node
         if not is_player_turn:
             return
 
+        nearest_node = self.get_nearest_node(event.x, event.y)
+        if not nearest_node:
+            return
+
         # Fase penempatan awal (2 macan dan manusia pertama)
         if self.turn_count <= 3:
             if self.current_player == "Macan" and len(self.macan_piece) < 2:
@@ -144,85 +183,38 @@ class GameLogic:
 
     def get_nearest_node(self, x, y, threshold=10):
         """Cari titik terdekat dari posisi klik, dalam jarak threshold piksel."""
-        for node in self.positions:
-            if abs(node[0] - x) <= threshold and abs(node[1] - y) <= threshold:
-                return node
-        return None
+        index = self.topology.node_at(x, y, threshold)
+        return self.positions[index] if index is not None else None
 
     def _is_valid_placement_position(self, node):
         """Cek apakah posisi valid untuk penempatan pion (hanya dalam kotak 5x5)."""
-        try:
-            node_index = self.positions.index(node)
-            # Hanya posisi 0-24 yang merupakan kotak 5x5
-            return 0 <= node_index < 25
-        except ValueError:
-            return False
+        return self.state._is_valid_placement_position(node)
 
     def place_macan(self, node):
         """Menempatkan pion macan jika valid."""
-        if len(self.macan_piece) >= 2:
-            print("Sudah mencapai batas maksimal pion macan!")
+        if not self.state.place_macan(node):
+            print(self.state.last_error)
             return False
 
-        if not self._is_valid_placement_position(node):
-            print("Pion hanya boleh ditempatkan di dalam kotak 5x5!")
-            return False
-
-        if node in self.manusia_pieces or node in self.macan_piece:
-            print("Posisi sudah ditempati!")
-            return False
-
-        # Cek jarak dengan macan lain jika sudah ada macan pertama
-        if len(self.macan_piece) == 1:
-            macan1_pos = self.macan_piece[0]
-            dist = abs(macan1_pos[0] - node[0]) + abs(macan1_pos[1] - node[1])
-            print(dist)
-            if dist <= 160:  # Pastikan jarak minimal 50
-                print("Macan kedua harus ditempatkan jauh dari macan pertama!")
-                return False
-
-        # Tambahkan macan baru
-        self.macan_piece.append(node)
-        self.canvas.create_oval(
-            node[0] - 8, node[1] - 8,
-            node[0] + 8, node[1] + 8,
-            fill="red"
-        )
+        self._create_piece_item(node, "red")
         print(f"Pion macan ke-{len(self.macan_piece)} berhasil ditempatkan.")
         return True
 
     def place_manusia(self, node):
         """Menempatkan satu pion manusia pada posisi yang valid."""
-        if len(self.manusia_pieces) >= 8:
-            print("Sudah mencapai batas maksimal pion manusia!")
+        if not self.state.place_manusia(node):
+            print(self.state.last_error)
             return False
 
-        if not self._is_valid_placement_position(node):
-            print("Pion hanya boleh ditempatkan di dalam kotak 5x5!")
-            return False
-
-        if node in self.manusia_pieces or node in self.macan_piece:
-            print("Posisi sudah ditempati!")
-            return False
-
-        # Tambahkan pion manusia
-        self.manusia_pieces.append(node)
-        self.canvas.create_oval(
-            node[0] - 8, node[1] - 8,
-            node[0] + 8, node[1] + 8,
-            fill="blue"
-        )
+        self._create_piece_item(node, "blue")
         print(f"Pion manusia ke-{len(self.manusia_pieces)} berhasil ditempatkan.")
         return True
 
     def remove_macan(self):
         """Hapus pion macan jika sudah ada."""
         if self.macan_piece:
-            self.canvas.create_oval(
-                self.macan_piece[0] - 8, self.macan_piece[1] - 8,
-                self.macan_piece[0] + 8, self.macan_piece[1] + 8,
-                fill="black"
-            )
+            for piece in self.macan_piece:
+                self._delete_piece_item(piece)
             self.macan_piece = None
 
 
@@ -301,148 +293,7 @@ class GameLogic:
 
     def get_valid_moveable_positions(self, node):
         """Mendapatkan semua posisi valid yang bisa dituju."""
-        if not node or node not in self.positions:
-            return []
-        
-        valid_moves = []
-        connected_nodes = []
-        node_index = self.positions.index(node)
-        
-        # Jika node berada di grid 5x5 (indeks 0-24)
-        if node_index < 25:
-            row = node_index // 5
-            col = node_index % 5
-            
-            # Cek orthogonal di grid
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                new_row, new_col = row + dx, col + dy
-                if 0 <= new_row < 5 and 0 <= new_col < 5:
-                    new_index = new_row * 5 + new_col
-                    connected_nodes.append(self.positions[new_index])
-            
-            # Cek diagonal jika ada
-            if self._has_diagonal_lines(row, col):
-                for dx, dy in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
-                    new_row, new_col = row + dx, col + dy
-                    if 0 <= new_row < 5 and 0 <= new_col < 5:
-                        new_index = new_row * 5 + new_col
-                        connected_nodes.append(self.positions[new_index])
-            
-            # Tambahkan koneksi ke segitiga hanya dari titik tengah
-            if col == 0 and row == 2:  # Titik tengah kolom kiri (index 10)
-                # Koneksi ke segitiga kiri
-                for triangle_node in self.positions[25:31]:
-                    dx = triangle_node[0] - node[0]
-                    dy = triangle_node[1] - node[1]
-                    distance = (dx ** 2 + dy ** 2) ** 0.5
-                    if distance <= 100:  # Threshold jarak koneksi
-                        connected_nodes.append(triangle_node)
-            
-            elif col == 4 and row == 2:  # Titik tengah kolom kanan (index 14)
-                # Koneksi ke segitiga kanan
-                for triangle_node in self.positions[31:]:
-                    dx = triangle_node[0] - node[0]
-                    dy = triangle_node[1] - node[1]
-                    distance = (dx ** 2 + dy ** 2) ** 0.5
-                    if distance <= 100:  # Threshold jarak koneksi
-                        connected_nodes.append(triangle_node)
-        
-        # Jika node berada di area segitiga (indeks 25+)
-        else:
-            # Koneksi dalam segitiga yang sama
-            if node_index < 31:  # Segitiga kiri
-                # Koneksi ke node segitiga lain di kiri
-                for triangle_node in self.positions[25:31]:
-                    if triangle_node != node:
-                        dx = triangle_node[0] - node[0]
-                        dy = triangle_node[1] - node[1]
-                        distance = (dx ** 2 + dy ** 2) ** 0.5
-                        if distance <= 100:
-                            connected_nodes.append(triangle_node)
-                
-                # Koneksi hanya ke titik tengah grid (index 10)
-                grid_node = self.positions[10]  # Titik tengah kolom kiri
-                dx = grid_node[0] - node[0]
-                dy = grid_node[1] - node[1]
-                distance = (dx ** 2 + dy ** 2) ** 0.5
-                if distance <= 100:
-                    connected_nodes.append(grid_node)
-            
-            else:  # Segitiga kanan
-                # Koneksi ke node segitiga lain di kanan
-                for triangle_node in self.positions[31:]:
-                    if triangle_node != node:
-                        dx = triangle_node[0] - node[0]
-                        dy = triangle_node[1] - node[1]
-                        distance = (dx ** 2 + dy ** 2) ** 0.5
-                        if distance <= 100:
-                            connected_nodes.append(triangle_node)
-                
-                # Koneksi hanya ke titik tengah grid (index 14)
-                grid_node = self.positions[14]  # Titik tengah kolom kanan
-                dx = grid_node[0] - node[0]
-                dy = grid_node[1] - node[1]
-                distance = (dx ** 2 + dy ** 2) ** 0.5
-                if distance <= 100:
-                    connected_nodes.append(grid_node)
-        
-        # Filter gerakan valid berdasarkan aturan permainan
-        for target_node in connected_nodes:
-            if target_node not in self.macan_piece:  # Tidak bisa ke posisi macan lain
-                if node in self.macan_piece:  # Logika untuk Macan
-                    if target_node not in self.manusia_pieces:
-                        valid_moves.append((target_node, None))
-                    else:  # Cek lompatan untuk makan
-                        dx = target_node[0] - node[0]
-                        dy = target_node[1] - node[1]
-                        jump_x = target_node[0] + dx
-                        jump_y = target_node[1] + dy
-                        
-                        # Cari node untuk lompatan
-                        for jump_node in self.positions:
-                            if (abs(jump_node[0] - jump_x) < 20 and 
-                                abs(jump_node[1] - jump_y) < 20 and
-                                jump_node not in self.manusia_pieces and
-                                jump_node not in self.macan_piece):
-                                valid_moves.append((jump_node, target_node))
-                
-                else:  # Logika untuk Manusia
-                    if target_node not in self.manusia_pieces:
-                        valid_moves.append((target_node, None))
-        
-        return valid_moves
-
-    def _has_diagonal_lines(self, row, col):
-        """Cek apakah posisi memiliki garis diagonal."""
-        # Posisi dalam grid 5x5 yang memiliki garis diagonal
-        diagonal_positions = [
-            # Baris pertama (indeks 0)
-            (0, 0), (0, 2), (0, 4),
-            # Baris kedua (indeks 1)
-            (1, 1), (1, 3),
-            # Baris ketiga (indeks 2)
-            (2, 0), (2, 2), (2, 4),
-            # Baris keempat (indeks 3)
-            (3, 1), (3, 3),
-            # Baris kelima (indeks 4)
-            (4, 0), (4, 2), (4, 4)
-        ]
-        
-        # Periksa posisi dalam grid 5x5
-        if (row, col) in diagonal_positions:
-            return True
-            
-        # Periksa area segitiga kiri dan kanan
-        node_index = row * 5 + col
-        if node_index >= len(self.positions):  # Node berada di area segitiga
-            node = self.positions[node_index]
-            # Area segitiga kiri
-            if 100 <= node[0] <= 200 and 150 <= node[1] <= 250:
-                return True
-            # Area segitiga kanan
-            if 600 <= node[0] <= 700 and 150 <= node[1] <= 250:
-                return True
-            
+        return self.state.get_valid_moveable_positions(node)
 
     def _is_valid_position(self, row, col, current_node, dx, dy):
         """Cek apakah posisi valid dalam papan permainan."""
@@ -481,58 +332,23 @@ class GameLogic:
 
     def move_piece(self, selected_piece, target_node):
         """Pindahkan pion yang dipilih ke target node dengan kemampuan makan untuk macan."""
-        valid_moves = self.get_valid_moveable_positions(selected_piece)
-        valid_targets = [move[0] for move in valid_moves]
-        
-        if target_node not in valid_targets:
-            print("Gerakan tidak valid!")
+        if not self.state.move_piece(selected_piece, target_node):
+            print(self.state.last_error)
             self.selected_piece = None
             self.canvas.delete("highlight")
             return False
 
-        # Cari apakah ada pion yang dimakan
-        eaten_piece = None
-        for move in valid_moves:
-            if move[0] == target_node:
-                eaten_piece = move[1]
-                break
-
         # Hapus pion yang dimakan (jika ada)
+        eaten_piece = self.state.last_capture
         if eaten_piece:
-            self.manusia_pieces.remove(eaten_piece)
-            self.canvas.create_oval(
-                eaten_piece[0] - 8, eaten_piece[1] - 8,
-                eaten_piece[0] + 8, eaten_piece[1] + 8,
-                fill="black"
-            )
+            self._delete_piece_item(eaten_piece)
 
-        # Lakukan perpindahan pion
-        piece_color = "blue" if selected_piece in self.manusia_pieces else "red"
-        
-        # Hapus pion dari posisi lama
-        self.canvas.create_oval(
-            selected_piece[0] - 8, selected_piece[1] - 8,
-            selected_piece[0] + 8, selected_piece[1] + 8,
-            fill="black"
-        )
+        # Geser item pion yang sama ke posisi baru
+        self._move_piece_item(selected_piece, target_node)
 
-        # Gambar pion di posisi baru
-        self.canvas.create_oval(
-            target_node[0] - 8, target_node[1] - 8,
-            target_node[0] + 8, target_node[1] + 8,
-            fill=piece_color
-        )
-
-        # Update posisi pion
-        if selected_piece in self.manusia_pieces:
-            self.manusia_pieces.remove(selected_piece)
-            self.manusia_pieces.append(target_node)
-        else:  # Macan
-            macan_index = self.macan_piece.index(selected_piece)
-            self.macan_piece[macan_index] = target_node
-
-        # Cek kondisi menang setelah gerakan
-        self.check_win_condition()
+        # Tampilkan layar game over jika gerakan ini mengakhiri permainan
+        if self.game_over:
+            self.show_game_over()
 
         # Reset selection dan hapus highlight
         self.selected_piece = None
@@ -540,40 +356,35 @@ class GameLogic:
 
         return True
 
+    def _create_piece_item(self, node, color):
+        self.piece_items[node] = self.canvas.create_oval(
+            node[0] - PIECE_RADIUS, node[1] - PIECE_RADIUS,
+            node[0] + PIECE_RADIUS, node[1] + PIECE_RADIUS,
+            fill=color, tags="piece"
+        )
+
+    def _move_piece_item(self, node, target_node):
+        item = self.piece_items.pop(node)
+        self.canvas.coords(
+            item,
+            target_node[0] - PIECE_RADIUS, target_node[1] - PIECE_RADIUS,
+            target_node[0] + PIECE_RADIUS, target_node[1] + PIECE_RADIUS,
+        )
+        self.piece_items[target_node] = item
+
+    def _delete_piece_item(self, node):
+        item = self.piece_items.pop(node, None)
+        if item is not None:
+            self.canvas.delete(item)
+
     def check_win_condition(self):
         """Cek kondisi menang untuk kedua pemain."""
-        # Track jumlah maksimal pion manusia yang pernah ada
-        if len(self.manusia_pieces) > self._max_manusia_count:
-            self._max_manusia_count = len(self.manusia_pieces)
-        
-        # Jika sudah pernah mencapai 8 pion, set flag
-        if self._max_manusia_count >= 8:
-            self._reached_max_manusia = True
-            # Setelah mencapai 8, pion hanya bisa bergerak
-            self.current_phase = "movement"
-
-        # Cek kondisi menang
-        if self._reached_max_manusia:  # Hanya cek setelah pernah mencapai 8 pion
-            if len(self.manusia_pieces) <= 3:  # Manusia kalah jika tersisa 3 atau kurang
-                self.game_over = True
-                self.winner = "Macan"
-                self.show_game_over()
-            elif self.is_macan_trapped():  # Macan kalah jika terkepung
-                self.game_over = True
-                self.winner = "Manusia"
-                self.show_game_over()
+        if self.state.check_win_condition():
+            self.show_game_over()
 
     def is_macan_trapped(self):
         """Cek apakah semua macan terkepung dan tidak bisa bergerak."""
-        if not self.macan_piece:  # Jika tidak ada macan
-            return False
-        
-        # Cek apakah ada macan yang bisa bergerak
-        for macan in self.macan_piece:
-            valid_moves = self.get_valid_moveable_positions(macan)
-            if len(valid_moves) > 0:
-                return False
-        return True
+        return self.state.is_macan_trapped()
 
     def show_game_over(self):
         """Tampilkan layar game over."""
@@ -654,47 +465,61 @@ class GameLogic:
             self.canvas.tag_bind(menu_btn, "<Button-1>", self.back_to_menu)
             self.canvas.tag_bind(menu_text, "<Button-1>", self.back_to_menu)
 
+    def cancel_ai_move(self):
+        """Batalkan pencarian AI yang sedang berjalan (restart / kembali ke menu)."""
+        if self._ai_poll_id is not None:
+            self.canvas.after_cancel(self._ai_poll_id)
+            self._ai_poll_id = None
+        if self.ai_worker is not None:
+            self.ai_worker.cancel()
+
+    def _create_ai(self):
+        """Engine untuk pihak yang dimainkan AI (lawan dari pilihan pemain)."""
+        ai_side = "Macan" if self.player_choice == "Manusia" else "Manusia"
+        if AI_ENGINES[ai_side] == "mcts":
+            return MCTSAI(self.state, AI_TIME_LIMIT_MS)
+        return MacananAI(self.state, AI_TIME_LIMIT_MS, AI_WORKERS)
+
     def restart_game(self, event=None):
         """Mulai permainan baru dengan pilihan yang sama."""
+        self.cancel_ai_move()
+
         # Hapus semua elemen game over
         self.canvas.delete("game_over")
         
         # Reset semua variabel game
-        self.manusia_pieces = []
-        self.macan_piece = []
-        self.current_phase = "placement"
+        self.state.reset()
         self.selected_piece = None
-        self.current_player = "Macan"
-        self.turn_count = 0
-        self.game_over = False
-        self.winner = None
+        self.piece_items = {}
         self.game_over_label = None
-        self._reached_max_manusia = False
-        self._max_manusia_count = 0
+        if self.ai is not None:
+            self.ai.reset()
 
-        # Hapus semua pion dari papan
-        self.canvas.delete("all")
-        
-        # Gambar ulang papan dan label
-        from draw_board import draw_board
-        draw_board(self.canvas, 400, 200)
-        
-        self.turn_label = self.canvas.create_text(
-            250, 20, 
-            text="Turn 1: Letakkan pion Macan pertama", 
-            font=("Arial", 14), 
-            fill="black"
-        )
+        # Papan statis dan geometrinya dipakai ulang; cukup hapus pion dan highlight
+        self.canvas.delete("piece", "highlight")
+        self.canvas.itemconfig(self.turn_label, text=INITIAL_TURN_TEXT)
 
         # Jika player memilih manusia, buat AI langsung bergerak
         if self.player_choice == "Manusia":
             self.make_ai_move()
 
+    def clear(self):
+        """Hentikan AI dan hapus semua item permainan ini, papan statis tetap di canvas."""
+        self.cancel_ai_move()
+        if self.ai is not None:
+            self.ai.close()  # Proses pencarian paralel tidak dibiarkan hidup
+        self.canvas.delete(*GAME_TAGS)
+        self.piece_items = {}
+
     def back_to_menu(self, event=None):
         """Kembali ke menu utama."""
+        if self.on_menu is not None:
+            self.on_menu()
+            return
+
         # Hapus semua elemen game
-        self.canvas.delete("all")
-        
+        self.clear()
+
         # Import dan tampilkan menu
         from catur_macanan import show_start_screen
         root = self.canvas.winfo_toplevel()
@@ -706,13 +531,20 @@ class GameLogic:
             return
 
         max_attempts = 5
-        for _ in range(max_attempts):
+        for attempt in range(max_attempts):
             if self.turn_count <= 3:  # Fase penempatan awal
                 available_positions = [pos for pos in self.positions[:25]  # Hanya posisi 0-24
                                      if pos not in self.manusia_pieces 
                                      and pos not in self.macan_piece]
                 if available_positions:
-                    pos = random.choice(available_positions)
+                    # Pakai buku pembukaan jika ada; selain itu acak
+                    book_move = None
+                    if attempt == 0:
+                        book_move = self.ai.get_book_move(self.current_player == "Macan", self.state)
+                    if book_move is not None and book_move[1] in available_positions:
+                        pos = book_move[1]
+                    else:
+                        pos = random.choice(available_positions)
                     success = False
                     
                     if self.current_player == "Macan":
@@ -730,46 +562,65 @@ class GameLogic:
                         self.update_turn_label()
                         return
             else:  # Turn 4+
-                from ai_logic import MacananAI
-                ai = MacananAI(self)
-                is_macan = self.player_choice == "Manusia"
-
                 # Track jumlah maksimal pion manusia
-                if len(self.manusia_pieces) > self._max_manusia_count:
-                    self._max_manusia_count = len(self.manusia_pieces)
-                if self._max_manusia_count >= 8:
-                    self._reached_max_manusia = True
-
-                # Jika manusia sudah pernah mencapai 8, harus bergerak
-                if not is_macan and self._reached_max_manusia:
-                    best_move = ai.get_movement_move(False)
-                else:
-                    best_move = ai.get_best_move(is_macan)
+                self.state.update_manusia_tracking()
 
-                if best_move:
-                    from_pos, to_pos = best_move
-                    success = False
+                # Cari gerakan di thread terpisah agar GUI tetap responsif
+                self._ai_attempts = max_attempts
+                self._start_ai_search()
+                return
 
-                    # Jika AI adalah manusia dan belum pernah mencapai 8 pion
-                    if from_pos is None and not is_macan and not self._reached_max_manusia:
-                        success = self.place_manusia(to_pos)
-                        if success:
-                            self.current_player = "Macan"
-                            self.turn_count += 1
-                    # Jika AI adalah macan atau manusia yang sudah harus bergerak
-                    else:
-                        self.selected_piece = from_pos
-                        success = self.move_piece(from_pos, to_pos)
-                        if success:
-                            self.current_player = "Manusia" if self.current_player == "Macan" else "Macan"
-                            self.turn_count += 1
-                    
-                    if success:
-                        self.update_turn_label()
-                        return
+            print("AI tidak dapat menemukan gerakan valid setelah beberapa percobaan")
 
+    def _start_ai_search(self):
+        """Mulai pencarian AI di background dan jadwalkan poll hasilnya."""
+        is_macan = self.player_choice == "Manusia"
+        self.ai_worker.start(self.state, is_macan)
+        self._ai_poll_id = self.canvas.after(AI_POLL_INTERVAL_MS, self._poll_ai_move)
+
+    def _poll_ai_move(self):
+        """Dipanggil dari loop Tkinter; terapkan gerakan AI jika pencarian selesai."""
+        self._ai_poll_id = None
+        ready, best_move = self.ai_worker.poll()
+        if not ready:
+            self._ai_poll_id = self.canvas.after(AI_POLL_INTERVAL_MS, self._poll_ai_move)
+            return
+
+        if self.game_over:
+            return
+        if best_move and self._apply_ai_move(best_move):
+            return
+
+        self._ai_attempts -= 1
+        if self._ai_attempts > 0:
+            self._start_ai_search()
+        else:
             print("AI tidak dapat menemukan gerakan valid setelah beberapa percobaan")
 
+    def _apply_ai_move(self, best_move):
+        """Terapkan gerakan hasil pencarian AI ke papan."""
+        is_macan = self.player_choice == "Manusia"
+        from_pos, to_pos = best_move
+        success = False
+
+        # Jika AI adalah manusia dan belum pernah mencapai 8 pion
+        if from_pos is None and not is_macan and not self._reached_max_manusia:
+            success = self.place_manusia(to_pos)
+            if success:
+                self.current_player = "Macan"
+                self.turn_count += 1
+        # Jika AI adalah macan atau manusia yang sudah harus bergerak
+        else:
+            self.selected_piece = from_pos
+            success = self.move_piece(from_pos, to_pos)
+            if success:
+                self.current_player = "Manusia" if self.current_player == "Macan" else "Macan"
+                self.turn_count += 1
+
+        if success:
+            self.update_turn_label()
+        return success
+
     def can_player_move_piece(self, piece):
         """Cek apakah player bisa menggerakkan pion tersebut."""
         if self.mode == "PVP":
@@ -0,0 +1,195 @@
+"""Rekaman permainan ringkas: satu byte per gerakan, ditulis bertahap ke satu file.
+
+Format file: header MAGIC + jumlah node papan (uint8), lalu permainan berurutan. Setiap
+permainan diawali jumlah ply (uint16) dan hasil (uint8: 0 seri/terhenti, 1 Macan,
+2 Manusia), diikuti satu byte per gerakan.
+
+Byte gerakan adalah urutan (from, to) di antara gerakan legal posisi saat itu, diurutkan
+menurut indeks node (penempatan lebih dulu). Pasangan (from, to) yang mungkin di papan
+ini lebih dari 256, tetapi gerakan legal satu posisi selalu jauh lebih sedikit, sehingga
+satu byte cukup dan rekaman yang dibaca ulang pasti legal.
+
+Contoh:
+    with GameRecordWriter("selfplay.rec") as writer:
+        writer.write_game(state.history, state.winner)
+    for result, data in read_games("selfplay.rec"):
+        state = replay(data, ply=10)
+"""
+import mmap
+import os
+import struct
+
+from bitboard import Bitboard
+from board_state import BoardState
+
+MAGIC = b"MCNREC01"
+HEADER = struct.Struct("<8sB")
+GAME = struct.Struct("<HB")
+RESULTS = (None, "Macan", "Manusia")
+MAX_PLIES = 0xFFFF
+
+
+def _move_order(move):
+    from_index, to_index = move
+    return (-1 if from_index is None else from_index, to_index)
+
+
+_initial_boards = {}
+
+
+def _initial_board(topology):
+    """Bitboard posisi awal baru (salinan dari cache per topologi)."""
+    board = _initial_boards.get(topology)
+    if board is None:
+        board = Bitboard.from_state(BoardState(topology.positions))
+        _initial_boards[topology] = board
+    return board.copy()
+
+
+def _sorted_moves(board):
+    moves = board.legal_moves()
+    moves.sort(key=_move_order)
+    return moves
+
+
+class MoveEncoder:
+    """Pengubah gerakan (from, to) menjadi byte secara bertahap, dengan bitboard sendiri."""
+
+    def __init__(self, topology):
+        self.topology = topology
+        self.reset()
+
+    def reset(self):
+        self.board = _initial_board(self.topology)
+        self.data = bytearray()
+
+    def encode(self, move):
+        """Tambahkan satu gerakan indeks ke data; ValueError jika tidak legal."""
+        moves = _sorted_moves(self.board)
+        try:
+            code = moves.index(tuple(move))
+        except ValueError:
+            raise ValueError(f"Gerakan tidak legal untuk direkam: {move}") from None
+        self.board.make_move(moves[code])
+        self.data.append(code)
+        return code
+
+
+def encode_moves(moves, topology):
+    """Byte rekaman untuk daftar gerakan indeks (from, to) dari posisi awal."""
+    encoder = MoveEncoder(topology)
+    for move in moves:
+        encoder.encode(move)
+    return bytes(encoder.data)
+
+
+def decode_moves(data, topology, ply=None):
+    """Daftar gerakan indeks (from, to) dari byte rekaman, opsional hanya ply pertama."""
+    board = _initial_board(topology)
+    moves = []
+    for code in data[:ply]:
+        move = _sorted_moves(board)[code]
+        board.make_move(move)
+        moves.append(move)
+    return moves
+
+
+def replay_boards(data, topology):
+    """Iterasi Bitboard setelah setiap gerakan rekaman (satu objek yang diperbarui di tempat)."""
+    board = _initial_board(topology)
+    for code in data:
+        board.make_move(_sorted_moves(board)[code])
+        yield board
+
+
+def replay(data, ply=None, positions=None):
+    """BoardState setelah ply gerakan pertama rekaman (semua jika None), tanpa GUI."""
+    state = BoardState(positions)
+    pixels = state.positions
+    for from_index, to_index in decode_moves(data, state.topology, ply):
+        if not state.apply_move((None if from_index is None else pixels[from_index], pixels[to_index])):
+            raise ValueError(f"Rekaman tidak cocok dengan aturan papan: {state.last_error}")
+    return state
+
+
+class GameRecordWriter:
+    """Penulis file rekaman; permainan ditambahkan ke akhir file (mode append).
+
+    Gerakan bisa ditambahkan satu per satu dengan add_move lalu end_game, atau satu
+    permainan utuh sekaligus dengan write_game / write_encoded.
+    """
+
+    def __init__(self, path, positions=None):
+        self.topology = BoardState(positions).topology
+        self.path = path
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(MAGIC, self.topology.size))
+        else:
+            _check_header(path, self.topology.size)
+        self._encoder = MoveEncoder(self.topology)
+        self.games = 0
+
+    def add_move(self, move):
+        """Rekam satu gerakan indeks (from, to) permainan yang sedang berjalan."""
+        self._encoder.encode(move)
+
+    def end_game(self, winner=None):
+        """Tutup permainan yang sedang berjalan dan tulis ke file."""
+        self.write_encoded(self._encoder.data, winner)
+        self._encoder.reset()
+
+    def write_game(self, moves, winner=None):
+        """Tulis satu permainan utuh dari daftar gerakan indeks (misalnya BoardState.history)."""
+        self.write_encoded(encode_moves(moves, self.topology), winner)
+
+    def write_encoded(self, data, winner=None):
+        """Tulis satu permainan yang sudah dikodekan (encode_moves)."""
+        if len(data) > MAX_PLIES:
+            raise ValueError(f"Permainan terlalu panjang untuk direkam: {len(data)} ply")
+        self._file.write(GAME.pack(len(data), RESULTS.index(winner)))
+        self._file.write(data)
+        self.games += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _check_header(path, size):
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    if len(header) != HEADER.size or HEADER.unpack(header) != (MAGIC, size):
+        raise ValueError(f"Format rekaman permainan tidak dikenal: {path}")
+
+
+def read_games(path):
+    """Iterasi (pemenang, byte gerakan) untuk setiap permainan di file rekaman.
+
+    File di-mmap dan setiap permainan hanya diiris, jadi membaca jutaan permainan tidak
+    perlu memuat seluruh file; dekode gerakan (decode_moves/replay) hanya jika perlu.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"Format rekaman permainan tidak dikenal: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, _ = HEADER.unpack_from(data, 0)
+            if magic != MAGIC:
+                raise ValueError(f"Format rekaman permainan tidak dikenal: {path}")
+            offset = HEADER.size
+            end = len(data)
+            while offset + GAME.size <= end:
+                plies, result = GAME.unpack_from(data, offset)
+                offset += GAME.size
+                if offset + plies > end:
+                    break  # Permainan terakhir terpotong (penulisan terhenti)
+                yield RESULTS[result], data[offset:offset + plies]
+                offset += plies
@@ -0,0 +1,209 @@
+"""Engine Monte Carlo Tree Search (UCT) sebagai alternatif MacananAI.
+
+Antarmukanya sama dengan MacananAI (choose_move, reset, close, get_book_move, nodes), sehingga
+GameLogic, AIWorker dan selfplay bisa memakai salah satunya untuk tiap pihak.
+Simulasi berjalan di Bitboard dengan make/unmake, tanpa GUI maupun BoardState.
+"""
+import math
+import random
+import time
+
+from ai_logic import SearchCancelled
+from bitboard import Bitboard, MACAN, MANUSIA
+from board_topology import get_topology
+
+EXPLORATION = 1.4  # Konstanta eksplorasi UCT (sekitar sqrt(2))
+PLAYOUT_LIMIT = 80  # Ply maksimal satu playout sebelum dinilai dengan heuristik
+CAPTURE_BIAS = 0.8  # Peluang macan memilih makan jika ada saat playout heuristik
+CAPTURE_VALUE = 0.1  # Nilai tambahan macan per pion yang dimakan di playout tanpa pemenang
+DEFAULT_PLAYOUTS = 2000  # Anggaran playout jika tidak ada batas waktu
+STOP_CHECK_INTERVAL = 64  # Cek waktu/pembatalan setiap sekian playout
+
+
+class Node:
+    """Simpul pohon: statistik dari sudut pandang pihak yang melangkah ke simpul ini."""
+
+    __slots__ = ("move", "parent", "side", "hash", "children", "untried", "visits", "value")
+
+    def __init__(self, move, parent, side, position_hash, moves):
+        self.move = move  # Gerakan (indeks) dari parent ke simpul ini
+        self.parent = parent
+        self.side = side  # Pihak yang jalan di simpul ini
+        self.hash = position_hash
+        self.children = []
+        self.untried = moves  # Gerakan yang belum diekspansi (makan di belakang, dipop dulu)
+        self.visits = 0
+        self.value = 0.0  # Jumlah hasil bagi pihak yang melangkah ke simpul ini
+
+    def select_child(self, exploration):
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.value / child.visits
+                   + exploration * math.sqrt(log_visits / child.visits))
+
+
+class MCTSAI:
+    """Pencarian UCT dengan playout acak atau heuristik (makan didahulukan).
+
+    Anggaran per gerakan berupa batas waktu (time_limit_ms) atau jumlah playout.
+    Pohon dipertahankan antar giliran: jika posisi baru ada di bawah akar lama
+    (gerakan sendiri lalu jawaban lawan), subpohon itu menjadi akar baru.
+    """
+
+    def __init__(self, game_logic, time_limit_ms=None, playouts=DEFAULT_PLAYOUTS,
+                 heuristic_playouts=True, seed=None):
+        self.game_logic = game_logic
+        self.time_limit_ms = time_limit_ms
+        self.playouts = playouts
+        self.heuristic_playouts = heuristic_playouts
+        self.exploration = EXPLORATION
+        self.topology = get_topology(game_logic.positions)
+        self.rng = random.Random(seed)
+        self.board = Bitboard.from_state(game_logic)
+        self.root = None
+        self.nodes = 0  # Jumlah playout pada pencarian terakhir
+        self.move_history = []
+        self.stop_event = None
+
+    def reset(self):
+        """Mulai sesi baru: buang pohon dan riwayat (dipanggil saat restart)."""
+        self.root = None
+        self.move_history = []
+
+    def close(self):
+        """Akhiri sesi; MCTSAI tidak memegang proses atau file, cukup buang pohon."""
+        self.reset()
+
+    def get_book_move(self, is_macan, state=None):
+        """MCTS tidak memakai buku pembukaan; penempatan awal diserahkan ke pemanggil."""
+        return None
+
+    def choose_move(self, is_macan, state=None, stop_event=None):
+        """Pilih gerakan untuk giliran saat ini (tuple piksel), atau None jika tidak ada."""
+        if state is not None:
+            self.game_logic = state
+        self.stop_event = stop_event
+        self.board = Bitboard.from_state(self.game_logic)
+        side = MACAN if is_macan else MANUSIA
+        self.board.set_side(side)
+
+        root = self._find_root()
+        if not root.children and not root.untried:
+            return None
+        self.root = root
+        self.search(root)
+
+        best = max(root.children, key=lambda child: child.visits)
+        self.move_history.append(best.move)
+        from_index, to_index = best.move
+        positions = self.topology.positions
+        return (positions[from_index] if from_index is not None else None, positions[to_index])
+
+    def _find_root(self):
+        """Pakai ulang subpohon yang cocok dengan posisi sekarang, atau buat akar baru."""
+        position_hash = self.board.hash
+        if self.root is not None:
+            frontier = [self.root]
+            for _ in range(3):  # Akar lama, setelah gerakan sendiri, setelah jawaban lawan
+                for node in frontier:
+                    if node.hash == position_hash:
+                        node.parent = None
+                        node.move = None
+                        return node
+                frontier = [child for node in frontier for child in node.children]
+        return Node(None, None, self.board.side, position_hash, self._expansion_moves())
+
+    def _expansion_moves(self):
+        """Gerakan legal posisi bitboard; kosong jika permainan sudah selesai."""
+        if self.board.winner() is not None:
+            return []
+        moves = self.board.legal_moves()
+        self.rng.shuffle(moves)
+        if self.board.side == MACAN:
+            # Makan dipop lebih dulu saat ekspansi
+            moves.sort(key=lambda move: self.board.captured_by(move) is not None)
+        return moves
+
+    def search(self, root):
+        """Jalankan playout sampai anggaran waktu atau jumlah playout habis."""
+        deadline = None
+        if self.time_limit_ms is not None:
+            deadline = time.perf_counter() + self.time_limit_ms / 1000.0
+        self.nodes = 0
+        while True:
+            self._iterate(root)
+            self.nodes += 1
+            if self.nodes % STOP_CHECK_INTERVAL == 0:
+                if self.stop_event is not None and self.stop_event.is_set():
+                    raise SearchCancelled()
+            if deadline is not None:
+                if time.perf_counter() >= deadline:
+                    break
+            elif self.nodes >= self.playouts:
+                break
+
+    def _iterate(self, root):
+        """Satu iterasi: seleksi, ekspansi, playout, lalu propagasi balik."""
+        board = self.board
+        undos = []
+        node = root
+        while not node.untried and node.children:
+            node = node.select_child(self.exploration)
+            undos.append(board.make_move(node.move))
+        if node.untried:
+            move = node.untried.pop()
+            undos.append(board.make_move(move))
+            child = Node(move, node, board.side, board.hash, self._expansion_moves())
+            node.children.append(child)
+            node = child
+
+        macan_value = self._playout()
+        for undo in reversed(undos):
+            board.unmake_move(undo)
+
+        while node is not None:
+            node.visits += 1
+            if node.parent is not None:
+                # Nilai dilihat dari pihak yang melangkah ke simpul ini (pihak yang jalan di parent)
+                node.value += macan_value if node.parent.side == MACAN else 1.0 - macan_value
+            node = node.parent
+
+    def _playout(self):
+        """Mainkan gerakan acak sampai selesai atau PLAYOUT_LIMIT; kembalikan nilai bagi macan."""
+        board = self.board
+        rng = self.rng
+        captured = 0
+        undos = []
+        value = None
+        for _ in range(PLAYOUT_LIMIT):
+            winner = board.winner()
+            if winner is not None:
+                value = 1.0 if winner == "Macan" else 0.0
+                break
+            moves = board.legal_moves()
+            if not moves:  # Pihak yang jalan tidak bisa bergerak: kalah
+                value = 0.0 if board.side == MACAN else 1.0
+                break
+            move = None
+            if self.heuristic_playouts and board.side == MACAN and rng.random() < CAPTURE_BIAS:
+                captures = board.capture_moves()
+                if captures:
+                    from_index, landing, _ = rng.choice(captures)
+                    move = (from_index, landing)
+            if move is None:
+                move = rng.choice(moves)
+            undo = board.make_move(move)
+            if undo[4] is not None:  # Pion manusia dimakan
+                captured += 1
+            undos.append(undo)
+        else:
+            winner = board.winner()
+            if winner is not None:
+                value = 1.0 if winner == "Macan" else 0.0
+
+        if value is None:
+            # Tanpa pemenang: seri, digeser oleh jumlah pion yang dimakan selama playout
+            value = 0.5 + CAPTURE_VALUE * captured
+            value = min(1.0, max(0.0, value))
+        for undo in reversed(undos):
+            board.unmake_move(undo)
+        return value
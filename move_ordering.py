@@ -0,0 +1,75 @@
+from bitboard import MACAN
+
+KILLER_SLOTS = 2  # Jumlah killer move yang disimpan per ply
+
+
+class MoveOrderer:
+    """Urutan gerakan untuk alpha-beta: makan, hash move, killer move, lalu history.
+
+    Killer move disimpan per ply (gerakan tenang yang memotong cabang saudara).
+    Tabel history dikunci (from, to) per pihak dan bertambah depth^2 setiap kali
+    gerakan tenang menyebabkan cutoff; nilainya dibagi dua di awal setiap pencarian.
+    """
+
+    def __init__(self):
+        self.killers = []
+        self.history = ({}, {})  # Per pihak (MACAN, MANUSIA): (from, to) -> skor
+
+    def clear(self):
+        self.killers = []
+        self.history = ({}, {})
+
+    def new_search(self):
+        """Killer dari gerakan sebelumnya tidak berlaku lagi; history dipertahankan tapi dilemahkan."""
+        self.killers = []
+        for table in self.history:
+            for move in list(table):
+                score = table[move] >> 1
+                if score:
+                    table[move] = score
+                else:
+                    del table[move]
+
+    def _killers_at(self, ply):
+        while len(self.killers) <= ply:
+            self.killers.append([])
+        return self.killers[ply]
+
+    def order(self, board, moves, side, ply, hash_move=None):
+        """Kembalikan moves dalam urutan yang sebaiknya dicoba."""
+        captures = []
+        if side == MACAN:
+            threats = {(from_index, landing) for from_index, landing, _ in board.capture_moves()}
+            if threats:
+                captures = [move for move in moves if move in threats]
+                if hash_move in threats and hash_move in moves:
+                    captures.remove(hash_move)
+                    captures.insert(0, hash_move)
+
+        ordered = list(captures)
+        taken = set(captures)
+        if hash_move is not None and hash_move not in taken and hash_move in moves:
+            ordered.append(hash_move)
+            taken.add(hash_move)
+        if ply < len(self.killers):
+            for killer in self.killers[ply]:
+                if killer not in taken and killer in moves:
+                    ordered.append(killer)
+                    taken.add(killer)
+
+        history = self.history[side]
+        quiet = [move for move in moves if move not in taken]
+        quiet.sort(key=lambda move: history.get(move, 0), reverse=True)
+        ordered.extend(quiet)
+        return ordered
+
+    def record_cutoff(self, board, move, side, ply, depth):
+        """Catat gerakan yang menyebabkan beta cutoff (makan tidak dicatat)."""
+        if side == MACAN and board.captured_by(move) is not None:
+            return
+        killers = self._killers_at(ply)
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[KILLER_SLOTS:]
+        history = self.history[side]
+        history[move] = history.get(move, 0) + depth * depth
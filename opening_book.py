@@ -0,0 +1,166 @@
+"""Buku pembukaan untuk fase penempatan, disimpan sebagai file biner terurut.
+
+Format file: header MAGIC + jumlah entri (uint32), lalu entri berukuran tetap
+(kunci uint64, from uint8, to uint8, skor int16) terurut menurut kunci. File
+di-mmap dan dicari dengan binary search, jadi tidak perlu dimuat ke memori.
+
+Kunci adalah hash kanonik (Bitboard.canonical_key): posisi dan cerminnya berbagi
+satu entri, dan gerakannya disimpan dalam bingkai kanonik.
+
+Membangun buku (self-play dengan pencarian dalam):
+    python opening_book.py --games 300 --depth 5 --out opening_book.bin
+"""
+import argparse
+import mmap
+import os
+import random
+import struct
+
+from bitboard import Bitboard, MACAN
+from symmetry import get_board_symmetry
+
+MAGIC = b"MCNBOOK2"
+HEADER = struct.Struct("<8sI")
+ENTRY = struct.Struct("<QBBh")
+NO_SOURCE = 0xFF  # Nilai from untuk gerakan penempatan
+SCORE_LIMIT = 32767
+DEFAULT_BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "opening_book.bin")
+
+
+def book_key(board):
+    """(kunci buku, indeks simetri) untuk posisi bitboard; lihat Bitboard.canonical_key."""
+    return board.canonical_key()
+
+
+def in_opening(board):
+    """Posisi masih di fase pembukaan: penempatan awal atau manusia belum mencapai 8 pion."""
+    return board.turn_count <= 3 or not board.reached_max_manusia
+
+
+class OpeningBook:
+    """Pembaca buku pembukaan berbasis mmap."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # File kosong tidak bisa di-mmap
+            self._file.close()
+            raise ValueError(f"Buku pembukaan kosong: {path}")
+        magic, self.count = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or len(self._data) != HEADER.size + self.count * ENTRY.size:
+            self.close()
+            raise ValueError(f"Format buku pembukaan tidak dikenal: {path}")
+
+    def __len__(self):
+        return self.count
+
+    def _key_at(self, i):
+        return struct.unpack_from("<Q", self._data, HEADER.size + i * ENTRY.size)[0]
+
+    def probe(self, key):
+        """Cari kunci; kembalikan ((from, to), skor) dalam indeks node, atau None."""
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            if self._key_at(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low == self.count:
+            return None
+        entry_key, from_index, to_index, score = ENTRY.unpack_from(self._data, HEADER.size + low * ENTRY.size)
+        if entry_key != key:
+            return None
+        return (None if from_index == NO_SOURCE else from_index, to_index), score
+
+    def close(self):
+        self._data.close()
+        self._file.close()
+
+
+_book_cache = {}
+
+
+def get_opening_book(path=DEFAULT_BOOK_PATH):
+    """Buku pembukaan di path (dibuka sekali per proses), atau None jika tidak ada/rusak."""
+    if path not in _book_cache:
+        try:
+            _book_cache[path] = OpeningBook(path)
+        except (OSError, ValueError):
+            _book_cache[path] = None
+    return _book_cache[path]
+
+
+def write_book(path, entries):
+    """Tulis dict kunci -> ((from, to), skor) sebagai file buku terurut."""
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(entries)))
+        for key in sorted(entries):
+            (from_index, to_index), score = entries[key]
+            score = max(-SCORE_LIMIT, min(SCORE_LIMIT, int(round(score))))
+            f.write(ENTRY.pack(key, NO_SOURCE if from_index is None else from_index, to_index, score))
+
+
+def build_book(games, depth, time_limit_ms=None, explore=0.3, seed=0, log=None):
+    """Bangun entri buku dengan self-play: setiap posisi pembukaan baru dicari sedalam depth.
+
+    Gerakan yang dimainkan adalah gerakan buku, kecuali dengan peluang explore dipilih
+    gerakan legal acak agar buku mencakup lebih banyak variasi.
+    """
+    from ai_logic import MacananAI
+    from board_state import BoardState
+
+    rng = random.Random(seed)
+    entries = {}
+    ai = None
+    symmetry = None
+    for game in range(games):
+        state = BoardState()
+        while not state.game_over:
+            board = Bitboard.from_state(state)
+            if not in_opening(board):
+                break
+            moves = board.legal_moves()
+            if not moves:
+                break
+            if symmetry is None:
+                symmetry = get_board_symmetry(board.topology)
+            key, mirror = book_key(board)
+            if key not in entries:
+                if ai is None:
+                    ai = MacananAI(state, time_limit_ms)
+                ai.game_logic = state
+                ai.MAX_DEPTH = depth
+                ai.new_search()
+                ai.load_board()
+                _, best_move, best_score = ai.search_root_moves(moves, board.side == MACAN)[-1]
+                entries[key] = (symmetry.transform_move(best_move, mirror), best_score)
+            move = symmetry.transform_move(entries[key][0], symmetry.inverse[mirror])
+            if rng.random() < explore:
+                move = rng.choice(moves)
+            positions = state.positions
+            state.apply_move((None if move[0] is None else positions[move[0]], positions[move[1]]))
+        if log is not None:
+            log(f"Permainan {game + 1}/{games}: {len(entries)} posisi")
+    return entries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bangun buku pembukaan macanan dengan self-play.")
+    parser.add_argument("--games", type=int, default=200, help="jumlah permainan self-play")
+    parser.add_argument("--depth", type=int, default=5, help="kedalaman pencarian per posisi")
+    parser.add_argument("--time-ms", type=int, default=None, help="batas waktu per posisi")
+    parser.add_argument("--explore", type=float, default=0.3, help="peluang memainkan gerakan acak")
+    parser.add_argument("--seed", type=int, default=0, help="seed acak")
+    parser.add_argument("--out", default=DEFAULT_BOOK_PATH, help="file buku keluaran")
+    args = parser.parse_args(argv)
+
+    entries = build_book(args.games, args.depth, args.time_ms, args.explore, args.seed, log=print)
+    write_book(args.out, entries)
+    print(f"{len(entries)} posisi ditulis ke {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Pencarian paralel di akar untuk MacananAI memakai pool proses.
+
+Gerakan akar dibagi ke beberapa proses worker yang masing-masing menjalankan iterative
+deepening dengan batas waktu yang sama, sehingga dalam waktu berpikir yang sama setiap
+gerakan bisa dicari lebih dalam. Dipakai oleh MacananAI(workers > 1); dari baris
+perintah lewat selfplay --search-workers.
+"""
+import concurrent.futures
+import multiprocessing
+import os
+import time
+
+from ai_logic import MacananAI, SearchCancelled
+
+POLL_INTERVAL = 0.05  # Detik; seberapa sering stop_event dicek saat menunggu worker
+COLLECT_GRACE = 0.02  # Detik setelah tenggat sebelum worker yang belum selesai ditinggalkan
+RESULT_MARGIN = 0.01  # Detik sebelum tenggat saat worker berhenti, untuk mengirim hasilnya
+WORKER_TIME_CHECK = 64  # Worker lebih sering cek jam: beberapa worker bisa berbagi satu core
+TABLE_COUNTERS = ("hits", "misses", "stores", "overwrites")
+
+# MacananAI milik proses worker; dibuat sekali agar transposition table-nya
+# tetap terpakai dari satu gerakan ke gerakan berikutnya
+_worker_ai = None
+# Nomor pencarian bersama (multiprocessing.Value) yang diwarisi worker saat dibuat
+_worker_generation = None
+
+
+class _GenerationStop:
+    """Pengganti threading.Event di worker: "di-set" begitu nomor pencarian bersama berubah.
+
+    Proses utama menaikkan nomor itu untuk membatalkan pencarian, sehingga worker yang
+    sedang berjalan berhenti di cek berikutnya tanpa memengaruhi pencarian sesudahnya.
+    """
+
+    def __init__(self, generation, expected):
+        self.generation = generation
+        self.expected = expected
+
+    def is_set(self):
+        return self.generation.value != self.expected
+
+
+def _worker_ready():
+    return True
+
+
+def _init_worker(generation):
+    global _worker_generation
+    _worker_generation = generation
+
+
+def _search_subset(state, is_macan, root_moves, deadline, max_depth, generation):
+    """Jalankan iterative deepening untuk sebagian gerakan akar (di proses worker).
+
+    deadline adalah waktu time.monotonic() (jam sistem, sama di semua proses) saat
+    pencarian harus selesai, atau None untuk kedalaman tetap max_depth. Mengembalikan
+    (iterasi, node, penghitung transposition table selama pencarian ini).
+    """
+    global _worker_ai
+    if _worker_ai is None:
+        _worker_ai = MacananAI(state)
+    ai = _worker_ai
+    ai.game_logic = state
+    # Sisa waktu dihitung saat worker mulai, jadi worker yang terlambat mulai tidak melewati tenggat
+    ai.time_limit_ms = None
+    if deadline is not None:
+        ai.time_limit_ms = max(0.0, (deadline - RESULT_MARGIN - time.monotonic()) * 1000)
+    ai.TIME_CHECK_INTERVAL = WORKER_TIME_CHECK
+    ai.MAX_DEPTH = max_depth
+    ai.stop_event = _GenerationStop(_worker_generation, generation)
+    table = ai.transposition_table
+    before = [getattr(table, name) for name in TABLE_COUNTERS]
+    ai.new_search()
+    ai.load_board()
+    iterations = ai.search_root_moves(root_moves, is_macan)
+    counters = {name: getattr(table, name) - start for name, start in zip(TABLE_COUNTERS, before)}
+    return iterations, ai.nodes, counters
+
+
+class RootParallelSearch:
+    """Pencarian paralel di akar: gerakan akar dibagi ke beberapa proses.
+
+    Setiap worker menjalankan iterative deepening sampai tenggat bersama pada
+    BoardState salinan (bisa di-pickle, tanpa Tkinter). Hasil digabung secara
+    deterministik: dipakai kedalaman terdalam yang diselesaikan semua worker yang
+    menjawab, skor tertinggi menang, dan skor seri dimenangkan gerakan yang lebih
+    dulu di urutan akar. Worker yang belum menjawab COLLECT_GRACE setelah tenggat
+    dibatalkan dan gerakannya tidak ikut dipilih, sehingga latensi tetap dalam anggaran.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = None
+        self._generation = None
+        # Penghitung transposition table semua worker (lihat MacananAI.table_stats)
+        self.table_counters = dict.fromkeys(TABLE_COUNTERS, 0)
+
+    def start(self):
+        """Buat pool dan semua proses worker sekarang juga.
+
+        Panggil dari thread utama (MacananAI melakukannya saat dibuat): fork dari proses
+        yang sudah punya thread lain (thread AI, Tkinter) bisa mewarisi lock yang sedang
+        dipegang thread itu dan membuat worker macet. Pool fork meluncurkan semua
+        worker pada submit pertama, jadi satu tugas kosong sudah cukup.
+        """
+        self._get_executor().submit(_worker_ready).result()
+
+    def _get_executor(self):
+        if self._executor is None:
+            # fork menghindari impor ulang modul utama (main.py langsung membuka GUI)
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in methods else None)
+            self._generation = context.Value("i", 0, lock=False)
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=context,
+                initializer=_init_worker, initargs=(self._generation,))
+        return self._executor
+
+    def cancel(self):
+        """Minta semua worker menghentikan pencarian yang sedang berjalan."""
+        if self._generation is not None:
+            self._generation.value += 1
+
+    def search(self, ai, root_moves, is_macan):
+        """Cari gerakan akar terbaik untuk posisi ai.game_logic; kembalikan gerakan indeks."""
+        deadline = None
+        if ai.time_limit_ms is not None:
+            deadline = time.monotonic() + ai.time_limit_ms / 1000.0
+
+        # Urutkan dulu dengan evaluasi cepat lalu bagi bergantian,
+        # agar setiap worker mendapat campuran gerakan bagus dan buruk
+        ordered = sorted(root_moves, key=lambda move: ai._quick_evaluate_move(move, is_macan),
+                         reverse=True)
+        order = {move: i for i, move in enumerate(ordered)}
+        chunks = [ordered[i::self.workers] for i in range(self.workers)]
+        chunks = [chunk for chunk in chunks if chunk]
+
+        state = ai.game_logic.copy()
+        executor = self._get_executor()
+        generation = self._generation.value
+        futures = [
+            executor.submit(_search_subset, state, is_macan, chunk, deadline, ai.MAX_DEPTH, generation)
+            for chunk in chunks
+        ]
+
+        pending = set(futures)
+        while pending:
+            if ai.stop_event is not None and ai.stop_event.is_set():
+                for future in pending:
+                    future.cancel()
+                self.cancel()  # Worker yang sudah berjalan ikut berhenti
+                raise SearchCancelled()
+            timeout = POLL_INTERVAL
+            if deadline is not None:
+                remaining = deadline + COLLECT_GRACE - time.monotonic()
+                if remaining <= 0:
+                    for future in pending:
+                        future.cancel()
+                    self.cancel()  # Hasil yang terlambat tidak ditunggu
+                    break
+                timeout = min(timeout, remaining)
+            _, pending = concurrent.futures.wait(pending, timeout=timeout)
+
+        results = [future.result() for future in futures if future not in pending]
+        ai.nodes = sum(nodes for _, nodes, _ in results)
+        for _, _, counters in results:
+            for name in TABLE_COUNTERS:
+                self.table_counters[name] += counters[name]
+        if not results:
+            ai.completed_depth = 0
+            return ordered[0]  # Tidak ada worker yang menjawab tepat waktu: urutan evaluasi cepat
+
+        # Kedalaman yang diselesaikan oleh semua worker yang menjawab
+        common_depth = min(iterations[-1][0] for iterations, _, _ in results)
+        ai.completed_depth = common_depth
+
+        best_move = None
+        best_key = None
+        for iterations, _, _ in results:
+            _, move, score = iterations[common_depth - 1]
+            key = (score, -order[move])
+            if best_key is None or key > best_key:
+                best_key = key
+                best_move = move
+        return best_move
+
+    def shutdown(self):
+        if self._executor is not None:
+            self.cancel()
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
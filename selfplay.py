@@ -0,0 +1,268 @@
+"""Turnamen self-play tanpa GUI, sekaligus benchmark throughput MacananAI.
+
+Contoh:
+    python selfplay.py --games 20 --time-ms 200
+    python selfplay.py --games 50 --depth 3 --manusia random --workers 4
+    python selfplay.py --games 20 --time-ms 200 --macan mcts --manusia ai
+    python selfplay.py --games 1000 --depth 2 --record selfplay.rec
+    python selfplay.py --games 10 --time-ms 500 --search-workers 4
+"""
+import argparse
+import concurrent.futures
+import math
+import multiprocessing
+import random
+import time
+
+from ai_logic import MacananAI
+from bitboard import Bitboard
+from board_state import BoardState
+from game_record import GameRecordWriter, encode_moves
+from mcts import DEFAULT_PLAYOUTS, MCTSAI
+
+DEFAULT_MAX_TURNS = 200  # Batas turn; lebih dari ini dihitung seri
+PLAYER_TYPES = ("ai", "mcts", "random")
+
+
+class RandomPlayer:
+    """Lawan pembanding: memilih gerakan legal secara acak."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.nodes = 0
+
+    def choose_move(self, is_macan, state):
+        moves = legal_pixel_moves(state)
+        return self.rng.choice(moves) if moves else None
+
+
+def legal_pixel_moves(state):
+    """Semua gerakan legal pemain yang sedang jalan, dalam tuple piksel."""
+    board = Bitboard.from_state(state)
+    positions = state.positions
+    return [(positions[from_index] if from_index is not None else None, positions[to_index])
+            for from_index, to_index in board.legal_moves()]
+
+
+def make_player(kind, state, depth, time_limit_ms, rng, playouts=DEFAULT_PLAYOUTS, search_workers=1):
+    if kind == "random":
+        return RandomPlayer(rng)
+    if kind == "mcts":
+        return MCTSAI(state, time_limit_ms, playouts, seed=rng.getrandbits(32))
+    ai = MacananAI(state, time_limit_ms, search_workers)
+    if depth is not None:
+        ai.MAX_DEPTH = depth
+    return ai
+
+
+def play_game(game_index, macan_type="ai", manusia_type="ai", depth=None, time_limit_ms=None,
+              max_turns=DEFAULT_MAX_TURNS, seed=0, playouts=DEFAULT_PLAYOUTS, record=False,
+              search_workers=1):
+    """Mainkan satu permainan penuh tanpa GUI.
+
+    Mengembalikan dict berisi pemenang ('Macan', 'Manusia', atau None untuk seri),
+    jumlah turn, catatan (pemain, latensi detik, node, kedalaman selesai) untuk setiap
+    gerakan AI, dan statistik transposition table para pemain AI. Untuk MCTSAI, node adalah
+    jumlah playout, kedalaman None, dan playouts menjadi anggarannya jika tidak ada batas
+    waktu. search_workers > 1 membagi gerakan akar MacananAI ke beberapa proses
+    (parallel_search) dalam batas waktu yang sama. Jika record True, "record"
+    berisi gerakan permainan dalam format game_record (satu byte per gerakan).
+    """
+    game_seed = seed + game_index
+    random.seed(game_seed)  # _get_strategic_placement memakai modul random
+    rng = random.Random(game_seed)
+    state = BoardState()
+    players = {
+        "Macan": make_player(macan_type, state, depth, time_limit_ms, rng, playouts, search_workers),
+        "Manusia": make_player(manusia_type, state, depth, time_limit_ms, rng, playouts, search_workers),
+    }
+    searches = []
+
+    while not state.game_over and state.turn_count < max_turns:
+        player = state.current_player
+        moves = legal_pixel_moves(state)
+        if not moves:
+            break  # Pemain tidak bisa bergerak dan belum ada pemenang: seri
+
+        if state.turn_count <= 3:
+            # Sama dengan GUI: penempatan awal dari buku pembukaan, selain itu acak
+            agent = players[player]
+            move = None
+            if isinstance(agent, MacananAI):
+                move = agent.get_book_move(player == "Macan", state)
+            if move is None:
+                move = rng.choice(moves)
+        else:
+            agent = players[player]
+            if isinstance(agent, MacananAI):
+                agent.nodes = 0
+                if depth is not None:
+                    agent.MAX_DEPTH = depth  # analyze_last_moves bisa mengubahnya
+            start = time.perf_counter()
+            move = agent.choose_move(player == "Macan", state)
+            elapsed = time.perf_counter() - start
+            if not isinstance(agent, RandomPlayer):
+                completed_depth = agent.completed_depth if isinstance(agent, MacananAI) else None
+                searches.append((player, elapsed, agent.nodes, completed_depth))
+
+        if move is None or not state.apply_move(move):
+            # Seperti percobaan ulang di GUI: pakai gerakan legal acak
+            state.apply_move(rng.choice(moves))
+
+    table = {"hits": 0, "misses": 0, "overwrites": 0}
+    for agent in players.values():
+        if isinstance(agent, MacananAI):
+            stats = agent.table_stats()
+            for key in table:
+                table[key] += stats[key]
+            agent.close()
+
+    return {
+        "game": game_index,
+        "winner": state.winner if state.game_over else None,
+        "turns": state.turn_count,
+        "searches": searches,
+        "table": table,
+        "record": encode_moves(state.history, state.topology) if record else None,
+    }
+
+
+def percentile(sorted_values, fraction):
+    """Persentil nearest-rank dari list yang sudah terurut."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(results):
+    """Ringkas hasil beberapa permainan menjadi statistik turnamen."""
+    games = len(results)
+    wins = {"Macan": 0, "Manusia": 0, None: 0}
+    for result in results:
+        wins[result["winner"]] += 1
+
+    latencies = {}
+    nodes = 0
+    search_time = 0.0
+    depths = []
+    for result in results:
+        for player, elapsed, count, completed_depth in result["searches"]:
+            latencies.setdefault(player, []).append(elapsed)
+            nodes += count
+            search_time += elapsed
+            if completed_depth is not None:
+                depths.append(completed_depth)
+
+    hits = sum(result["table"]["hits"] for result in results)
+    probes = hits + sum(result["table"]["misses"] for result in results)
+
+    summary = {
+        "games": games,
+        "macan_win_rate": wins["Macan"] / games if games else 0.0,
+        "manusia_win_rate": wins["Manusia"] / games if games else 0.0,
+        "draw_rate": wins[None] / games if games else 0.0,
+        "average_turns": sum(result["turns"] for result in results) / games if games else 0.0,
+        "nodes": nodes,
+        "nodes_per_second": nodes / search_time if search_time else 0.0,
+        "average_depth": sum(depths) / len(depths) if depths else 0.0,
+        "table_hit_rate": hits / probes if probes else 0.0,
+        "table_overwrites": sum(result["table"]["overwrites"] for result in results),
+        "latency_ms": {},
+    }
+    all_latencies = []
+    for player in ("Macan", "Manusia"):
+        values = sorted(latencies.get(player, []))
+        all_latencies.extend(values)
+        if values:
+            summary["latency_ms"][player] = _latency_stats(values)
+    if all_latencies:
+        summary["latency_ms"]["all"] = _latency_stats(sorted(all_latencies))
+    return summary
+
+
+def _latency_stats(sorted_values):
+    return {
+        "moves": len(sorted_values),
+        "p50": percentile(sorted_values, 0.50) * 1000,
+        "p90": percentile(sorted_values, 0.90) * 1000,
+        "p99": percentile(sorted_values, 0.99) * 1000,
+        "max": sorted_values[-1] * 1000,
+    }
+
+
+def run_tournament(games, workers=1, record_path=None, **options):
+    """Mainkan sejumlah permainan, opsional paralel di beberapa proses.
+
+    Jika record_path diberikan, setiap permainan ditambahkan ke file rekaman itu
+    begitu selesai (lihat game_record).
+    """
+    writer = None
+    if record_path is not None:
+        writer = GameRecordWriter(record_path)
+        options["record"] = True
+    try:
+        if workers <= 1:
+            results = (play_game(i, **options) for i in range(games))
+            return [_record_result(writer, result) for result in results]
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = [executor.submit(play_game, i, **options) for i in range(games)]
+            return [_record_result(writer, future.result()) for future in futures]
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _record_result(writer, result):
+    if writer is not None:
+        writer.write_encoded(result["record"], result["winner"])
+    return result
+
+
+def print_summary(summary, elapsed):
+    print(f"Permainan      : {summary['games']} ({elapsed:.1f} detik)")
+    print(f"Macan menang   : {summary['macan_win_rate']:.1%}")
+    print(f"Manusia menang : {summary['manusia_win_rate']:.1%}")
+    print(f"Seri           : {summary['draw_rate']:.1%}")
+    print(f"Rata-rata turn : {summary['average_turns']:.1f}")
+    print(f"Node/detik     : {summary['nodes_per_second']:.0f} ({summary['nodes']} node)")
+    print(f"Kedalaman      : {summary['average_depth']:.2f} rata-rata iterasi selesai")
+    print(f"Hit TT         : {summary['table_hit_rate']:.1%} ({summary['table_overwrites']} entri ditimpa)")
+    for player, stats in summary["latency_ms"].items():
+        print(f"Latensi {player:<7}: p50 {stats['p50']:.1f} ms, p90 {stats['p90']:.1f} ms, "
+              f"p99 {stats['p99']:.1f} ms, max {stats['max']:.1f} ms ({stats['moves']} gerakan)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Self-play macanan dan benchmark MacananAI.")
+    parser.add_argument("--games", type=int, default=10, help="jumlah permainan")
+    parser.add_argument("--depth", type=int, default=None,
+                        help="kedalaman tetap (tanpa --time-ms) atau MAX_DEPTH awal")
+    parser.add_argument("--time-ms", type=int, default=None, help="batas waktu per gerakan AI")
+    parser.add_argument("--macan", choices=PLAYER_TYPES, default="ai", help="pemain macan")
+    parser.add_argument("--manusia", choices=PLAYER_TYPES, default="ai", help="pemain manusia")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS,
+                        help="batas turn sebelum permainan dihitung seri")
+    parser.add_argument("--workers", type=int, default=1, help="jumlah proses untuk permainan")
+    parser.add_argument("--search-workers", type=int, default=1,
+                        help="jumlah proses per pencarian MacananAI (bagi gerakan akar)")
+    parser.add_argument("--seed", type=int, default=0, help="seed acak permainan pertama")
+    parser.add_argument("--playouts", type=int, default=DEFAULT_PLAYOUTS,
+                        help="playout per gerakan MCTS jika tanpa --time-ms")
+    parser.add_argument("--record", default=None, help="tambahkan rekaman permainan ke file ini")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_tournament(
+        args.games, args.workers, args.record,
+        macan_type=args.macan, manusia_type=args.manusia, depth=args.depth,
+        time_limit_ms=args.time_ms, max_turns=args.max_turns, seed=args.seed, playouts=args.playouts,
+        search_workers=args.search_workers,
+    )
+    print_summary(summarize(results), time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
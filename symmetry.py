@@ -0,0 +1,165 @@
+MASK64 = (1 << 64) - 1
+MIRROR_TOLERANCE = 1  # Toleransi piksel saat mencocokkan node hasil cermin
+
+
+class BoardSymmetry:
+    """Simetri cermin papan (kiri-kanan, atas-bawah, keduanya) sebagai permutasi indeks node.
+
+    Simetri dicari dari koordinat piksel topologi terhadap titik tengah papan dan hanya
+    diterima jika ketetanggaan dan lompatan makan ikut terpetakan, sehingga posisi yang
+    saling cermin punya nilai permainan yang sama. Indeks 0 selalu identitas.
+    """
+
+    MIRRORS = ((False, False), (True, False), (False, True), (True, True))  # (cermin x, cermin y)
+
+    def __init__(self, topology):
+        self.topology = topology
+        xs = [x for x, _ in topology.positions]
+        ys = [y for _, y in topology.positions]
+        center_x = (min(xs) + max(xs)) / 2
+        center_y = (min(ys) + max(ys)) / 2
+
+        # permutations[s][i] -> node hasil simetri s dari node i
+        self.permutations = []
+        for flip_x, flip_y in self.MIRRORS:
+            permutation = self._mirror(center_x, center_y, flip_x, flip_y)
+            if permutation is not None and self._preserves_moves(permutation):
+                self.permutations.append(permutation)
+        self.count = len(self.permutations)
+        self.inverse = [self.permutations.index(self._invert(p)) for p in self.permutations]
+        # bits[s][i] -> bit node hasil simetri s dari node i
+        self.bits = [tuple(1 << j for j in permutation) for permutation in self.permutations]
+
+    def _mirror(self, center_x, center_y, flip_x, flip_y):
+        index_of = {}
+        for i, (x, y) in enumerate(self.topology.positions):
+            index_of[(round(x), round(y))] = i
+        permutation = []
+        for x, y in self.topology.positions:
+            target = (round(2 * center_x - x if flip_x else x), round(2 * center_y - y if flip_y else y))
+            match = index_of.get(target)
+            if match is None:
+                match = next((j for (px, py), j in index_of.items()
+                              if abs(px - target[0]) <= MIRROR_TOLERANCE
+                              and abs(py - target[1]) <= MIRROR_TOLERANCE), None)
+            if match is None:
+                return None
+            permutation.append(match)
+        return tuple(permutation)
+
+    def _preserves_moves(self, permutation):
+        topology = self.topology
+        for i in range(topology.size):
+            if {permutation[j] for j in topology.neighbors[i]} != set(topology.neighbors[permutation[i]]):
+                return False
+        jump_over = topology.jump_over
+        return all(jump_over.get((permutation[start], permutation[landing])) == permutation[over]
+                   for (start, landing), over in jump_over.items())
+
+    @staticmethod
+    def _invert(permutation):
+        inverse = [0] * len(permutation)
+        for i, j in enumerate(permutation):
+            inverse[j] = i
+        return tuple(inverse)
+
+    def transform_mask(self, mask, symmetry):
+        bits = self.bits[symmetry]
+        result = 0
+        while mask:
+            low = mask & -mask
+            result |= bits[low.bit_length() - 1]
+            mask ^= low
+        return result
+
+    def transform_move(self, move, symmetry):
+        """Gerakan (from, to) dalam indeks setelah simetri diterapkan; None tetap None."""
+        if move is None:
+            return None
+        from_index, to_index = move
+        permutation = self.permutations[symmetry]
+        return (None if from_index is None else permutation[from_index], permutation[to_index])
+
+    def is_invariant(self, values):
+        """Apakah nilai per node sama untuk setiap node dan cerminnya."""
+        return all(values[permutation[i]] == values[i]
+                   for permutation in self.permutations for i in range(len(values)))
+
+    def preserves_pairs(self, pairs):
+        """Apakah himpunan pasangan node (a, b) tetap sama setelah setiap simetri."""
+        pairs = set(pairs)
+        return all({(permutation[a], permutation[b]) for a, b in pairs} == pairs
+                   for permutation in self.permutations)
+
+    def canonical(self, macan, manusia):
+        """Wakil minimal (macan, manusia) di antara semua cerminnya, beserta indeks simetrinya."""
+        best = (macan, manusia)
+        best_symmetry = 0
+        for symmetry in range(1, self.count):
+            candidate = (self.transform_mask(macan, symmetry), self.transform_mask(manusia, symmetry))
+            if candidate < best:
+                best = candidate
+                best_symmetry = symmetry
+        return best[0], best[1], best_symmetry
+
+
+class MirrorKeys:
+    """Kunci Zobrist yang sudah dicerminkan, dikemas per 64 bit dalam satu int.
+
+    Lajur ke-(s - 1) dari macan[i] adalah kunci node permutations[s][i], sehingga satu XOR
+    memperbarui hash semua cermin sekaligus; giliran dan penghitung penempatan tidak
+    berubah oleh simetri sehingga kuncinya diulang di setiap lajur.
+    """
+
+    def __init__(self, keys, symmetry):
+        lanes = symmetry.permutations[1:]
+        self.lanes = len(lanes)
+        self.macan = [self._pack(keys.macan[p[i]] for p in lanes) for i in range(symmetry.topology.size)]
+        self.manusia = [self._pack(keys.manusia[p[i]] for p in lanes) for i in range(symmetry.topology.size)]
+        self.side = self._pack(keys.side for _ in lanes)
+        self.placement = [self._pack(key for _ in lanes) for key in keys.placement]
+
+    @staticmethod
+    def _pack(values):
+        packed = 0
+        for lane, value in enumerate(values):
+            packed |= value << (64 * lane)
+        return packed
+
+    def placement_key(self, max_manusia):
+        return self.placement[min(max_manusia, len(self.placement) - 1)]
+
+    def hash_position(self, macan_indices, manusia_indices, side, max_manusia):
+        h = self.placement_key(max_manusia)
+        for i in macan_indices:
+            h ^= self.macan[i]
+        for i in manusia_indices:
+            h ^= self.manusia[i]
+        if side:
+            h ^= self.side
+        return h
+
+
+_symmetry_cache = {}
+
+
+def get_board_symmetry(topology):
+    """BoardSymmetry untuk topologi ini (dihitung sekali)."""
+    symmetry = _symmetry_cache.get(topology)
+    if symmetry is None:
+        symmetry = BoardSymmetry(topology)
+        _symmetry_cache[topology] = symmetry
+    return symmetry
+
+
+_mirror_keys_cache = {}
+
+
+def get_mirror_keys(keys, topology):
+    """MirrorKeys untuk kunci Zobrist dan topologi ini (dibuat sekali)."""
+    cache_key = (id(keys), topology)
+    mirror_keys = _mirror_keys_cache.get(cache_key)
+    if mirror_keys is None:
+        mirror_keys = MirrorKeys(keys, get_board_symmetry(topology))
+        _mirror_keys_cache[cache_key] = mirror_keys
+    return mirror_keys
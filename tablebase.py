@@ -0,0 +1,478 @@
+"""Tablebase endgame (2 macan, sedikit manusia) hasil analisis retrograde.
+
+Setiap posisi fase pergerakan dengan 2 macan dan k pion manusia mendapat satu byte:
+0 = belum pasti (seri/berputar), 1 + d = pihak yang jalan menang dalam d ply,
+128 + d = pihak yang jalan kalah dalam d ply. Posisi diberi indeks kombinatorial
+(sisi, peringkat pasangan macan, peringkat kombinasi manusia di node sisa), sehingga
+file hanya berisi array byte yang di-mmap saat probing.
+
+Posisi yang saling cermin (BoardSymmetry) berbagi satu entri: hanya pasangan macan
+kanonik yang diberi peringkat, dan untuk pasangan yang simetris terhadap dirinya
+sendiri pion manusia ikut dikanonikkan.
+
+Ukuran: 2 x 346 x C(35, k) byte (entri) -> k=4: ~36 juta (~36 MB), k=5: ~225 juta,
+k=6: ~1,1 miliar; tanpa reduksi simetri (2 x C(37, 2) x C(35, k)) kira-kira dua kali
+lipat. Tabel k dibangun dari tabel k-1 (makan -> k-1).
+
+Builder memakai 2 byte per entri selama analisis (k=4: ~72 MB, k=5: ~450 MB), jadi
+yang didukung hanya k <= MAX_MANUSIA (5); k=6 butuh ~2,2 GB dan ditolak CLI. Builder
+ini Python murni: k=4 butuh lebih dari satu jam di satu core, k=5 berkali lipat
+lebih lama. Tidak ada tabel yang ikut di repo; tanpa file tabel, probing selalu
+None dan MacananAI memakai pencarian biasa.
+
+    python tablebase.py --manusia 4
+    python tablebase.py --manusia 5 --max-memory-mb 512
+"""
+import argparse
+import itertools
+import mmap
+import os
+import struct
+import sys
+import time
+
+from bitboard import MACAN, MANUSIA, iter_bits, popcount
+from symmetry import get_board_symmetry
+
+MAGIC = b"MCNTB002"
+HEADER = struct.Struct("<8sBBHB")  # magic, jumlah manusia, jumlah macan, ukuran papan, jumlah simetri
+MACAN_COUNT = 2
+MACAN_WIN_LIMIT = 3  # Manusia <= 3 berarti macan menang (check_win_condition)
+UNKNOWN = 0
+WIN_BASE = 1
+LOSS_BASE = 128
+MAX_DISTANCE = 126
+MIN_MANUSIA = MACAN_WIN_LIMIT + 1
+MAX_MANUSIA = 5  # Batas yang didukung builder (memori dan waktu, lihat docstring modul)
+BUILD_ENTRY_BYTES = 2  # Memori builder per entri (lihat build_tablebase)
+DEFAULT_MAX_MEMORY_MB = 1024
+# Entri builder (uint16): bit RESOLVED menandai hasil pasti di byte rendah; selain itu
+# byte rendah = gerakan yang belum terbukti kalah, byte tinggi = jarak kalah terpanjang
+RESOLVED = 0x8000
+COMPACT_CHUNK = 1 << 20
+DEFAULT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+def tablebase_path(manusia_count, directory=DEFAULT_DIRECTORY):
+    return os.path.join(directory, f"tablebase_{manusia_count}.bin")
+
+
+def encode_result(is_win, distance):
+    distance = min(distance, MAX_DISTANCE)
+    return (WIN_BASE if is_win else LOSS_BASE) + distance
+
+
+def decode_result(value):
+    """(menang?, jarak) untuk pihak yang jalan, atau None jika belum pasti."""
+    if value == UNKNOWN:
+        return None
+    if value >= LOSS_BASE:
+        return False, value - LOSS_BASE
+    return True, value - WIN_BASE
+
+
+class PositionIndexer:
+    """Peringkat kombinatorial (colex) posisi 2 macan + k manusia pada papan berukuran size.
+
+    Dengan symmetry (BoardSymmetry), setiap posisi dipetakan dulu ke wakil cerminnya:
+    pasangan macan ke pasangan kanonik, lalu manusia ikut simetri yang sama.
+    """
+
+    def __init__(self, size, manusia_count, symmetry=None):
+        self.size = size
+        self.manusia_count = manusia_count
+        self.symmetry = symmetry
+        self.binomial = [[0] * (manusia_count + 2) for _ in range(size + 1)]
+        for n in range(size + 1):
+            self.binomial[n][0] = 1
+            for r in range(1, manusia_count + 2):
+                self.binomial[n][r] = self.binomial[n - 1][r - 1] + self.binomial[n - 1][r] if n else 0
+        all_masks = [(1 << a) | (1 << b) for a, b in itertools.combinations(range(size), MACAN_COUNT)]
+        symmetries = range(1, symmetry.count) if symmetry is not None else ()
+        self.macan_masks = [mask for mask in all_masks
+                            if all(mask <= symmetry.transform_mask(mask, s) for s in symmetries)]
+        rank_of = {mask: rank for rank, mask in enumerate(self.macan_masks)}
+        # macan_rank[mask] -> (peringkat pasangan kanonik, simetri yang memetakan mask ke sana)
+        self.macan_rank = {}
+        for mask in all_masks:
+            for s in (0, *symmetries):
+                image = symmetry.transform_mask(mask, s) if s else mask
+                if image in rank_of:
+                    self.macan_rank[mask] = (rank_of[image], s)
+                    break
+        # stabilizers[rank] -> simetri (selain identitas) yang tidak mengubah pasangan macan
+        self.stabilizers = [tuple(s for s in symmetries if symmetry.transform_mask(mask, s) == mask)
+                            for mask in self.macan_masks]
+        self.combinations = self.binomial[size - MACAN_COUNT][manusia_count]
+        self.per_side = len(self.macan_masks) * self.combinations
+        self.total = 2 * self.per_side
+        # compressed[rank][node] -> indeks node di antara node yang bukan macan
+        self.compressed = []
+        self.expanded = []
+        for mask in self.macan_masks:
+            free = [node for node in range(size) if not mask & (1 << node)]
+            table = [-1] * size
+            for i, node in enumerate(free):
+                table[node] = i
+            self.compressed.append(table)
+            self.expanded.append(free)
+
+    def canonical_manusia(self, macan_rank, manusia):
+        """Wakil minimal manusia di antara cerminnya yang mempertahankan pasangan macan."""
+        stabilizers = self.stabilizers[macan_rank]
+        if not stabilizers:
+            return manusia
+        return min(manusia, *(self.symmetry.transform_mask(manusia, s) for s in stabilizers))
+
+    def index(self, side, macan, manusia):
+        macan_rank, symmetry = self.macan_rank[macan]
+        if symmetry:
+            manusia = self.symmetry.transform_mask(manusia, symmetry)
+        if self.stabilizers[macan_rank]:
+            manusia = self.canonical_manusia(macan_rank, manusia)
+        compressed = self.compressed[macan_rank]
+        binomial = self.binomial
+        rank = 0
+        for i, node in enumerate(iter_bits(manusia)):
+            rank += binomial[compressed[node]][i + 1]
+        return (side * len(self.macan_masks) + macan_rank) * self.combinations + rank
+
+    def position(self, index):
+        """Kebalikan index: (side, mask macan, mask manusia)."""
+        side, rest = divmod(index, self.per_side)
+        macan_rank, rank = divmod(rest, self.combinations)
+        free = self.expanded[macan_rank]
+        binomial = self.binomial
+        manusia = 0
+        c = len(free)
+        for i in range(self.manusia_count, 0, -1):
+            c -= 1
+            while binomial[c][i] > rank:
+                c -= 1
+            rank -= binomial[c][i]
+            manusia |= 1 << free[c]
+        return side, self.macan_masks[macan_rank], manusia
+
+
+class MoveRules:
+    """Aturan gerak fase pergerakan pada mask (macan, manusia), sama dengan Bitboard."""
+
+    def __init__(self, topology):
+        self.topology = topology
+        self.full_mask = topology.full_mask
+        self.neighbors = topology.neighbors
+        self.neighbor_masks = topology.neighbor_masks
+        self.jump_bits = topology.jump_bits
+        self.jump_over = topology.jump_over
+
+    def macan_trapped(self, macan, manusia):
+        empty = self.full_mask & ~(macan | manusia)
+        for index in iter_bits(macan):
+            if self.neighbor_masks[index] & empty:
+                return False
+            for _, _, over_bit, landing_bit in self.jump_bits[index]:
+                if manusia & over_bit and empty & landing_bit:
+                    return False
+        return True
+
+    def macan_steps(self, macan, manusia):
+        """Langkah macan tanpa makan sebagai list (from, to)."""
+        empty = self.full_mask & ~(macan | manusia)
+        jump_over = self.jump_over
+        steps = []
+        for index in iter_bits(macan):
+            for target in iter_bits(self.neighbor_masks[index] & empty):
+                over = jump_over.get((index, target))
+                if over is None or not manusia & (1 << over):
+                    steps.append((index, target))
+        return steps
+
+    def macan_captures(self, macan, manusia):
+        """Lompatan makan macan sebagai list (from, landing, over)."""
+        empty = self.full_mask & ~(macan | manusia)
+        jump_over = self.jump_over
+        captures = []
+        for index in iter_bits(macan):
+            for over, landing, over_bit, landing_bit in self.jump_bits[index]:
+                if manusia & over_bit and empty & landing_bit and jump_over.get((index, landing)) == over:
+                    captures.append((index, landing, over))
+        return captures
+
+    def manusia_steps(self, macan, manusia):
+        empty = self.full_mask & ~(macan | manusia)
+        return [(index, target) for index in iter_bits(manusia)
+                for target in iter_bits(self.neighbor_masks[index] & empty)]
+
+    def predecessors(self, side, macan, manusia):
+        """Posisi (mask macan, mask manusia) yang mencapai posisi ini lewat satu gerakan tanpa makan.
+
+        side adalah pihak yang jalan di posisi ini; gerakan terakhir dilakukan lawannya.
+        """
+        empty = self.full_mask & ~(macan | manusia)
+        result = []
+        if side == MACAN:  # Manusia baru saja melangkah dari origin ke index
+            for index in iter_bits(manusia):
+                for origin in iter_bits(self.neighbor_masks[index] & empty):
+                    if index in self.neighbors[origin]:
+                        result.append((macan, manusia ^ (1 << index) ^ (1 << origin)))
+        else:  # Macan baru saja melangkah (tanpa makan) dari origin ke index
+            jump_over = self.jump_over
+            for index in iter_bits(macan):
+                for origin in iter_bits(self.neighbor_masks[index] & empty):
+                    if index not in self.neighbors[origin]:
+                        continue
+                    over = jump_over.get((origin, index))
+                    if over is not None and manusia & (1 << over):
+                        continue  # Dari origin gerakan ini adalah makan, bukan langkah
+                    result.append((macan ^ (1 << index) ^ (1 << origin), manusia))
+        return result
+
+
+class Tablebase:
+    """Pembaca tablebase satu jumlah manusia (file di-mmap)."""
+
+    def __init__(self, path, topology):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Tablebase kosong: {path}")
+        magic, manusia_count, macan_count, size, symmetries = HEADER.unpack_from(self._data, 0)
+        symmetry = get_board_symmetry(topology)
+        self.indexer = PositionIndexer(topology.size, manusia_count, symmetry)
+        if (magic != MAGIC or macan_count != MACAN_COUNT or size != topology.size
+                or symmetries != symmetry.count or len(self._data) != HEADER.size + self.indexer.total):
+            self.close()
+            raise ValueError(f"Format tablebase tidak dikenal: {path}")
+        self.manusia_count = manusia_count
+
+    def probe(self, side, macan, manusia):
+        """(menang?, jarak) untuk pihak yang jalan, atau None jika belum pasti."""
+        return decode_result(self._data[HEADER.size + self.indexer.index(side, macan, manusia)])
+
+    def close(self):
+        self._data.close()
+        self._file.close()
+
+
+class TablebaseSet:
+    """Kumpulan tablebase yang tersedia, dipakai MacananAI di akar dan di pencarian."""
+
+    def __init__(self, topology, directory=DEFAULT_DIRECTORY, counts=range(MACAN_WIN_LIMIT + 1, 9)):
+        self.tables = {}
+        for count in counts:
+            path = tablebase_path(count, directory)
+            if os.path.exists(path):
+                try:
+                    self.tables[count] = Tablebase(path, topology)
+                except (OSError, ValueError):
+                    pass
+
+    def __bool__(self):
+        return bool(self.tables)
+
+    def probe(self, board):
+        """Hasil pasti posisi bitboard untuk pihak yang jalan, atau None."""
+        if not board.reached_max_manusia or popcount(board.macan) != MACAN_COUNT:
+            return None
+        table = self.tables.get(popcount(board.manusia))
+        if table is None:
+            return None
+        return table.probe(board.side, board.macan, board.manusia)
+
+
+_tablebase_cache = {}
+
+
+def get_tablebases(topology, directory=DEFAULT_DIRECTORY):
+    """TablebaseSet untuk topologi ini (dibuka sekali per proses)."""
+    key = (topology, directory)
+    if key not in _tablebase_cache:
+        _tablebase_cache[key] = TablebaseSet(topology, directory)
+    return _tablebase_cache[key]
+
+
+def build_memory(topology, manusia_count):
+    """Perkiraan memori (byte) build_tablebase untuk manusia_count pion manusia."""
+    indexer = PositionIndexer(topology.size, manusia_count, get_board_symmetry(topology))
+    return indexer.total * BUILD_ENTRY_BYTES
+
+
+def build_tablebase(topology, manusia_count, lower=None, log=None):
+    """Analisis retrograde untuk 2 macan dan manusia_count pion manusia.
+
+    lower adalah Tablebase untuk manusia_count - 1 (tidak perlu jika manusia_count - 1 <= 3,
+    karena makan langsung berarti macan menang). Mengembalikan bytearray hasil.
+
+    Hanya wakil kanonik yang dianalisis. Penghitung gerakan tersisa menghitung kelas
+    posisi anak yang berbeda, dan setiap kelas induk dikurangi sekali per kelas anak,
+    sehingga dua gerakan ke posisi yang saling cermin tidak terhitung dua kali.
+
+    Hasil, penghitung gerakan dan jarak kalah terpanjang disimpan dalam satu entri
+    uint16 per posisi (lihat RESOLVED), lalu dipadatkan di tempat menjadi satu byte.
+    """
+    symmetry = get_board_symmetry(topology)
+    indexer = PositionIndexer(topology.size, manusia_count, symmetry)
+    rules = MoveRules(topology)
+    total = indexer.total
+    data = bytearray(total * BUILD_ENTRY_BYTES)
+    entries = memoryview(data).cast("H")
+
+    def child_result(macan, manusia):
+        """Hasil setelah makan bagi manusia yang jalan berikutnya, atau None jika belum pasti."""
+        if manusia_count - 1 <= MACAN_WIN_LIMIT:
+            return False, 0  # Macan langsung menang
+        return lower.probe(MANUSIA, macan, manusia)
+
+    def step_count(side, macan, manusia):
+        """Jumlah kelas posisi anak dari gerakan tanpa makan."""
+        if side == MANUSIA:
+            children = [(macan, manusia ^ (1 << f) ^ (1 << t)) for f, t in rules.manusia_steps(macan, manusia)]
+        else:
+            children = [(macan ^ (1 << f) ^ (1 << t), manusia) for f, t in rules.macan_steps(macan, manusia)]
+        if symmetry.count < 2:
+            return len(children)
+        child_side = MANUSIA if side == MACAN else MACAN
+        return len({indexer.index(child_side, m, h) for m, h in children})
+
+    # Tahap 1: posisi terminal, jumlah gerakan, dan hasil makan ke tabel lebih rendah
+    start = time.perf_counter()
+    free_nodes = range(topology.size)
+    for macan_rank, macan in enumerate(indexer.macan_masks):
+        free = [node for node in free_nodes if not macan & (1 << node)]
+        symmetric_macan = bool(indexer.stabilizers[macan_rank])
+        for nodes in itertools.combinations(free, manusia_count):
+            manusia = 0
+            for node in nodes:
+                manusia |= 1 << node
+            if symmetric_macan and indexer.canonical_manusia(macan_rank, manusia) != manusia:
+                continue  # Cermin dari posisi yang sudah (atau akan) dianalisis
+            trapped = rules.macan_trapped(macan, manusia)
+            for side in (MACAN, MANUSIA):
+                index = indexer.index(side, macan, manusia)
+                if trapped:
+                    # Macan terkunci: manusia menang (kalah bagi macan yang jalan)
+                    entries[index] = RESOLVED | encode_result(side == MANUSIA, 0)
+                    continue
+                count = step_count(side, macan, manusia)
+                longest = 0  # Jarak kalah terpanjang dari gerakan yang sudah terbukti kalah
+                if side == MACAN:
+                    best_win = None
+                    for from_index, landing, over in rules.macan_captures(macan, manusia):
+                        result = child_result(macan ^ (1 << from_index) ^ (1 << landing), manusia ^ (1 << over))
+                        if result is None:
+                            count += 1  # Seri di tabel bawah: tidak pernah terbukti kalah
+                        elif not result[0]:
+                            if best_win is None or result[1] + 1 < best_win:
+                                best_win = result[1] + 1
+                        else:
+                            # Makan yang kalah: jarak kalah induk minimal jarak anak + 1
+                            longest = max(longest, min(result[1] + 1, MAX_DISTANCE + 1))
+                    if best_win is not None:
+                        entries[index] = RESOLVED | encode_result(True, best_win)
+                        continue
+                if count == 0:
+                    # Tidak ada gerakan, atau semua gerakan makan kalah: pihak yang jalan kalah
+                    entries[index] = RESOLVED | encode_result(False, longest)
+                else:
+                    entries[index] = (longest << 8) | min(count, 255)
+    if log is not None:
+        log(f"Tahap awal selesai dalam {time.perf_counter() - start:.0f} detik")
+
+    # Tahap 2: propagasi mundur per jarak. Entri pasti dicari langsung di buffer sebagai
+    # dua byte (urutan byte native); kecocokan di offset ganjil melintasi dua entri
+    for distance in range(MAX_DISTANCE + 1):
+        found = 0
+        for is_win in (False, True):
+            needle = struct.pack("=H", RESOLVED | encode_result(is_win, distance))
+            position = data.find(needle)
+            while position != -1:
+                if position & 1:
+                    position = data.find(needle, position + 1)
+                    continue
+                found += 1
+                side, macan, manusia = indexer.position(position >> 1)
+                parent_side = MANUSIA if side == MACAN else MACAN
+                parents = {indexer.index(parent_side, parent_macan, parent_manusia)
+                           for parent_macan, parent_manusia in rules.predecessors(side, macan, manusia)}
+                for parent in parents:
+                    current = entries[parent]
+                    if not is_win:
+                        # Anak kalah bagi lawan -> induk menang di distance + 1
+                        win = RESOLVED | encode_result(True, distance + 1)
+                        if not current & RESOLVED or (current & 0xFF < LOSS_BASE and current > win):
+                            entries[parent] = win
+                    elif not current & RESOLVED:
+                        # Anak menang bagi lawan -> satu gerakan induk lagi terbukti kalah
+                        longest = max(current >> 8, distance + 1)
+                        remaining = (current & 0xFF) - 1
+                        if remaining == 0:
+                            entries[parent] = RESOLVED | encode_result(False, longest)
+                        else:
+                            entries[parent] = (longest << 8) | remaining
+                position = data.find(needle, position + 1)
+        if log is not None and found:
+            log(f"Jarak {distance}: {found} posisi")
+
+    entries.release()
+    return _compact(data, total)
+
+
+def _compact(data, total):
+    """Padatkan entri uint16 builder di tempat menjadi satu byte hasil per posisi.
+
+    Entri yang belum pasti (seri/berputar) menjadi UNKNOWN.
+    """
+    resolved = bytes(0xFF if value & (RESOLVED >> 8) else 0 for value in range(256))
+    low = 0 if sys.byteorder == "little" else 1
+    for start in range(0, total, COMPACT_CHUNK):
+        chunk = data[2 * start:2 * min(start + COMPACT_CHUNK, total)]
+        values = (int.from_bytes(chunk[low::2], "little")
+                  & int.from_bytes(chunk[1 - low::2].translate(resolved), "little"))
+        data[start:start + len(chunk) // 2] = values.to_bytes(len(chunk) // 2, "little")
+    del data[total:]
+    return data
+
+
+def write_tablebase(path, manusia_count, topology, status):
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, manusia_count, MACAN_COUNT, topology.size, get_board_symmetry(topology).count))
+        f.write(status)
+
+
+def main(argv=None):
+    from board_state import BoardState
+    from board_topology import get_topology
+
+    parser = argparse.ArgumentParser(description="Bangun tablebase endgame macanan (2 macan).")
+    parser.add_argument("--manusia", type=int, choices=range(MIN_MANUSIA, MAX_MANUSIA + 1), default=MIN_MANUSIA,
+                        help="jumlah pion manusia; tabel k butuh tabel k-1 (kecuali k=4)")
+    parser.add_argument("--directory", default=DEFAULT_DIRECTORY, help="folder file tablebase")
+    parser.add_argument("--max-memory-mb", type=int, default=DEFAULT_MAX_MEMORY_MB,
+                        help="tolak build jika perkiraan memori builder melebihi batas ini")
+    args = parser.parse_args(argv)
+
+    topology = get_topology(BoardState().positions)
+    memory_mb = build_memory(topology, args.manusia) / (1 << 20)
+    if memory_mb > args.max_memory_mb:
+        parser.error(f"tablebase {args.manusia} manusia butuh ~{memory_mb:.0f} MB, "
+                     f"melebihi --max-memory-mb {args.max_memory_mb}")
+    lower = None
+    if args.manusia - 1 > MACAN_WIN_LIMIT:
+        lower_path = tablebase_path(args.manusia - 1, args.directory)
+        try:
+            lower = Tablebase(lower_path, topology)
+        except (OSError, ValueError) as e:
+            parser.error(f"tablebase {args.manusia - 1} manusia dibutuhkan lebih dulu: {e}")
+    print(f"Membangun tablebase {args.manusia} manusia (~{memory_mb:.0f} MB memori)")
+    status = build_tablebase(topology, args.manusia, lower, log=print)
+    path = tablebase_path(args.manusia, args.directory)
+    write_tablebase(path, args.manusia, topology, status)
+    decided = len(status) - status.count(UNKNOWN)
+    print(f"{len(status)} posisi ({decided} pasti) ditulis ke {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import random
+
+ZOBRIST_SEED = 0x4D4143414E  # "MACAN"; tetap agar hash sama di setiap proses
+MAX_PLACEMENT_COUNT = 8
+
+
+class ZobristKeys:
+    """Kunci acak 64-bit untuk hashing Zobrist posisi macanan.
+
+    Dibangkitkan dari seed tetap (bukan hash() bawaan Python), sehingga hash
+    posisi stabil antar proses dan bisa dipakai untuk data yang disimpan ke disk.
+    """
+
+    def __init__(self, size, seed=ZOBRIST_SEED):
+        rng = random.Random(seed)
+        self.macan = [rng.getrandbits(64) for _ in range(size)]
+        self.manusia = [rng.getrandbits(64) for _ in range(size)]
+        self.side = rng.getrandbits(64)  # Di-XOR saat giliran manusia
+        # Penghitung penempatan manusia (jumlah maksimal yang pernah ada, 0-8)
+        self.placement = [rng.getrandbits(64) for _ in range(MAX_PLACEMENT_COUNT + 1)]
+        # Kunci tambahan untuk konteks pencarian (sudut pandang & fase evaluasi)
+        self.perspective = rng.getrandbits(64)
+        self.phase = {phase: rng.getrandbits(64) for phase in ("early", "mid", "late")}
+
+    def placement_key(self, max_manusia):
+        return self.placement[min(max_manusia, MAX_PLACEMENT_COUNT)]
+
+    def hash_position(self, macan_indices, manusia_indices, side, max_manusia):
+        """Hitung hash dari nol (untuk inisialisasi; selanjutnya diperbarui inkremental)."""
+        h = self.placement_key(max_manusia)
+        for i in macan_indices:
+            h ^= self.macan[i]
+        for i in manusia_indices:
+            h ^= self.manusia[i]
+        if side:
+            h ^= self.side
+        return h
+
+
+_keys_cache = {}
+
+
+def get_zobrist_keys(size):
+    """Kunci Zobrist untuk papan dengan size node (dibuat sekali)."""
+    keys = _keys_cache.get(size)
+    if keys is None:
+        keys = ZobristKeys(size)
+        _keys_cache[size] = keys
+    return keys